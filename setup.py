@@ -1,7 +1,26 @@
 """Setup script for backward compatibility"""
 
+import sys
+
 from setuptools import setup
 
 # All configuration is in pyproject.toml
-# This file is kept for backward compatibility with older tools
-setup()
+# This file is kept for backward compatibility with older tools, and to build
+# the optional ahead-of-time compiled kernels when Numba is available
+
+
+def _aot_extensions():
+    """Return the numba.pycc extension for the numeric kernels, if it can be built"""
+    sys.path.insert(0, "src")
+    try:
+        from hydraulics.core._equations_aot import cc
+    except Exception:
+        # Numba (or numba.pycc) not available at build time - the JIT/pure
+        # Python kernels are used at runtime instead
+        return []
+    finally:
+        sys.path.pop(0)
+    return [cc.distutils_extension()]
+
+
+setup(ext_modules=_aot_extensions())
@@ -9,73 +9,51 @@ __version__ = "2.0.0"
 __author__ = "Hydraulics Contributors"
 __license__ = "MIT"
 
-# Core functionality
-from hydraulics.core import (
-    calculate_reynolds,
-    calculate_velocity,
-    solve_colebrook_white,
-    calculate_darcy_weisbach,
-    calculate_laminar_friction_factor,
-    check_flow_regime,
-    calculate_christiansen_coefficient,
-    WaterProperties,
-    display_water_properties,
-    HDPE_PIPES,
-    get_pipe_internal_diameter,
-    list_available_pipes,
-    display_pipe_table,
-)
+from hydraulics._lazy import lazy_exports
 
-# Calculators
-from hydraulics.calculators import (
-    calculate_section_loss,
-    calculate_christiansen_head_loss,
-)
-
-# Models
-from hydraulics.models import (
-    Zone,
-    TransportZone,
-    IrrigationZone,
-    DrippingArtery,
-)
-
-# IO
-from hydraulics.io import Config, config
-
-# UI
-from hydraulics.ui import main
-
-__all__ = [
-    # Version
-    '__version__',
-    '__author__',
-    '__license__',
+# Public names and their defining modules, imported on first access, so that
+# e.g. reading the pipe table does not load the compiled kernels
+_EXPORTS = {
     # Core
-    'calculate_reynolds',
-    'calculate_velocity',
-    'solve_colebrook_white',
-    'calculate_darcy_weisbach',
-    'calculate_laminar_friction_factor',
-    'check_flow_regime',
-    'calculate_christiansen_coefficient',
-    'WaterProperties',
-    'display_water_properties',
-    'HDPE_PIPES',
-    'get_pipe_internal_diameter',
-    'list_available_pipes',
-    'display_pipe_table',
+    'calculate_reynolds': 'hydraulics.core.equations',
+    'calculate_velocity': 'hydraulics.core.equations',
+    'solve_colebrook_white': 'hydraulics.core.equations',
+    'solve_colebrook_serghides': 'hydraulics.core.equations',
+    'solve_colebrook_biberg': 'hydraulics.core.equations',
+    'friction_factor_lookup': 'hydraulics.core.equations',
+    'calculate_darcy_weisbach': 'hydraulics.core.equations',
+    'calculate_laminar_friction_factor': 'hydraulics.core.equations',
+    'check_flow_regime': 'hydraulics.core.equations',
+    'flow_regime_code': 'hydraulics.core.equations',
+    'check_flow_regime_vec': 'hydraulics.core.equations',
+    'regime_name': 'hydraulics.core.equations',
+    'REGIME_LAMINAR': 'hydraulics.core.equations',
+    'REGIME_TRANSITIONAL': 'hydraulics.core.equations',
+    'REGIME_TURBULENT': 'hydraulics.core.equations',
+    'calculate_christiansen_coefficient': 'hydraulics.core.equations',
+    'WaterProperties': 'hydraulics.core.properties',
+    'display_water_properties': 'hydraulics.core.properties',
+    'HDPE_PIPES': 'hydraulics.core.pipes',
+    'get_pipe_internal_diameter': 'hydraulics.core.pipes',
+    'list_available_pipes': 'hydraulics.core.pipes',
+    'display_pipe_table': 'hydraulics.core.pipes',
     # Calculators
-    'calculate_section_loss',
-    'calculate_christiansen_head_loss',
+    'calculate_section_loss': 'hydraulics.calculators.segment',
+    'calculate_section_loss_batch': 'hydraulics.calculators.segment',
+    'calculate_christiansen_head_loss': 'hydraulics.calculators.segment',
     # Models
-    'Zone',
-    'TransportZone',
-    'IrrigationZone',
-    'DrippingArtery',
+    'Zone': 'hydraulics.models.zones',
+    'ZoneKind': 'hydraulics.models.zones',
+    'TransportZone': 'hydraulics.models.zones',
+    'IrrigationZone': 'hydraulics.models.zones',
+    'DrippingArtery': 'hydraulics.models.artery',
     # IO
-    'Config',
-    'config',
+    'Config': 'hydraulics.io.config',
+    'config': 'hydraulics.io.config',
     # UI
-    'main',
-]
+    'main': 'hydraulics.ui.cli',
+}
+
+__all__ = ['__version__', '__author__', '__license__', *_EXPORTS]
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _EXPORTS)
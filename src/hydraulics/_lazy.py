@@ -0,0 +1,39 @@
+"""Lazy package exports (PEP 562)
+
+The package ``__init__`` modules re-export names from their submodules. Doing
+that with plain imports would load NumPy, Numba and the compiled kernels as
+soon as anything under ``hydraulics`` is imported, even for a pipe table or a
+unit setting. Instead, each ``__init__`` maps its public names to the defining
+modules and imports a module the first time one of its names is accessed.
+"""
+
+import importlib
+
+
+def lazy_exports(package_name, package_globals, exports):
+    """
+    Build the module-level __getattr__ and __dir__ for a package
+
+    Example:
+        >>> __getattr__, __dir__ = lazy_exports(__name__, globals(), _EXPORTS)
+
+    Args:
+        package_name: The package's __name__
+        package_globals: The package's globals(); resolved names are cached here
+        exports: Dictionary mapping each public name to its defining module
+
+    Returns:
+        tuple: (__getattr__, __dir__) functions for the package namespace
+    """
+    def __getattr__(name):
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name), name)
+        package_globals[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(package_globals) | set(exports))
+
+    return __getattr__, __dir__
@@ -1,11 +1,25 @@
 """Calculation engines"""
 
 from hydraulics.calculators.segment import (
+    SectionLossResult,
+    SegmentResult,
+    ChristiansenResult,
+    SegmentResults,
     calculate_section_loss,
+    calculate_section_loss_batch,
+    calculate_section_loss_array,
+    calculate_irrigation_zone,
     calculate_christiansen_head_loss
 )
 
 __all__ = [
+    'SectionLossResult',
+    'SegmentResult',
+    'ChristiansenResult',
+    'SegmentResults',
     'calculate_section_loss',
+    'calculate_section_loss_batch',
+    'calculate_section_loss_array',
+    'calculate_irrigation_zone',
     'calculate_christiansen_head_loss',
 ]
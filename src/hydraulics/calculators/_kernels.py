@@ -0,0 +1,65 @@
+"""
+Compiled kernels for whole irrigation zones.
+
+An irrigation zone of N drippers is N pipe segments of equal length whose flow
+drops by one dripper's flow after each outlet. The kernel below generates the
+segment flows, solves every segment with the fused section loss kernel (its
+flow-independent terms computed once per zone) and
+sums the zone head loss in a single (parallel) pass, so no intermediate flow,
+diameter or length arrays are built in Python. The lowest Reynolds number is
+reduced in the same pass, which decides whether the whole zone is turbulent.
+"""
+
+import numpy as np
+
+from hydraulics.core._jit import njit, prange
+from hydraulics.core.equations import _PI_OVER_4, _section_loss_hoisted_kernel
+
+
+@njit("Tuple((f8[:], f8[:], f8[:], f8[:], f8[:], f8, f8))(f8, f8, i8, f8, f8, f8, f8, f8)",
+      parallel=True, cache=True, fastmath=True)
+def irrigation_zone_losses(current_flow, flow_per_dripper, n, diameter, segment_length,
+                           roughness, kinematic_viscosity, g):
+    """
+    Solve the segments of one irrigation zone.
+
+    Args:
+        current_flow: Flow entering the zone in m³/s
+        flow_per_dripper: Flow leaving through each dripper in m³/s
+        n: Number of drippers (segments)
+        diameter: Pipe internal diameter in m
+        segment_length: Length of each segment in m
+        roughness: Pipe absolute roughness in m
+        kinematic_viscosity: Water kinematic viscosity in m²/s
+        g: Gravitational acceleration in m/s²
+
+    Returns:
+        Tuple (flows, velocity, reynolds, friction_factor, head_loss, zone_head_loss,
+        min_reynolds) with one array entry per segment, the summed zone head
+        loss and the lowest segment Reynolds number
+    """
+    flows = np.empty(n)
+    velocity = np.empty(n)
+    reynolds = np.empty(n)
+    friction_factor = np.empty(n)
+    head_loss = np.empty(n)
+    zone_head_loss = 0.0
+    # Finite start value: fastmath lets the compiler assume there are no infinities
+    min_reynolds = 1.0e308
+
+    # Flow-independent terms, shared by every segment of the zone
+    area = _PI_OVER_4 * diameter * diameter
+    relative_roughness = roughness / diameter
+    length_over_diameter = segment_length / diameter
+    inv_2g = 0.5 / g
+
+    for j in prange(n):
+        # Flow at the start of segment j
+        flows[j] = current_flow - j * flow_per_dripper
+        velocity[j], reynolds[j], friction_factor[j], head_loss[j] = _section_loss_hoisted_kernel(
+            flows[j], area, diameter, relative_roughness, length_over_diameter, kinematic_viscosity, inv_2g
+        )
+        zone_head_loss += head_loss[j]
+        min_reynolds = min(min_reynolds, reynolds[j])
+
+    return flows, velocity, reynolds, friction_factor, head_loss, zone_head_loss, min_reynolds
@@ -1,21 +1,101 @@
 """Segment-by-segment hydraulic calculation engine"""
 
+import functools
+import math
+from collections.abc import Sequence
+from typing import NamedTuple
+
+import numpy as np
+
+from hydraulics.calculators._kernels import irrigation_zone_losses
+from hydraulics.core._jit import njit, prange
 from hydraulics.core.equations import (
-    calculate_velocity,
-    calculate_reynolds,
-    check_flow_regime,
-    calculate_laminar_friction_factor,
-    solve_colebrook_white,
-    calculate_darcy_weisbach,
-    calculate_christiansen_coefficient
+    REGIME_LAMINAR,
+    REGIME_TURBULENT,
+    _REGIME_NAMES,
+    flow_regime_code,
+    check_flow_regime_vec,
+    calculate_christiansen_coefficient,
+    _section_loss_entry,
+    _section_loss_kernel
 )
 from hydraulics.core.properties import WaterProperties
 
 
+def _getitem_by_name(self, key):
+    """Support dict-style access by field name (result['head_loss']) as well as by index"""
+    if isinstance(key, str):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+    return tuple.__getitem__(self, key)
+
+
+class SectionLossResult(NamedTuple):
+    """Result of a single pipe section calculation"""
+
+    velocity: float
+    reynolds: float
+    flow_regime: str
+    is_valid: bool
+    friction_factor: float
+    friction_method: str
+    head_loss: float
+
+    __getitem__ = _getitem_by_name
+
+
+class SegmentResult(NamedTuple):
+    """Result of one segment of an irrigation zone"""
+
+    segment: int
+    flow_m3s: float
+    velocity: float
+    reynolds: float
+    flow_regime: str
+    friction_factor: float
+    friction_method: str
+    head_loss: float
+    is_valid: bool
+
+    __getitem__ = _getitem_by_name
+
+
+class ChristiansenResult(NamedTuple):
+    """Result of a Christiansen approximation calculation"""
+
+    christiansen_coefficient: float
+    unit_loss_m_per_m: float
+    head_loss: float
+    velocity: float
+    reynolds: float
+    friction_factor: float
+    friction_method: str
+    num_outlets: int
+    m_exponent: float
+
+    __getitem__ = _getitem_by_name
+
+
+# Significant figures kept when rounding inputs to build section loss cache keys
+_CACHE_SIG_FIGS = 12
+
+
+def _round_sig(x):
+    """Round x to _CACHE_SIG_FIGS significant figures"""
+    if x == 0.0 or not math.isfinite(x):
+        return x
+    return round(x, _CACHE_SIG_FIGS - 1 - math.floor(math.log10(abs(x))))
+
+
 def calculate_section_loss(flow_m3s, diameter, length, roughness=None):
     """
     Calculate head loss for a pipe section
 
+    Results are memoized on the inputs rounded to 12 significant figures, so
+    repeated design sweeps over the same sections are served from the cache.
+
     Args:
         flow_m3s: Volumetric flow rate in m³/s
         diameter: Pipe internal diameter in m
@@ -23,45 +103,265 @@ def calculate_section_loss(flow_m3s, diameter, length, roughness=None):
         roughness: Pipe absolute roughness in m (default: HDPE roughness)
 
     Returns:
-        Dictionary with calculation results
+        SectionLossResult with calculation results
     """
     if roughness is None:
         roughness = WaterProperties.hdpe_roughness
 
-    # Calculate velocity
-    velocity = calculate_velocity(flow_m3s, diameter)
+    # Water properties are part of the key, so a temperature change never serves stale results
+    return _section_loss_cached(
+        _round_sig(float(flow_m3s)), _round_sig(float(diameter)),
+        _round_sig(float(length)), _round_sig(float(roughness)),
+        WaterProperties.kinematic_viscosity, WaterProperties.g
+    )
 
-    # Calculate Reynolds number
-    reynolds = calculate_reynolds(velocity, diameter, WaterProperties.kinematic_viscosity)
 
-    # Check flow regime
-    regime, is_valid = check_flow_regime(reynolds)
+@functools.lru_cache(maxsize=4096)
+def _section_loss_cached(flow_m3s, diameter, length, roughness, kinematic_viscosity, g):
+    """Calculate a section loss from rounded inputs (memoized)"""
+    # Velocity, Reynolds number, friction factor and head loss in one compiled call
+    velocity, reynolds, friction_factor, head_loss = _section_loss_entry(
+        flow_m3s, diameter, length, roughness, kinematic_viscosity, g
+    )
 
-    # Determine friction factor calculation method
-    if reynolds < 2000:
-        # Laminar flow - use analytical solution f = 64/Re
-        friction_factor = calculate_laminar_friction_factor(reynolds)
+    # Check flow regime (translated to its display name only for the result)
+    regime_code = flow_regime_code(reynolds)
+
+    # Friction factor method selected inside the kernel by Reynolds number
+    if regime_code == REGIME_LAMINAR:
         friction_method = "Laminar (f=64/Re)"
     else:
-        # Transitional or turbulent - use Colebrook-White (safer for transitional)
-        friction_factor = solve_colebrook_white(reynolds, diameter, roughness)
         friction_method = "Colebrook-White"
 
-    # Calculate head loss
-    head_loss = calculate_darcy_weisbach(friction_factor, length, diameter, velocity, WaterProperties.g)
+    return SectionLossResult(
+        velocity, reynolds, _REGIME_NAMES[regime_code], regime_code == REGIME_TURBULENT,
+        friction_factor, friction_method, head_loss
+    )
+
+
+def get_cache_info():
+    """
+    Get section loss cache statistics for performance monitoring
+
+    Returns:
+        CacheInfo named tuple (hits, misses, maxsize, currsize)
+    """
+    return _section_loss_cached.cache_info()
+
+
+def clear_cache():
+    """Clear the section loss cache"""
+    _section_loss_cached.cache_clear()
+
+
+def calculate_section_loss_batch(flows_m3s, diameters, lengths, roughnesses=None):
+    """
+    Calculate head loss for many independent pipe sections at once
+
+    Each section is solved exactly as in calculate_section_loss, but the loop runs
+    inside one compiled kernel (multithreaded when Numba is installed).
+
+    Args:
+        flows_m3s: Array of volumetric flow rates in m³/s
+        diameters: Array of pipe internal diameters in m
+        lengths: Array of pipe lengths in m
+        roughnesses: Array of pipe absolute roughnesses in m (default: HDPE roughness)
+
+        The inputs are broadcast against each other (e.g. one diameter for
+        all sections) and must give a 1-D array.
+
+    Returns:
+        Dictionary of NumPy arrays with keys velocity, reynolds, regime_code, is_valid,
+        friction_factor, head_loss
+
+    Raises:
+        ValueError: If the input shapes do not broadcast to one 1-D shape
+    """
+    g, _, _, nu, eps = WaterProperties.snapshot()
+
+    if roughnesses is None:
+        roughnesses = eps
+
+    # The kernel does no bounds checks: bring the inputs to one common 1-D shape first
+    try:
+        flows_m3s, diameters, lengths, roughnesses = np.broadcast_arrays(
+            *(np.asarray(a, dtype=np.float64) for a in (flows_m3s, diameters, lengths, roughnesses))
+        )
+    except ValueError:
+        raise ValueError("flows, diameters, lengths and roughnesses must have broadcastable shapes") from None
+    if flows_m3s.ndim != 1:
+        raise ValueError("Batch inputs must broadcast to a 1-D array of sections")
+    # Contiguous copies of broadcast (stride 0) inputs only; full arrays pass through
+    flows_m3s, diameters, lengths, roughnesses = map(
+        np.ascontiguousarray, (flows_m3s, diameters, lengths, roughnesses)
+    )
+
+    velocity, reynolds, friction_factor, head_loss = _section_loss_batch_kernel(
+        flows_m3s, diameters, lengths, roughnesses, nu, g
+    )
+    regime_code, is_valid = check_flow_regime_vec(reynolds)
 
     return {
         "velocity": velocity,
         "reynolds": reynolds,
-        "flow_regime": regime,
+        "regime_code": regime_code,
         "is_valid": is_valid,
         "friction_factor": friction_factor,
-        "friction_method": friction_method,
         "head_loss": head_loss
     }
 
 
-def calculate_christiansen_head_loss(total_flow_m3s, diameter, total_length, roughness=None, num_outlets=1, m=2.0):
+def calculate_section_loss_array(flows_m3s, diameter, length, roughness=None):
+    """
+    Calculate head loss for many sections of one pipe at different flows
+
+    Convenience form of calculate_section_loss_batch for the segments of an
+    irrigation zone, which share diameter, length and roughness.
+
+    Args:
+        flows_m3s: Array of volumetric flow rates in m³/s
+        diameter: Pipe internal diameter in m
+        length: Length of each section in m
+        roughness: Pipe absolute roughness in m (default: HDPE roughness)
+
+    Returns:
+        Dictionary of NumPy arrays, as returned by calculate_section_loss_batch
+    """
+    flows_m3s = np.asarray(flows_m3s, dtype=np.float64)
+    shape = flows_m3s.shape
+    roughnesses = None if roughness is None else np.full(shape, float(roughness))
+    return calculate_section_loss_batch(
+        flows_m3s, np.full(shape, float(diameter)), np.full(shape, float(length)), roughnesses
+    )
+
+
+class SegmentResults(Sequence):
+    """
+    Read-only sequence of per-segment results backed by NumPy arrays
+
+    Segments are turned into SegmentResult tuples (fields segment, flow_m3s,
+    velocity, reynolds, flow_regime, friction_factor, friction_method,
+    head_loss, is_valid; also readable by key) only when they are accessed. The
+    regime_code and is_valid arrays may be omitted; they are then derived
+    from the Reynolds numbers on first use.
+    """
+
+    __slots__ = ("_flows", "_arrays")
+
+    def __init__(self, flows_m3s, arrays):
+        self._flows = flows_m3s
+        self._arrays = arrays
+
+    def __len__(self):
+        return self._flows.shape[0]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._segment(i) for i in range(*index.indices(len(self)))]
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("segment index out of range")
+        return self._segment(index)
+
+    def __iter__(self):
+        return map(self._segment, range(len(self)))
+
+    @property
+    def arrays(self):
+        """
+        All segments as one dictionary of NumPy arrays (structure of arrays)
+
+        Keys: flow_m3s, velocity, reynolds, regime_code, is_valid,
+        friction_factor, head_loss. Prefer this over iterating the segments
+        when aggregating many of them.
+        """
+        return {"flow_m3s": self._flows, **self._classified()}
+
+    def _classified(self):
+        """Backing arrays, with the flow regimes classified on first use"""
+        arrays = self._arrays
+        if "regime_code" not in arrays:
+            arrays["regime_code"], arrays["is_valid"] = check_flow_regime_vec(arrays["reynolds"])
+        return arrays
+
+    def _segment(self, i):
+        """Materialize segment i as a SegmentResult"""
+        arrays = self._classified()
+        regime_code = int(arrays["regime_code"][i])
+        return SegmentResult(
+            i + 1,
+            float(self._flows[i]),
+            float(arrays["velocity"][i]),
+            float(arrays["reynolds"][i]),
+            _REGIME_NAMES[regime_code],
+            float(arrays["friction_factor"][i]),
+            "Laminar (f=64/Re)" if regime_code == REGIME_LAMINAR else "Colebrook-White",
+            float(arrays["head_loss"][i]),
+            bool(arrays["is_valid"][i])
+        )
+
+
+def calculate_irrigation_zone(flow_m3s, flow_per_dripper, num_drippers, diameter, segment_length,
+                              roughness=None):
+    """
+    Calculate the segments of an irrigation zone in one compiled call
+
+    Segment j (0-based) starts with flow_m3s - j * flow_per_dripper and has
+    length segment_length.
+
+    Args:
+        flow_m3s: Flow entering the zone in m³/s
+        flow_per_dripper: Flow leaving through each dripper in m³/s
+        num_drippers: Number of drippers (one segment before each)
+        diameter: Pipe internal diameter in m
+        segment_length: Length of each segment in m
+        roughness: Pipe absolute roughness in m (default: HDPE roughness)
+
+    Returns:
+        Tuple (segments, zone_head_loss, is_valid): a SegmentResults sequence,
+        the zone head loss in m and whether every segment is turbulent
+    """
+    g, _, _, nu, eps = WaterProperties.snapshot()
+    if roughness is None:
+        roughness = eps
+
+    flows, velocity, reynolds, friction_factor, head_loss, zone_head_loss, min_reynolds = irrigation_zone_losses(
+        float(flow_m3s), float(flow_per_dripper), int(num_drippers), float(diameter),
+        float(segment_length), float(roughness), nu, g
+    )
+
+    # Per-segment regimes are classified only if the segments are inspected;
+    # the zone is valid when its slowest segment is turbulent
+    segments = SegmentResults(flows, {
+        "velocity": velocity,
+        "reynolds": reynolds,
+        "friction_factor": friction_factor,
+        "head_loss": head_loss
+    })
+    return segments, float(zone_head_loss), flow_regime_code(min_reynolds) == REGIME_TURBULENT
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def _section_loss_batch_kernel(flows_m3s, diameters, lengths, roughnesses, kinematic_viscosity, g):
+    """Solve independent segments in parallel, writing into preallocated output arrays"""
+    n = flows_m3s.shape[0]
+    velocity = np.empty(n)
+    reynolds = np.empty(n)
+    friction_factor = np.empty(n)
+    head_loss = np.empty(n)
+
+    for i in prange(n):
+        velocity[i], reynolds[i], friction_factor[i], head_loss[i] = _section_loss_kernel(
+            flows_m3s[i], diameters[i], lengths[i], roughnesses[i], kinematic_viscosity, g
+        )
+
+    return velocity, reynolds, friction_factor, head_loss
+
+
+def calculate_christiansen_head_loss(total_flow_m3s, diameter, total_length, roughness=None, num_outlets=1, m=2.0,
+                                     full_flow_result=None):
     """
     Calculate head loss using Christiansen approximation for uniformly spaced outlets
 
@@ -75,18 +375,22 @@ def calculate_christiansen_head_loss(total_flow_m3s, diameter, total_length, rou
         roughness: Pipe absolute roughness in m (default: HDPE roughness)
         num_outlets: Total number of outlets
         m: Flow regime exponent (default 2.0 for Darcy-Weisbach)
+        full_flow_result: Optional SectionLossResult of the whole pipe at
+            total_flow_m3s (e.g. the simplified model), reused instead of
+            being recalculated
 
     Returns:
-        Dictionary with Christiansen calculation results
+        ChristiansenResult with Christiansen calculation results
     """
-    if roughness is None:
-        roughness = WaterProperties.hdpe_roughness
-
     # Calculate unit loss assuming constant flow throughout
-    result = calculate_section_loss(total_flow_m3s, diameter, total_length, roughness)
+    if full_flow_result is None:
+        if roughness is None:
+            roughness = WaterProperties.hdpe_roughness
+        full_flow_result = calculate_section_loss(total_flow_m3s, diameter, total_length, roughness)
+    result = full_flow_result
 
     # Unit loss per meter
-    unit_loss = result['head_loss'] / total_length
+    unit_loss = result.head_loss / total_length
 
     # Calculate Christiansen coefficient
     F = calculate_christiansen_coefficient(num_outlets, m)
@@ -94,14 +398,14 @@ def calculate_christiansen_head_loss(total_flow_m3s, diameter, total_length, rou
     # Calculate adjusted head loss
     christiansen_head_loss = total_length * unit_loss * F
 
-    return {
-        "christiansen_coefficient": F,
-        "unit_loss_m_per_m": unit_loss,
-        "head_loss": christiansen_head_loss,
-        "velocity": result['velocity'],
-        "reynolds": result['reynolds'],
-        "friction_factor": result['friction_factor'],
-        "friction_method": result['friction_method'],
-        "num_outlets": num_outlets,
-        "m_exponent": m
-    }
+    return ChristiansenResult(
+        christiansen_coefficient=F,
+        unit_loss_m_per_m=unit_loss,
+        head_loss=christiansen_head_loss,
+        velocity=result.velocity,
+        reynolds=result.reynolds,
+        friction_factor=result.friction_factor,
+        friction_method=result.friction_method,
+        num_outlets=num_outlets,
+        m_exponent=m
+    )
@@ -1,37 +1,36 @@
 """Core hydraulic calculation modules"""
 
-from hydraulics.core.equations import (
-    calculate_reynolds,
-    calculate_velocity,
-    solve_colebrook_white,
-    calculate_darcy_weisbach,
-    calculate_laminar_friction_factor,
-    check_flow_regime,
-    calculate_christiansen_coefficient
-)
-from hydraulics.core.properties import WaterProperties, display_water_properties
-from hydraulics.core.pipes import (
-    HDPE_PIPES,
-    get_pipe_internal_diameter,
-    list_available_pipes,
-    display_pipe_table
-)
+from hydraulics._lazy import lazy_exports
 
-__all__ = [
+# Public names and their defining modules, imported on first access
+_EXPORTS = {
     # Equations
-    'calculate_reynolds',
-    'calculate_velocity',
-    'solve_colebrook_white',
-    'calculate_darcy_weisbach',
-    'calculate_laminar_friction_factor',
-    'check_flow_regime',
-    'calculate_christiansen_coefficient',
+    'calculate_reynolds': 'hydraulics.core.equations',
+    'calculate_velocity': 'hydraulics.core.equations',
+    'solve_colebrook_white': 'hydraulics.core.equations',
+    'solve_colebrook_serghides': 'hydraulics.core.equations',
+    'solve_colebrook_biberg': 'hydraulics.core.equations',
+    'friction_factor_lookup': 'hydraulics.core.equations',
+    'calculate_darcy_weisbach': 'hydraulics.core.equations',
+    'calculate_laminar_friction_factor': 'hydraulics.core.equations',
+    'check_flow_regime': 'hydraulics.core.equations',
+    'flow_regime_code': 'hydraulics.core.equations',
+    'check_flow_regime_vec': 'hydraulics.core.equations',
+    'regime_name': 'hydraulics.core.equations',
+    'REGIME_LAMINAR': 'hydraulics.core.equations',
+    'REGIME_TRANSITIONAL': 'hydraulics.core.equations',
+    'REGIME_TURBULENT': 'hydraulics.core.equations',
+    'calculate_christiansen_coefficient': 'hydraulics.core.equations',
     # Properties
-    'WaterProperties',
-    'display_water_properties',
+    'WaterProperties': 'hydraulics.core.properties',
+    'display_water_properties': 'hydraulics.core.properties',
     # Pipes
-    'HDPE_PIPES',
-    'get_pipe_internal_diameter',
-    'list_available_pipes',
-    'display_pipe_table',
-]
+    'HDPE_PIPES': 'hydraulics.core.pipes',
+    'get_pipe_internal_diameter': 'hydraulics.core.pipes',
+    'list_available_pipes': 'hydraulics.core.pipes',
+    'display_pipe_table': 'hydraulics.core.pipes',
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _EXPORTS)
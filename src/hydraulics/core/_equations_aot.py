@@ -0,0 +1,36 @@
+"""Ahead-of-time compilation of the numeric kernels with numba.pycc
+
+Builds the ``hydraulics.core._equations_native`` extension module from the
+same kernel sources used by the JIT path in ``equations.py``. When the
+extension is present, ``equations.py`` imports it and no JIT compilation
+happens on the first call.
+
+The extension is built by ``setup.py`` when Numba is importable at build
+time. It can also be built in place::
+
+    python -m hydraulics.core._equations_aot
+
+Note: ``numba.pycc`` is deprecated upstream. If it is unavailable the JIT
+path is used and results are identical.
+"""
+
+from numba.pycc import CC
+
+from hydraulics.core import equations
+
+cc = CC("_equations_native")
+
+
+def _py(kernel):
+    """Return the pure Python source of a kernel (njit dispatcher or plain function)"""
+    return getattr(kernel, "py_func", kernel)
+
+
+cc.export("solve_colebrook", "f8(f8,f8,f8,i8,f8)")(_py(equations._solve_colebrook_white_nb))
+cc.export("solve_colebrook_serghides", "f8(f8,f8,f8)")(_py(equations._solve_colebrook_serghides_nb))
+cc.export("solve_colebrook_biberg", "f8(f8,f8,f8)")(_py(equations._solve_colebrook_biberg_nb))
+cc.export("section_loss", "UniTuple(f8,4)(f8,f8,f8,f8,f8,f8)")(_py(equations._section_loss_kernel))
+
+
+if __name__ == "__main__":
+    cc.compile()
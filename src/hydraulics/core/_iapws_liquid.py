@@ -0,0 +1,147 @@
+"""
+Compiled liquid-water property kernels (IAPWS-IF97 region 1 + IAPWS 2008 viscosity).
+
+The precomputed table in _iapws_table.py covers 0-100°C at atmospheric
+pressure only. For other pressures, these kernels evaluate the properties
+directly:
+
+- Density from the IAPWS-IF97 region 1 Gibbs free energy (compressed liquid,
+  273.15 K <= T <= 623.15 K, saturation pressure <= P <= 100 MPa). It agrees
+  with IAPWS-95 to better than 0.01% over 0-100°C.
+- Dynamic viscosity from the IAPWS 2008 formulation, mu = mu0(T) * mu1(T, rho).
+  The critical enhancement mu2 is 1 outside the immediate vicinity of the
+  critical point, so it is omitted.
+- Saturation pressure from the IAPWS-IF97 region 4 equation, used to reject
+  states that are not liquid.
+
+With Numba installed the kernels are compiled (and cached on disk), so an
+evaluation takes well under a microsecond instead of the milliseconds needed
+to construct an iapws.IAPWS95 object.
+"""
+
+import math
+
+import numpy as np
+
+from hydraulics.core._jit import njit
+
+# Specific gas constant of water (IF97), kJ/(kg·K)
+_R = 0.461526
+
+# Region 1 reducing pressure (MPa) and temperature (K)
+_P_STAR_1 = 16.53
+_T_STAR_1 = 1386.0
+
+# Region 1 coefficients (IF97 Table 2): gamma = sum n * (7.1 - pi)^I * (tau - 1.222)^J
+_I_1 = np.array([
+    0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 2, 2, 2,
+    2, 2, 3, 3, 3, 4, 4, 4, 5, 8, 8, 21, 23, 29, 30, 31, 32,
+], dtype=np.float64)
+_J_1 = np.array([
+    -2, -1, 0, 1, 2, 3, 4, 5, -9, -7, -1, 0, 1, 3, -3, 0, 1,
+    3, 17, -4, 0, 6, -5, -2, 10, -8, -11, -6, -29, -31, -38, -39, -40, -41,
+], dtype=np.float64)
+_N_1 = np.array([
+    0.14632971213167, -0.84548187169114, -0.37563603672040e1, 0.33855169168385e1,
+    -0.95791963387872, 0.15772038513228, -0.16616417199501e-1, 0.81214629983568e-3,
+    0.28319080123804e-3, -0.60706301565874e-3, -0.18990068218419e-1, -0.32529748770505e-1,
+    -0.21841717175414e-1, -0.52838357969930e-4, -0.47184321073267e-3, -0.30001780793026e-3,
+    0.47661393906987e-4, -0.44141845330846e-5, -0.72694996297594e-15, -0.31679644845054e-4,
+    -0.28270797985312e-5, -0.85205128120103e-9, -0.22425281908000e-5, -0.65171222895601e-6,
+    -0.14341729937924e-12, -0.40516996860117e-6, -0.12734301741641e-8, -0.17424871230634e-9,
+    -0.68762131295531e-18, 0.14478307828521e-19, 0.26335781662795e-22, -0.11947622640071e-22,
+    0.18228094581404e-23, -0.93537087292458e-25,
+])
+
+# Region 4 (saturation line) coefficients (IF97 Table 34)
+_N_4 = np.array([
+    0.11670521452767e4, -0.72421316703206e6, -0.17073846940092e2, 0.12020824702470e5,
+    -0.32325550322333e7, 0.14915108613530e2, -0.48232657361591e4, 0.40511340542057e6,
+    -0.23855557567849, 0.65017534844798e3,
+])
+
+# IAPWS 2008 viscosity: reducing constants
+_T_CRIT = 647.096  # K
+_RHO_CRIT = 322.0  # kg/m³
+_MU_STAR = 1.0e-6  # Pa·s
+
+# mu0 coefficients H_i (i = 0..3)
+_H_0 = np.array([1.67752, 2.20462, 0.6366564, -0.241605])
+
+# mu1 coefficients H_ij (i = 0..5 rows, j = 0..6 columns)
+_H_1 = np.array([
+    [5.20094e-1, 2.22531e-1, -2.81378e-1, 1.61913e-1, -3.25372e-2, 0.0, 0.0],
+    [8.50895e-2, 9.99115e-1, -9.06851e-1, 2.57399e-1, 0.0, 0.0, 0.0],
+    [-1.08374, 1.88797, -7.72479e-1, 0.0, 0.0, 0.0, 0.0],
+    [-2.89555e-1, 1.26613, -4.89837e-1, 0.0, 6.98452e-2, 0.0, -4.35673e-3],
+    [0.0, 0.0, -2.57040e-1, 0.0, 0.0, 8.72102e-3, 0.0],
+    [0.0, 1.20573e-1, 0.0, 0.0, 0.0, 0.0, -5.93264e-4],
+])
+
+
+@njit("f8(f8)", cache=True)
+def _saturation_pressure(temperature_kelvin):
+    """Saturation pressure in MPa at a temperature in K (IF97 region 4)"""
+    theta = temperature_kelvin + _N_4[8] / (temperature_kelvin - _N_4[9])
+    a = theta * theta + _N_4[0] * theta + _N_4[1]
+    b = _N_4[2] * theta * theta + _N_4[3] * theta + _N_4[4]
+    c = _N_4[5] * theta * theta + _N_4[6] * theta + _N_4[7]
+    ratio = 2.0 * c / (-b + math.sqrt(b * b - 4.0 * a * c))
+    ratio_sq = ratio * ratio
+    return ratio_sq * ratio_sq
+
+
+@njit("UniTuple(f8, 2)(f8, f8)", cache=True, fastmath=True)
+def _iapws_liquid(temperature_kelvin, pressure_mpa):
+    """
+    Density and dynamic viscosity of liquid water.
+
+    Args:
+        temperature_kelvin: Temperature in K (273.15-623.15)
+        pressure_mpa: Pressure in MPa (saturation pressure to 100)
+
+    Returns:
+        tuple: (density, dynamic_viscosity) in kg/m³ and Pa·s
+    """
+    # Density: v = R*T/p * pi * dgamma/dpi (R in kJ/(kg·K), p in kPa)
+    pi = pressure_mpa / _P_STAR_1
+    tau = _T_STAR_1 / temperature_kelvin
+    x = 7.1 - pi
+    y = tau - 1.222
+
+    gamma_pi = 0.0
+    for k in range(_N_1.shape[0]):
+        exponent_i = _I_1[k]
+        if exponent_i != 0.0:
+            gamma_pi -= _N_1[k] * exponent_i * x ** (exponent_i - 1.0) * y ** _J_1[k]
+
+    specific_volume = _R * temperature_kelvin * pi * gamma_pi / (pressure_mpa * 1000.0)
+    density = 1.0 / specific_volume
+
+    # Viscosity: mu0 (dilute gas) times mu1 (finite density contribution)
+    t_bar = temperature_kelvin / _T_CRIT
+    rho_bar = density / _RHO_CRIT
+    inv_t_bar = 1.0 / t_bar
+
+    mu0_denominator = 0.0
+    inv_t_power = 1.0
+    for i in range(_H_0.shape[0]):
+        mu0_denominator += _H_0[i] * inv_t_power
+        inv_t_power *= inv_t_bar
+    mu0 = 100.0 * math.sqrt(t_bar) / mu0_denominator
+
+    dt = inv_t_bar - 1.0
+    dr = rho_bar - 1.0
+    mu1_sum = 0.0
+    dt_power = 1.0
+    for i in range(_H_1.shape[0]):
+        row_sum = 0.0
+        dr_power = 1.0
+        for j in range(_H_1.shape[1]):
+            row_sum += _H_1[i, j] * dr_power
+            dr_power *= dr
+        mu1_sum += row_sum * dt_power
+        dt_power *= dt
+    mu1 = math.exp(rho_bar * mu1_sum)
+
+    return density, _MU_STAR * mu0 * mu1
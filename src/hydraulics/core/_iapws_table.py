@@ -0,0 +1,89 @@
+"""
+IAPWS-95 water properties tabulated at integer temperatures 0-100°C.
+
+Generated with the iapws library (IAPWS95) at the same reference pressures as
+WaterAPIClient: 0.101325 MPa, or 0.2 MPa for T >= 99°C to stay in the liquid
+phase. Interpolating between entries (viscosity in log space) reproduces
+IAPWS-95 to better than 0.01% for density and viscosity.
+
+Regenerate (requires iapws) with:
+
+    python -m hydraulics.core._iapws_table
+"""
+
+_IAPWS_TABLE_RHO = (  # kg/m³
+    999.8430855043256, 999.9018375605018, 999.9430030065646, 999.9671642684934, 999.9748691392678,
+    999.9666335452146, 999.9429440395029, 999.904260053967, 999.851015936452, 999.7836227975856,
+    999.7024701877399, 999.607927622615, 999.5003459733634, 999.3800587358589, 999.2473831909089,
+    999.1026214670944, 998.9460615158006, 998.77797800676, 998.5986331523482, 998.4082774669828,
+    998.2071504679384, 997.9954813229868, 997.7734894495818, 997.5413850701084, 997.2993697268362,
+    997.0476367603434, 996.7863717543304, 996.5157529497069, 996.2359516305644, 995.9471324842546,
+    995.6494539376675, 995.3430684716345, 995.028122915141, 994.7047587208701, 994.3731122235787,
+    994.033314882477, 993.6854935088917, 993.3297704802058, 992.9662639411534, 992.5950879932165,
+    992.2163528731402, 991.8301651211378, 991.4366277396136, 991.0358403430068, 990.6278992992745,
+    990.2128978636695, 989.790926305259, 989.3620720266214, 988.9264196772289, 988.4840512608098,
+    988.0350462371518, 987.5794816186423, 987.1174320618533, 986.6489699545157, 986.1741654980899,
+    985.6930867862426, 985.2057998794311, 984.7123688758653, 984.2128559789699, 983.7073215616421,
+    983.1958242274034, 982.6784208686635, 982.1551667222298, 981.6261154222005, 981.0913190504374,
+    980.5508281846644, 980.0046919443888, 979.452958034708, 978.8956727881383, 978.33288120456,
+    977.7646269893629, 977.1909525899009, 976.6118992303113, 976.0275069448215, 975.4378146095727,
+    974.8428599730476, 974.242679685202, 973.6373093252811, 973.0267834284824, 972.411135511431,
+    971.7903980965832, 971.1646027355605, 970.5337800315118, 969.8979596604904, 969.2571703919357,
+    968.6114401082779, 967.9607958236979, 967.3052637021055, 966.6448690743332, 965.9796364545936,
+    965.3095895562525, 964.6347513069035, 963.9551438628137, 963.2707886227164, 962.5817062410481,
+    961.8879166405763, 961.1894390244764, 960.4862918878972, 959.7784930289885, 959.1122823937042,
+    958.395359213464,
+)
+
+_IAPWS_TABLE_MU = (  # Pa·s
+    0.0017917561784867217, 0.0017310212855274345, 0.0016735154284889377, 0.001619008796234241, 0.0015672917725208695,
+    0.0015181728495620146, 0.0014714767876958666, 0.001427042988639863, 0.0013847240545557828, 0.0013443845091444095,
+    0.0013058996603510897, 0.0012691545871085068, 0.001234043234954089, 0.0012004676074067464, 0.0011683370417368741,
+    0.0011375675592526385, 0.00110808128150493, 0.001079805904910356, 0.0010526742272341729, 0.0010266237201906532,
+    0.0010015961431205974, 0.0009775371933149239, 0.0009543961890828973, 0.0009321257821215217, 0.0009106816961445294,
+    0.0008900224890776884, 0.0008701093364335279, 0.0008509058337452534, 0.0008323778161752653, 0.0008144931936194591,
+    0.0007972217998101535, 0.0007805352540806779, 0.0007644068345960861, 0.0007488113619791563, 0.0007337250923719862,
+    0.0007191256190711317, 0.0007049917819619051, 0.0006913035840545878, 0.0006780421144946782, 0.0006651894774805047,
+    0.0006527287265767429, 0.0006406438039613178, 0.0006289194841872489, 0.0006175413220802581, 0.0006064956044282788,
+    0.0005957693051508109, 0.0005853500436645192, 0.0005752260461870428, 0.0005653861097443303, 0.0005558195686673055,
+    0.0005465162633828727, 0.0005374665113209762, 0.0005286610797749702, 0.0005200911605663962, 0.0005117483463779406,
+    0.0005036246086297387, 0.0004957122767846191, 0.0004880040189773673, 0.0004804928238715121, 0.0004731719836551581,
+    0.0004660350780943895, 0.00045907595956926815, 0.0004522887390234027, 0.0004456677727634874, 0.00043920765005012056,
+    0.0004329031814257062, 0.00042674938772951953, 0.00042074148975359567, 0.0004148748984967809, 0.00040914520597733537,
+    0.00040354817656750773, 0.00039807973881604455, 0.0003927359777272632, 0.0003875131274674246, 0.0003824075644713137,
+    0.0003774158009238418, 0.0003725344785933011, 0.0003677603629944311, 0.0003630903378611299, 0.0003585213999098973,
+    0.0003540506538764516, 0.0003496753078091542, 0.000345392668603978, 0.0003412001377667239, 0.0003370952073892518,
+    0.0003330754563272315, 0.00032913854656783844, 0.00032528221977651153, 0.00032150429401261305, 0.0003178026606044955,
+    0.0003141752811750434, 0.0003106201848093546, 0.0003071354653567432, 0.0003037192788596868, 0.0003003698411029116,
+    0.00029708542527605747, 0.00029386435974390867, 0.0002907050259184747, 0.0002876058562275508, 0.00028459206455231457,
+    0.0002816086980478507,
+)
+
+
+def _generate():
+    """Recompute the tables with IAPWS95 and return them as Python source"""
+    from iapws import IAPWS95
+
+    density = []
+    dynamic_viscosity = []
+    for t in range(101):
+        pressure_mpa = 0.2 if t >= 99 else 0.101325
+        water = IAPWS95(T=t + 273.15, P=pressure_mpa)
+        density.append(water.rho)
+        dynamic_viscosity.append(water.mu)
+
+    def fmt(name, values, unit):
+        lines = [f"{name} = (  # {unit}"]
+        for i in range(0, len(values), 5):
+            lines.append("    " + ", ".join(repr(float(v)) for v in values[i:i + 5]) + ",")
+        lines.append(")")
+        return "\n".join(lines)
+
+    return (
+        fmt("_IAPWS_TABLE_RHO", density, "kg/m³") + "\n\n"
+        + fmt("_IAPWS_TABLE_MU", dynamic_viscosity, "Pa·s")
+    )
+
+
+if __name__ == "__main__":
+    print(_generate())
@@ -0,0 +1,25 @@
+"""Optional Numba JIT support
+
+Numba is an optional dependency (``pip install hydraulics[fast]``). When it is
+installed, the numeric kernels are compiled to native code with ``njit``.
+Without it, ``njit`` is a no-op decorator and the kernels run as plain Python,
+so results are identical either way.
+"""
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only without numba
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback for numba.njit - returns the function unchanged"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
@@ -1,7 +1,26 @@
 """Hydraulic calculation equations - Darcy-Weisbach, Colebrook-White, Reynolds, Christiansen"""
 
+import functools
 import math
 
+import numpy as np
+
+from hydraulics.core._jit import njit
+
+# Circular area factor (A = π/4 * D²) and ln(10) for log10 derivatives
+_PI_OVER_4 = math.pi * 0.25
+_LN10 = 2.302585092994046
+
+# 1/3.7 from the Colebrook-White roughness term ε/(3.7*D)
+_INV_3_7 = 1.0 / 3.7
+
+# 2/ln(10), turning -2*log10 into a natural logarithm in the Lambert W form
+_TWO_OVER_LN10 = 2.0 / _LN10
+
+# Reynolds number thresholds: laminar below 2000, turbulent from 4000
+_RE_LAMINAR_MAX = 2000.0
+_RE_TURBULENT_MIN = 4000.0
+
 
 def calculate_reynolds(velocity, diameter, kinematic_viscosity):
     """
@@ -33,8 +52,7 @@ def calculate_velocity(flow_m3s, diameter):
     Returns:
         Flow velocity in m/s
     """
-    area = math.pi * diameter**2 / 4
-    return flow_m3s / area
+    return flow_m3s / (_PI_OVER_4 * diameter * diameter)
 
 
 def solve_colebrook_white(reynolds, diameter, roughness, max_iterations=100, tolerance=1e-6):
@@ -53,23 +71,39 @@ def solve_colebrook_white(reynolds, diameter, roughness, max_iterations=100, tol
     Returns:
         Friction factor f (dimensionless)
     """
-    # Initial guess using Swamee-Jain approximation
+    # Defaults are resolved here so the compiled kernel only ever sees one signature
+    return _solve_colebrook_white_entry(
+        float(reynolds), float(diameter), float(roughness), int(max_iterations), float(tolerance)
+    )
+
+
+@njit("f8(f8, f8, f8, i8, f8)", cache=True, fastmath=True)
+def _solve_colebrook_white_nb(reynolds, diameter, roughness, max_iterations, tolerance):
+    """Newton-Raphson Colebrook-White kernel (compiled with Numba when available)"""
     relative_roughness = roughness / diameter
-    term1 = relative_roughness / 3.7
+
+    # Loop invariants (module constants are compile-time constants in the kernel)
+    term_a = relative_roughness * _INV_3_7
+    coeff_b = 2.51 / reynolds
+
+    # Initial guess using Swamee-Jain approximation
     term2 = 5.74 / (reynolds ** 0.9)
-    f_guess = 0.25 / (math.log10(term1 + term2) ** 2)
+    log_guess = math.log10(term_a + term2)
+    f_guess = 0.25 / (log_guess * log_guess)
 
     # Newton-Raphson iteration
     for i in range(max_iterations):
         sqrt_f = math.sqrt(f_guess)
+        inv_sqrt_f = 1.0 / sqrt_f
 
         # Function: F(f) = 1/√f + 2*log10(ε/(3.7*D) + 2.51/(Re*√f))
-        term_a = relative_roughness / 3.7
-        term_b = 2.51 / (reynolds * sqrt_f)
-        F = 1/sqrt_f + 2 * math.log10(term_a + term_b)
+        term_b = coeff_b * inv_sqrt_f
+        F = inv_sqrt_f + 2 * math.log10(term_a + term_b)
 
         # Derivative: F'(f) = -0.5*f^(-3/2) - 2.51/(Re*f*√f*ln(10)*(ε/(3.7*D) + 2.51/(Re*√f)))
-        dF = -0.5 * (f_guess ** (-1.5)) - (2.51 / (reynolds * f_guess * sqrt_f * math.log(10) * (term_a + term_b)))
+        # with f^(-3/2) = (1/√f)/f, so no pow call is needed
+        inv_f_sqrt_f = inv_sqrt_f / f_guess
+        dF = -0.5 * inv_f_sqrt_f - coeff_b * inv_f_sqrt_f / (_LN10 * (term_a + term_b))
 
         # Newton-Raphson update
         f_new = f_guess - F / dF
@@ -84,6 +118,173 @@ def solve_colebrook_white(reynolds, diameter, roughness, max_iterations=100, tol
     return f_guess
 
 
+def solve_colebrook_serghides(reynolds, diameter, roughness):
+    """
+    Solve the Colebrook-White equation explicitly using Serghides' correlation
+
+    A = -2 * log10(ε/(3.7*D) + 12/Re)
+    B = -2 * log10(ε/(3.7*D) + 2.51*A/Re)
+    C = -2 * log10(ε/(3.7*D) + 2.51*B/Re)
+    f = (A - (B-A)²/(C - 2B + A))^-2
+
+    Matches the implicit Colebrook-White solution to within 0.0023% in the
+    turbulent regime, with three logarithms and no iteration.
+
+    Args:
+        reynolds: Reynolds number
+        diameter: Pipe internal diameter in m
+        roughness: Pipe absolute roughness in m
+
+    Returns:
+        Friction factor f (dimensionless)
+    """
+    return _solve_colebrook_serghides_entry(float(reynolds), float(diameter), float(roughness))
+
+
+@njit("f8(f8, f8, f8)", cache=True)
+def _solve_colebrook_serghides_nb(reynolds, diameter, roughness):
+    """Serghides explicit Colebrook-White kernel (compiled with Numba when available)"""
+    term_a = roughness / diameter * _INV_3_7
+
+    A = -2.0 * math.log10(term_a + 12.0 / reynolds)
+    B = -2.0 * math.log10(term_a + 2.51 * A / reynolds)
+    C = -2.0 * math.log10(term_a + 2.51 * B / reynolds)
+
+    B_minus_A = B - A
+    inv_sqrt_f = A - B_minus_A * B_minus_A / (C - 2.0 * B + A)
+    return 1.0 / (inv_sqrt_f * inv_sqrt_f)
+
+
+def solve_colebrook_biberg(reynolds, diameter, roughness):
+    """
+    Solve the Colebrook-White equation explicitly through the Lambert W function
+
+    With a = 2/ln(10), r = ε/(3.7*D) and c = 2.51/Re, Colebrook-White becomes
+    1/√f = a*W(z) - r/c with ln(z) = r/(a*c) - ln(a*c). W is evaluated with
+    Biberg's asymptotic expansion in L = ln(z), refined by one Fritsch step:
+
+    W0 = L - ln(L) + ln(L)/L + ln(L)²/(2L²) - ln(L)/L²
+
+    Matches the implicit Colebrook-White solution to within 1e-11 over the
+    turbulent range (Re 4000-1e7, ε/D up to 1e-2) with two logarithms and no
+    iteration.
+
+    Args:
+        reynolds: Reynolds number
+        diameter: Pipe internal diameter in m
+        roughness: Pipe absolute roughness in m
+
+    Returns:
+        Friction factor f (dimensionless)
+    """
+    return _solve_colebrook_biberg_entry(float(reynolds), float(diameter), float(roughness))
+
+
+@njit("f8(f8, f8)", cache=True)
+def _colebrook_biberg_rr_nb(reynolds, relative_roughness):
+    """Biberg/Fritsch kernel on the relative roughness ε/D, for callers that hoist it"""
+    term_a = relative_roughness * _INV_3_7
+    coeff_c = 2.51 / reynolds
+    ac = _TWO_OVER_LN10 * coeff_c
+
+    # Biberg's expansion of W(z) in L = ln(z)
+    L = term_a / ac - math.log(ac)
+    ln_L = math.log(L)
+    inv_L = 1.0 / L
+    w = L - ln_L + ln_L * inv_L + (0.5 * ln_L - 1.0) * ln_L * inv_L * inv_L
+
+    # One Fritsch step (fourth-order convergence) on w + ln(w) = L
+    z = L - math.log(w) - w
+    q = 2.0 * (1.0 + w) * (1.0 + w + z * (2.0 / 3.0))
+    w *= 1.0 + z / (1.0 + w) * (q - z) / (q - 2.0 * z)
+
+    inv_sqrt_f = _TWO_OVER_LN10 * w - term_a / coeff_c
+    return 1.0 / (inv_sqrt_f * inv_sqrt_f)
+
+
+@njit("f8(f8, f8, f8)", cache=True)
+def _solve_colebrook_biberg_nb(reynolds, diameter, roughness):
+    """Biberg/Fritsch explicit Colebrook-White kernel (compiled with Numba when available)"""
+    return _colebrook_biberg_rr_nb(reynolds, roughness / diameter)
+
+
+# Friction factor lookup table grid: log10(Re) x log10(ε/D)
+_LOOKUP_LOG_RE_MIN = 3.0
+_LOOKUP_LOG_RE_MAX = 7.0
+_LOOKUP_LOG_RR_MIN = -6.0
+_LOOKUP_LOG_RR_MAX = -2.0
+_LOOKUP_N_RE = 256
+_LOOKUP_N_RR = 64
+
+
+@functools.lru_cache(maxsize=None)
+def _friction_table():
+    """
+    Evaluate Serghides' solution on the lookup grid (vectorized)
+
+    Built on the first friction_factor_lookup call and kept, so importing
+    the module does not pay for a table the calculators never use.
+    """
+    log_re = np.linspace(_LOOKUP_LOG_RE_MIN, _LOOKUP_LOG_RE_MAX, _LOOKUP_N_RE)
+    log_rr = np.linspace(_LOOKUP_LOG_RR_MIN, _LOOKUP_LOG_RR_MAX, _LOOKUP_N_RR)
+    reynolds = 10.0 ** log_re[:, None]
+    term_a = 10.0 ** log_rr[None, :] / 3.7
+
+    A = -2.0 * np.log10(term_a + 12.0 / reynolds)
+    B = -2.0 * np.log10(term_a + 2.51 * A / reynolds)
+    C = -2.0 * np.log10(term_a + 2.51 * B / reynolds)
+    B_minus_A = B - A
+    inv_sqrt_f = A - B_minus_A * B_minus_A / (C - 2.0 * B + A)
+    return 1.0 / (inv_sqrt_f * inv_sqrt_f)
+
+
+def friction_factor_lookup(reynolds, relative_roughness):
+    """
+    Approximate the Colebrook-White friction factor from a precomputed table
+
+    Bilinear interpolation on a 256 x 64 grid of Serghides' solution spanning
+    Re in [1e3, 1e7] and ε/D in [1e-6, 1e-2]. Inputs outside the grid are
+    clamped to its edges (ε/D below 1e-6 is hydraulically smooth).
+
+    Faster than solve_colebrook_white, at the cost of a small interpolation
+    error (below 0.1% in the turbulent range). It is opt-in and not used by
+    the calculators.
+
+    Args:
+        reynolds: Reynolds number
+        relative_roughness: Relative roughness ε/D (dimensionless)
+
+    Returns:
+        Friction factor f (dimensionless)
+    """
+    return _friction_factor_lookup_nb(float(reynolds), float(relative_roughness), _friction_table())
+
+
+@njit("f8(f8, f8, f8[:, :])", cache=True)
+def _friction_factor_lookup_nb(reynolds, relative_roughness, table):
+    """Bilinear friction factor table lookup kernel"""
+    n_re = table.shape[0]
+    n_rr = table.shape[1]
+
+    # Continuous grid coordinates, clamped to the table
+    x = (math.log10(reynolds) - _LOOKUP_LOG_RE_MIN) * ((n_re - 1) / (_LOOKUP_LOG_RE_MAX - _LOOKUP_LOG_RE_MIN))
+    if relative_roughness > 0.0:
+        y = (math.log10(relative_roughness) - _LOOKUP_LOG_RR_MIN) * ((n_rr - 1) / (_LOOKUP_LOG_RR_MAX - _LOOKUP_LOG_RR_MIN))
+    else:
+        y = 0.0
+    x = min(max(x, 0.0), n_re - 1.0)
+    y = min(max(y, 0.0), n_rr - 1.0)
+
+    i = min(int(x), n_re - 2)
+    j = min(int(y), n_rr - 2)
+    tx = x - i
+    ty = y - j
+
+    f0 = table[i, j] + tx * (table[i + 1, j] - table[i, j])
+    f1 = table[i, j + 1] + tx * (table[i + 1, j + 1] - table[i, j + 1])
+    return f0 + ty * (f1 - f0)
+
+
 def calculate_darcy_weisbach(friction_factor, length, diameter, velocity, g=9.81):
     """
     Calculate head loss due to friction using Darcy-Weisbach equation
@@ -100,7 +301,89 @@ def calculate_darcy_weisbach(friction_factor, length, diameter, velocity, g=9.81
     Returns:
         Head loss in meters of water column
     """
-    return friction_factor * (length / diameter) * (velocity**2 / (2 * g))
+    return friction_factor * (length / diameter) * (velocity * velocity / (2 * g))
+
+
+@njit("UniTuple(f8, 4)(f8, f8, f8, f8, f8, f8, f8)", cache=True)
+def _section_loss_hoisted_kernel(flow_m3s, area, diameter, relative_roughness, length_over_diameter,
+                                 kinematic_viscosity, inv_2g):
+    """
+    Section loss kernel with the flow-independent terms precomputed
+
+    _section_loss_kernel computes these terms for a single segment; loops over
+    many segments of one pipe (same diameter, length and roughness) compute
+    area, ε/D, L/D and 1/(2g) once and call this per segment.
+
+    Args:
+        flow_m3s: Volumetric flow rate in m³/s
+        area: Pipe cross-section π/4·D² in m²
+        diameter: Pipe internal diameter in m
+        relative_roughness: Pipe relative roughness ε/D
+        length_over_diameter: Pipe length over diameter L/D
+        kinematic_viscosity: Water kinematic viscosity in m²/s
+        inv_2g: 1/(2g) in s²/m
+
+    Returns:
+        Tuple (velocity, reynolds, friction_factor, head_loss)
+    """
+    velocity = flow_m3s / area
+    reynolds = velocity * diameter / kinematic_viscosity
+
+    if reynolds < _RE_LAMINAR_MAX:
+        # Laminar flow - analytical solution f = 64/Re
+        friction_factor = 64.0 / reynolds
+    elif reynolds < _RE_TURBULENT_MIN:
+        # Transitional - iterative Colebrook-White (safer for transitional);
+        # a unit diameter makes the roughness argument the relative roughness
+        friction_factor = _solve_colebrook_white_nb(reynolds, 1.0, relative_roughness, 100, 1e-6)
+    else:
+        # Turbulent - explicit Colebrook-White solution, no iteration needed
+        friction_factor = _colebrook_biberg_rr_nb(reynolds, relative_roughness)
+
+    head_loss = friction_factor * length_over_diameter * (velocity * velocity * inv_2g)
+
+    return velocity, reynolds, friction_factor, head_loss
+
+
+@njit("UniTuple(f8, 4)(f8, f8, f8, f8, f8, f8)", cache=True)
+def _section_loss_kernel(flow_m3s, diameter, length, roughness, kinematic_viscosity, g):
+    """
+    Fused velocity -> Reynolds -> friction factor -> Darcy-Weisbach kernel for one segment
+
+    Keeps the whole numeric pipeline of a pipe segment inside a single compiled
+    call, so only one Python/native boundary crossing is paid per segment.
+
+    Args:
+        flow_m3s: Volumetric flow rate in m³/s
+        diameter: Pipe internal diameter in m
+        length: Pipe length in m
+        roughness: Pipe absolute roughness in m
+        kinematic_viscosity: Water kinematic viscosity in m²/s
+        g: Gravitational acceleration in m/s²
+
+    Returns:
+        Tuple (velocity, reynolds, friction_factor, head_loss)
+    """
+    return _section_loss_hoisted_kernel(
+        flow_m3s, _PI_OVER_4 * diameter * diameter, diameter, roughness / diameter,
+        length / diameter, kinematic_viscosity, 0.5 / g
+    )
+
+
+# Prefer the ahead-of-time compiled kernels (built by _equations_aot.py) so the
+# first call pays no JIT compilation; fall back to the njit kernels above
+try:
+    from hydraulics.core._equations_native import (
+        solve_colebrook as _solve_colebrook_white_entry,
+        solve_colebrook_serghides as _solve_colebrook_serghides_entry,
+        solve_colebrook_biberg as _solve_colebrook_biberg_entry,
+        section_loss as _section_loss_entry,
+    )
+except ImportError:
+    _solve_colebrook_white_entry = _solve_colebrook_white_nb
+    _solve_colebrook_serghides_entry = _solve_colebrook_serghides_nb
+    _solve_colebrook_biberg_entry = _solve_colebrook_biberg_nb
+    _section_loss_entry = _section_loss_kernel
 
 
 def calculate_laminar_friction_factor(reynolds):
@@ -118,6 +401,64 @@ def calculate_laminar_friction_factor(reynolds):
     return 64.0 / reynolds
 
 
+# Flow regime codes, used internally instead of regime name strings
+REGIME_LAMINAR = 0
+REGIME_TRANSITIONAL = 1
+REGIME_TURBULENT = 2
+_REGIME_NAMES = ("Laminar", "Transitional", "Turbulent")
+
+
+@njit("i8(f8)", cache=True)
+def flow_regime_code(reynolds):
+    """
+    Classify the flow regime based on Reynolds number
+
+    Args:
+        reynolds: Reynolds number
+
+    Returns:
+        Regime code (REGIME_LAMINAR, REGIME_TRANSITIONAL or REGIME_TURBULENT)
+    """
+    if reynolds < _RE_LAMINAR_MAX:
+        return REGIME_LAMINAR
+    elif reynolds < _RE_TURBULENT_MIN:
+        return REGIME_TRANSITIONAL
+    else:
+        return REGIME_TURBULENT
+
+
+@njit("Tuple((i1[:], b1[:]))(f8[:])", cache=True)
+def check_flow_regime_vec(reynolds):
+    """
+    Classify the flow regime of an array of Reynolds numbers
+
+    Branchless: the code is the number of thresholds (2000, 4000) reached, so
+    the comparison vectorizes instead of branching per element.
+
+    Args:
+        reynolds: 1-D float64 array of Reynolds numbers
+
+    Returns:
+        Tuple (int8 array of regime codes, bool array valid for Colebrook-White)
+    """
+    codes = ((reynolds >= _RE_LAMINAR_MAX).astype(np.int8)
+             + (reynolds >= _RE_TURBULENT_MIN).astype(np.int8))
+    return codes, codes == REGIME_TURBULENT
+
+
+def regime_name(code):
+    """
+    Get the display name of a flow regime code
+
+    Args:
+        code: Regime code from flow_regime_code
+
+    Returns:
+        Regime name ("Laminar", "Transitional" or "Turbulent")
+    """
+    return _REGIME_NAMES[code]
+
+
 def check_flow_regime(reynolds):
     """
     Check the flow regime based on Reynolds number
@@ -128,12 +469,8 @@ def check_flow_regime(reynolds):
     Returns:
         Tuple (regime_name, is_valid_for_colebrook_white)
     """
-    if reynolds < 2000:
-        return "Laminar", False
-    elif reynolds < 4000:
-        return "Transitional", False
-    else:
-        return "Turbulent", True
+    code = flow_regime_code(reynolds)
+    return _REGIME_NAMES[code], code == REGIME_TURBULENT
 
 
 def calculate_christiansen_coefficient(num_outlets, m=2.0):
@@ -149,11 +486,13 @@ def calculate_christiansen_coefficient(num_outlets, m=2.0):
     Returns:
         Christiansen coefficient F (dimensionless)
     """
-    N = num_outlets
+    # sqrt(m-1) = 1 for the Darcy-Weisbach default m = 2, so skip the sqrt
+    sqrt_m_minus_1 = 1.0 if m == 2.0 else math.sqrt(m - 1.0)
+    inv_N = 1.0 / num_outlets
 
     term1 = 1.0 / (m + 1.0)
-    term2 = 1.0 / (2.0 * N)
-    term3 = math.sqrt(m - 1.0) / (6.0 * N * N)
+    term2 = 0.5 * inv_N
+    term3 = sqrt_m_minus_1 * inv_N * inv_N / 6.0
 
     F = term1 + term2 + term3
 
@@ -1,5 +1,11 @@
 """HDPE pipe specifications - European nominal diameters"""
 
+import math
+import sys
+from types import MappingProxyType
+
+import numpy as np
+
 # HDPE Pipe specifications with PN grade variants (ISO 4427 standard)
 # Data for PN6 (6 bar), PN10 (10 bar), PN16 (16 bar) pressure ratings
 # Each DN has different internal diameters based on wall thickness
@@ -110,6 +116,64 @@ HDPE_PIPES = {
 }
 
 
+def _freeze(mapping):
+    """Return a read-only view of a nested dict (every level wrapped in MappingProxyType)"""
+    return MappingProxyType({
+        key: _freeze(value) if isinstance(value, dict) else value
+        for key, value in mapping.items()
+    })
+
+
+# Read-only: the derived lookup structures below are built once from this data
+HDPE_PIPES = _freeze(HDPE_PIPES)
+
+# Pipe designations sorted by nominal diameter, and each designation's position
+_SORTED_DESIGNATIONS = tuple(sorted(HDPE_PIPES, key=lambda x: HDPE_PIPES[x]["nominal"]))
+_DESIGNATION_INDEX = {designation: i for i, designation in enumerate(_SORTED_DESIGNATIONS)}
+
+# Internal diameter in meters for every (designation, PN grade) that is made
+_DIAMETER_M = {
+    (designation, grade): data["internal_diameter"] / 1000.0  # Convert mm to m
+    for designation, pipe in HDPE_PIPES.items()
+    for grade, data in pipe["pn_grades"].items()
+}
+
+# Available PN grades of each designation, sorted once
+_PN_GRADES_SORTED = {
+    designation: tuple(sorted(pipe["pn_grades"])) for designation, pipe in HDPE_PIPES.items()
+}
+
+# PN grades in the column order of _PIPE_DATA_ARRAY
+_PN_GRADES = ("PN6", "PN10", "PN16")
+
+# Pipe table as one contiguous structured array in _SORTED_DESIGNATIONS order:
+# name, nominal diameter and internal diameter per PN grade in mm (NaN if not made)
+_PIPE_DATA_ARRAY = np.array(
+    [
+        (designation, HDPE_PIPES[designation]["nominal"]) + tuple(
+            HDPE_PIPES[designation]["pn_grades"][grade]["internal_diameter"]
+            if grade in HDPE_PIPES[designation]["pn_grades"] else np.nan
+            for grade in _PN_GRADES
+        )
+        for designation in _SORTED_DESIGNATIONS
+    ],
+    dtype=[("name", "U8"), ("nominal", "i4"), ("pn6", "f8"), ("pn10", "f8"), ("pn16", "f8")]
+)
+
+
+def _pipe_index(nominal_designation):
+    """
+    Get the position of a pipe designation in _SORTED_DESIGNATIONS
+
+    Raises:
+        ValueError: If pipe designation is unknown
+    """
+    idx = _DESIGNATION_INDEX.get(nominal_designation)
+    if idx is None:
+        raise ValueError(f"Unknown pipe designation: {nominal_designation}")
+    return idx
+
+
 def get_default_pn_grade():
     """
     Get the default PN grade for backward compatibility
@@ -128,12 +192,12 @@ def list_available_pn_grades(nominal_designation):
         nominal_designation: String like "N20", "N25", etc.
 
     Returns:
-        List of available PN grade strings (e.g., ["PN6", "PN10", "PN16"])
+        Tuple of available PN grade strings, sorted (e.g., ("PN10", "PN16", "PN6"))
     """
-    if nominal_designation not in HDPE_PIPES:
-        raise ValueError(f"Unknown pipe designation: {nominal_designation}")
-
-    return sorted(HDPE_PIPES[nominal_designation]["pn_grades"].keys())
+    grades = _PN_GRADES_SORTED.get(nominal_designation)
+    if grades is None:
+        _pipe_index(nominal_designation)  # raises for the unknown designation
+    return grades
 
 
 def get_pipe_internal_diameter(nominal_designation, pn_grade=None):
@@ -150,28 +214,27 @@ def get_pipe_internal_diameter(nominal_designation, pn_grade=None):
     Raises:
         ValueError: If pipe designation or PN grade is invalid
     """
-    if nominal_designation not in HDPE_PIPES:
-        raise ValueError(f"Unknown pipe designation: {nominal_designation}")
-
     # Use default PN grade if not specified (backward compatibility)
     if pn_grade is None:
         pn_grade = get_default_pn_grade()
 
-    pipe_data = HDPE_PIPES[nominal_designation]
+    try:
+        return _DIAMETER_M[(nominal_designation, pn_grade)]
+    except KeyError:
+        pass
 
-    if pn_grade not in pipe_data["pn_grades"]:
-        available = list_available_pn_grades(nominal_designation)
-        raise ValueError(
-            f"PN grade {pn_grade} not available for {nominal_designation}. "
-            f"Available grades: {', '.join(available)}"
-        )
-
-    return pipe_data["pn_grades"][pn_grade]["internal_diameter"] / 1000.0  # Convert mm to m
+    # Not found: report an unknown designation, or the grades it is made in
+    _pipe_index(nominal_designation)
+    available = list_available_pn_grades(nominal_designation)
+    raise ValueError(
+        f"PN grade {pn_grade} not available for {nominal_designation}. "
+        f"Available grades: {', '.join(available)}"
+    )
 
 
 def list_available_pipes():
-    """List all available pipe designations"""
-    return sorted(HDPE_PIPES.keys(), key=lambda x: HDPE_PIPES[x]["nominal"])
+    """List all available pipe designations (tuple sorted by nominal diameter)"""
+    return _SORTED_DESIGNATIONS
 
 
 def get_adjacent_pipe_sizes(nominal_designation, num_smaller=2, num_larger=1):
@@ -187,26 +250,12 @@ def get_adjacent_pipe_sizes(nominal_designation, num_smaller=2, num_larger=1):
         Dictionary with keys 'smaller', 'selected', 'larger' containing pipe designations
         Returns None for missing sizes if at boundaries
     """
-    if nominal_designation not in HDPE_PIPES:
-        raise ValueError(f"Unknown pipe designation: {nominal_designation}")
-
-    # Get sorted list of all pipe designations
-    sorted_pipes = list_available_pipes()
-    current_idx = sorted_pipes.index(nominal_designation)
+    # Position in the designations sorted by nominal diameter
+    current_idx = _pipe_index(nominal_designation)
 
-    # Get smaller pipes (up to num_smaller)
-    smaller = []
-    for i in range(1, num_smaller + 1):
-        idx = current_idx - i
-        if idx >= 0:
-            smaller.insert(0, sorted_pipes[idx])  # Insert at beginning to maintain order
-
-    # Get larger pipes (up to num_larger)
-    larger = []
-    for i in range(1, num_larger + 1):
-        idx = current_idx + i
-        if idx < len(sorted_pipes):
-            larger.append(sorted_pipes[idx])
+    # Up to num_smaller smaller pipes and num_larger larger pipes, in ascending order
+    smaller = list(_SORTED_DESIGNATIONS[max(0, current_idx - num_smaller):current_idx])
+    larger = list(_SORTED_DESIGNATIONS[current_idx + 1:current_idx + 1 + num_larger])
 
     return {
         'smaller': smaller,
@@ -219,37 +268,42 @@ def display_pipe_table(pn_grade=None):
     """
     Display a table of available pipes
 
+    The table is built in memory and written to stdout in one call.
+
     Args:
         pn_grade: Optional PN grade to display. If None, shows all PN grades.
     """
     if pn_grade:
-        # Display single PN grade
-        print(f"\n=== HDPE PIPE SPECIFICATIONS ({pn_grade}) ===")
-        print(f"{'Designation':<15} {'Nominal D (mm)':<20} {'Internal D (mm)':<20}")
-        print("-" * 55)
-        for designation in list_available_pipes():
-            pipe = HDPE_PIPES[designation]
-            if pn_grade in pipe["pn_grades"]:
-                internal_d = pipe["pn_grades"][pn_grade]["internal_diameter"]
-                print(f"{designation:<15} {pipe['nominal']:<20} {internal_d:<20}")
-            else:
-                print(f"{designation:<15} {pipe['nominal']:<20} {'N/A':<20}")
-        print()
+        # Display single PN grade: one column of the pipe array (all N/A for unknown grades)
+        nominals = _PIPE_DATA_ARRAY["nominal"].tolist()
+        if pn_grade in _PN_GRADES:
+            internal_ds = _PIPE_DATA_ARRAY[pn_grade.lower()].tolist()
+        else:
+            internal_ds = [math.nan] * len(nominals)
+
+        lines = [
+            f"\n=== HDPE PIPE SPECIFICATIONS ({pn_grade}) ===",
+            f"{'Designation':<15} {'Nominal D (mm)':<20} {'Internal D (mm)':<20}",
+            "-" * 55,
+        ]
+        lines.extend(
+            f"{designation:<15} {nominal:<20} {'N/A' if math.isnan(internal_d) else internal_d:<20}"
+            for designation, nominal, internal_d in zip(_SORTED_DESIGNATIONS, nominals, internal_ds)
+        )
     else:
         # Display all PN grades
-        print("\n=== HDPE PIPE SPECIFICATIONS (ALL PN GRADES) ===")
-        print(f"{'Designation':<12} {'Nominal':<10} {'PN6 ID':<12} {'PN10 ID':<12} {'PN16 ID':<12}")
-        print(f"{'':12} {'(mm)':<10} {'(mm)':<12} {'(mm)':<12} {'(mm)':<12}")
-        print("-" * 60)
-        for designation in list_available_pipes():
-            pipe = HDPE_PIPES[designation]
-            pn6 = pipe["pn_grades"].get("PN6", {}).get("internal_diameter", "N/A")
-            pn10 = pipe["pn_grades"].get("PN10", {}).get("internal_diameter", "N/A")
-            pn16 = pipe["pn_grades"].get("PN16", {}).get("internal_diameter", "N/A")
-
-            pn6_str = f"{pn6:.1f}" if isinstance(pn6, (int, float)) else pn6
-            pn10_str = f"{pn10:.1f}" if isinstance(pn10, (int, float)) else pn10
-            pn16_str = f"{pn16:.1f}" if isinstance(pn16, (int, float)) else pn16
-
-            print(f"{designation:<12} {pipe['nominal']:<10} {pn6_str:<12} {pn10_str:<12} {pn16_str:<12}")
-        print()
+        lines = [
+            "\n=== HDPE PIPE SPECIFICATIONS (ALL PN GRADES) ===",
+            f"{'Designation':<12} {'Nominal':<10} {'PN6 ID':<12} {'PN10 ID':<12} {'PN16 ID':<12}",
+            f"{'':12} {'(mm)':<10} {'(mm)':<12} {'(mm)':<12} {'(mm)':<12}",
+            "-" * 60,
+        ]
+        for designation, nominal, *internal_ds in _PIPE_DATA_ARRAY.tolist():
+            pn6_str, pn10_str, pn16_str = (
+                "N/A" if math.isnan(d) else f"{d:.1f}" for d in internal_ds
+            )
+            lines.append(f"{designation:<12} {nominal:<10} {pn6_str:<12} {pn10_str:<12} {pn16_str:<12}")
+
+    # Trailing empty line, as after the table's closing print()
+    lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
@@ -1,7 +1,5 @@
 """Physical constants and water properties"""
 
-from hydraulics.core.water_api import WaterAPIClient
-
 
 class WaterProperties:
     """
@@ -31,26 +29,43 @@ class WaterProperties:
     hdpe_roughness = 0.007e-3  # m (0.007 mm - smooth pipe)
 
     @classmethod
-    def set_temperature(cls, temperature_celsius):
+    def set_temperature(cls, temperature_celsius, force=False):
         """
         Set water properties based on temperature.
 
         Fetches properties from IAPWS library for the given temperature.
-        Falls back to default 20°C values if API fails.
+        Falls back to default 20°C values if API fails. Does nothing if the
+        IAPWS properties for this temperature are already set, unless forced.
 
         Args:
             temperature_celsius: Water temperature in degrees Celsius (0-100°C)
+            force: Fetch and assign the properties even if the temperature is unchanged
 
         Raises:
             ValueError: If temperature is out of valid range
         """
-        properties = WaterAPIClient.fetch_properties(temperature_celsius)
+        if not force and temperature_celsius == cls.temperature and cls.source != "default":
+            return
+
+        # Imported on first use, so importing the constants does not load the
+        # property tables (water_api and its NumPy/IAPWS-95 data)
+        from hydraulics.core.water_api import WaterAPIClient
+
+        (cls.temperature, cls.density, cls.dynamic_viscosity,
+         cls.kinematic_viscosity, cls.source) = WaterAPIClient.fetch_properties_fast(temperature_celsius)
+
+    @classmethod
+    def snapshot(cls):
+        """
+        Get the current properties as one tuple, for binding to locals in loops.
 
-        cls.temperature = properties["temperature"]
-        cls.density = properties["density"]
-        cls.dynamic_viscosity = properties["dynamic_viscosity"]
-        cls.kinematic_viscosity = properties["kinematic_viscosity"]
-        cls.source = properties["source"]
+        Example:
+            >>> g, rho, mu, nu, eps = WaterProperties.snapshot()
+
+        Returns:
+            tuple: (g, density, dynamic_viscosity, kinematic_viscosity, hdpe_roughness)
+        """
+        return (cls.g, cls.density, cls.dynamic_viscosity, cls.kinematic_viscosity, cls.hdpe_roughness)
 
     @classmethod
     def reset_to_defaults(cls):
@@ -66,9 +81,10 @@ def display_water_properties():
     """Display water properties used in calculations"""
     source_label = "IAPWS" if WaterProperties.source == "iapws" else "NIST data (default)"
     print(f"\n=== WATER PROPERTIES (at {WaterProperties.temperature:.1f}C - {source_label}) ===")
-    print(f"Density (rho): {WaterProperties.density:.2f} kg/m^3")
-    print(f"Dynamic viscosity (mu): {WaterProperties.dynamic_viscosity*1000:.3f} mPa.s")
-    print(f"Kinematic viscosity (nu): {WaterProperties.kinematic_viscosity*1e6:.3f} mm^2/s")
-    print(f"Gravitational acceleration (g): {WaterProperties.g} m/s^2")
-    print(f"HDPE pipe roughness (epsilon): {WaterProperties.hdpe_roughness*1000:.4f} mm")
+    g, rho, mu, nu, eps = WaterProperties.snapshot()
+    print(f"Density (rho): {rho:.2f} kg/m^3")
+    print(f"Dynamic viscosity (mu): {mu*1000:.3f} mPa.s")
+    print(f"Kinematic viscosity (nu): {nu*1e6:.3f} mm^2/s")
+    print(f"Gravitational acceleration (g): {g} m/s^2")
+    print(f"HDPE pipe roughness (epsilon): {eps*1000:.4f} mm")
     print()
@@ -10,44 +10,80 @@ from hydraulics.utils.conversions import (
 class Config:
     """Global configuration for the hydraulic calculation tool"""
 
+    # Fixed attribute set: unit names plus the conversion factor cached for each.
+    # The units are read-only properties so they only change through the
+    # setters, which keep the cached factors in step.
+    __slots__ = (
+        "_pressure_unit", "_flow_unit", "_length_unit",
+        "_flow_factor", "_length_factor", "_pressure_factor"
+    )
+
     def __init__(self):
-        # Default units
-        self.pressure_unit = "bar"  # Options: bar, mwc (meters water column), atm
-        self.flow_unit = "l/h"      # Options: m3/s, l/s, l/h
-        self.length_unit = "m"      # Options: m, mm
+        # Default units (the setters also cache each unit's conversion factor)
+        self.set_pressure_unit("bar")  # Options: bar, mwc (meters water column), atm
+        self.set_flow_unit("l/h")      # Options: m3/s, l/s, l/h
+        self.set_length_unit("m")      # Options: m, mm
 
     def set_pressure_unit(self, unit):
         """Set pressure unit"""
         valid_units = ["bar", "mwc", "atm"]
         if unit not in valid_units:
             raise ValueError(f"Invalid pressure unit. Choose from: {valid_units}")
-        self.pressure_unit = unit
+        self._pressure_unit = unit
+        self._pressure_factor = convert_pressure_from_m(1.0, unit)
 
     def set_flow_unit(self, unit):
         """Set flow unit"""
         valid_units = ["m3/s", "l/s", "l/h"]
         if unit not in valid_units:
             raise ValueError(f"Invalid flow unit. Choose from: {valid_units}")
-        self.flow_unit = unit
+        self._flow_unit = unit
+        self._flow_factor = convert_flow_to_m3s(1.0, unit)
 
     def set_length_unit(self, unit):
         """Set length unit"""
         valid_units = ["m", "mm"]
         if unit not in valid_units:
             raise ValueError(f"Invalid length unit. Choose from: {valid_units}")
-        self.length_unit = unit
+        self._length_unit = unit
+        self._length_factor = convert_length_to_m(1.0, unit)
+
+    @property
+    def pressure_unit(self):
+        """Configured pressure unit (change it with set_pressure_unit)"""
+        return self._pressure_unit
+
+    @property
+    def flow_unit(self):
+        """Configured flow unit (change it with set_flow_unit)"""
+        return self._flow_unit
+
+    @property
+    def length_unit(self):
+        """Configured length unit (change it with set_length_unit)"""
+        return self._length_unit
+
+    @property
+    def flow_to_m3s_factor(self):
+        """Multiplier from the configured flow unit to m³/s"""
+        return self._flow_factor
+
+    @property
+    def length_to_m_factor(self):
+        """Multiplier from the configured length unit to meters"""
+        return self._length_factor
 
     def convert_flow_to_m3s(self, flow):
         """Convert flow from configured unit to m³/s"""
-        return convert_flow_to_m3s(flow, self.flow_unit)
+        return flow * self._flow_factor
 
     def convert_length_to_m(self, length):
         """Convert length from configured unit to meters"""
-        return convert_length_to_m(length, self.length_unit)
+        return length * self._length_factor
 
     def convert_pressure_from_m(self, pressure_m):
         """Convert pressure from meters of water column to configured unit"""
-        return convert_pressure_from_m(pressure_m, self.pressure_unit)
+        return pressure_m * self._pressure_factor
 
 
 # Global configuration instance
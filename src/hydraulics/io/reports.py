@@ -2,22 +2,53 @@
 
 import os
 from datetime import datetime
+from importlib.resources import files
+from typing import NamedTuple
 from hydraulics.io.config import config
 from hydraulics.core.properties import WaterProperties
 
+# Row templates for the per-row tables, parsed once instead of per f-string evaluation
+_SEG_ROW = "| %s | %.1f | %.3f | %.0f | %s | %s | %.6f | %.4f |\n"
+_DN_ROW = "| %s | %s | %.1f | %.4f | %s | %.4f |"
+_DN_ROW_BOLD = "| **%s** | **%s** | **%.1f** | **%.4f** | **%s** | **%.4f** |"
 
-def generate_ascii_diagram(artery):
-    """Generate ASCII diagram of the installation"""
+# Constant "Calculation Methods" tail of every report, read from package data
+# on first use (see _equations_section)
+_EQUATIONS_SECTION = None
+
+
+def _equations_section():
+    """Return the static equations section, loading templates/equations.md once"""
+    global _EQUATIONS_SECTION
+    if _EQUATIONS_SECTION is None:
+        text = files("hydraulics.io.templates").joinpath("equations.md").read_text(encoding="utf-8")
+        # The section follows a blank line and ends the report without a newline
+        _EQUATIONS_SECTION = "\n" + text.rstrip("\n")
+    return _EQUATIONS_SECTION
+
+
+def generate_ascii_diagram(artery, sink=None):
+    """
+    Generate ASCII diagram of the installation
+
+    Args:
+        artery: DrippingArtery object
+        sink: Optional text stream; if given, the diagram (plus a newline) is
+            written to it instead of being returned
+
+    Returns:
+        String containing the diagram, or None when written to sink
+    """
     diagram = []
     diagram.append("\n```")
     diagram.append("Installation Diagram:")
     diagram.append("")
 
-    # Build diagram
-    top_line = "         "
-    main_line = "PUMP <- "
-    bottom_line = "         "
-    labels_line = "         "
+    # Build diagram: each line is collected as a list of parts and joined once
+    top_parts = ["         "]
+    main_parts = ["PUMP <- "]
+    bottom_parts = ["         "]
+    labels_parts = ["         "]
 
     for i, zone in enumerate(artery.zones):
         zone_num = i + 1
@@ -25,28 +56,30 @@ def generate_ascii_diagram(artery):
         if zone.zone_type == "transport":
             # Transport zone
             length = int(zone.length)
-            segment = "-" * max(10, length // 5)
-            top_line += " " * len(segment) + "  "
-            main_line += segment + "--"
-            bottom_line += " " * len(segment) + "  "
-            labels_line += f"T{zone_num}".center(len(segment)) + "  "
+            _seg_len = max(10, length // 5)
+            blanks = " " * _seg_len + "  "
+            top_parts.append(blanks)
+            main_parts.append("-" * _seg_len + "--")
+            bottom_parts.append(blanks)
+            labels_parts.append(f"T{zone_num}".center(_seg_len) + "  ")
         else:
-            # Irrigation zone
+            # Irrigation zone: every dripper uses the same segment template,
+            # so each line is one template repeated num_drippers times
             num_drippers = zone.num_drippers
             segment_width = max(3, 15 // num_drippers)
-            segment = ""
-            top_segment = ""
-            bottom_segment = ""
+            dash = "-" * (segment_width - 1)
+            space = " " * (segment_width - 1)
+            _seg_len = segment_width * num_drippers
 
-            for j in range(num_drippers):
-                segment += "+" + "-" * (segment_width - 1)
-                top_segment += "|" + " " * (segment_width - 1)
-                bottom_segment += "d" + " " * (segment_width - 1)
+            top_parts.append(("|" + space) * num_drippers + "  ")
+            main_parts.append(("+" + dash) * num_drippers + "--")
+            bottom_parts.append(("d" + space) * num_drippers + "  ")
+            labels_parts.append(f"I{zone_num}({num_drippers}d)".center(_seg_len) + "  ")
 
-            top_line += top_segment + "  "
-            main_line += segment + "--"
-            bottom_line += bottom_segment + "  "
-            labels_line += f"I{zone_num}({num_drippers}d)".center(len(segment)) + "  "
+    top_line = "".join(top_parts)
+    main_line = "".join(main_parts)
+    bottom_line = "".join(bottom_parts)
+    labels_line = "".join(labels_parts)
 
     diagram.append(labels_line)
     diagram.append(top_line)
@@ -60,33 +93,70 @@ def generate_ascii_diagram(artery):
     diagram.append("  d = Dripper")
     diagram.append("```")
 
+    if sink is not None:
+        sink.write("\n".join(diagram) + "\n")
+        return None
     return "\n".join(diagram)
 
 
-def generate_pump_pressure_table(dn_comparison_results):
+def _fmt_seg(seg, conv):
+    """Format one segment-details row (newline-terminated)"""
+    valid_flag = "✓" if seg.is_valid else "✗"
+    return _SEG_ROW % (seg.segment, seg.flow_m3s * 3600000, seg.velocity, seg.reynolds,
+                       valid_flag, seg.friction_method, seg.friction_factor, conv(seg.head_loss))
+
+
+def _fmt_dn_row(dn_result, conv):
+    """Format one DN comparison row, in bold for the selected pipe"""
+    christiansen = dn_result['christiansen']
+    chris_str = f"{conv(christiansen):.4f}" if christiansen else 'N/A'
+    row = _DN_ROW_BOLD if dn_result['is_selected'] else _DN_ROW
+    return row % (dn_result['pipe_designation'], dn_result.get('pn_grade', 'PN10'),
+                  dn_result['internal_diameter_mm'], conv(dn_result['full_calculation']),
+                  chris_str, conv(dn_result['simplified']))
+
+
+def _comparison_note(dn_comparison_results):
+    """Note lines shared by the DN comparison tables: PN grade used and selected pipe marker"""
+    # Get PN grade from first result (all should be the same)
+    pn_grade = dn_comparison_results[0].get('pn_grade', 'PN10') if dn_comparison_results else 'PN10'
+    return [
+        f"\n**Note:** All comparisons use {pn_grade} grade pipes.",
+        "\nThe **selected pipe** is indicated in bold.",
+    ]
+
+
+def _lines_or_sink(lines, sink):
+    """Return the table lines, or write them (one per line) to sink and return None"""
+    if sink is not None:
+        sink.write("\n".join(lines) + "\n")
+        return None
+    return lines
+
+
+class PumpPressureRow(NamedTuple):
+    """Required pump pressure range of one DN size, in the configured pressure unit"""
+
+    pipe_designation: str
+    pn_grade: str
+    internal_diameter_mm: float
+    min_pump_pressure: float
+    max_pump_pressure: float
+    is_selected: bool
+
+
+def pump_pressure_rows(dn_comparison_results):
     """
-    Generate markdown table showing required pump pressures for different DN sizes
+    Calculate the required pump pressure range of each DN size
     across the dripper operating range (1.5-4 bar)
 
     Args:
         dn_comparison_results: List of dictionaries with DN comparison data
 
     Returns:
-        List of strings containing the markdown table
+        List of PumpPressureRow, in the order of dn_comparison_results
     """
-    lines = []
-    # Get PN grade from first result (all should be the same)
-    pn_grade = dn_comparison_results[0].get('pn_grade', 'PN10') if dn_comparison_results else 'PN10'
-
-    lines.append("\n## Required Pump Pressure by Pipe Diameter")
-    lines.append("\nThis table shows the required pump pressure range for pressure-compensated drippers")
-    lines.append("operating at 1.5-4 bar across different pipe diameters.")
-    lines.append(f"\n**Note:** All comparisons use {pn_grade} grade pipes.")
-    lines.append("\nThe **selected pipe** is indicated in bold.")
-
-    # Build table header
-    lines.append(f"\n| Pipe DN | PN Grade | Internal D (mm) | Min Pump Pressure ({config.pressure_unit}) | Max Pump Pressure ({config.pressure_unit}) |")
-    lines.append("|---------|----------|-----------------|--------------------------|--------------------------|")
+    _conv = config.convert_pressure_from_m
 
     # Convert dripper pressure range from bar to configured unit
     # Dripper range is 1.5-4 bar (standard for pressure-compensated drippers)
@@ -95,27 +165,61 @@ def generate_pump_pressure_table(dn_comparison_results):
     max_dripper_bar = 4.0
     min_dripper_m = min_dripper_bar / 0.0980665  # bar to mwc
     max_dripper_m = max_dripper_bar / 0.0980665  # bar to mwc
-    min_dripper_pressure = config.convert_pressure_from_m(min_dripper_m)
-    max_dripper_pressure = config.convert_pressure_from_m(max_dripper_m)
+    min_dripper_pressure = _conv(min_dripper_m)
+    max_dripper_pressure = _conv(max_dripper_m)
 
-    # Build table rows
+    rows = []
     for dn_result in dn_comparison_results:
-        pipe_dn = dn_result['pipe_designation']
-        pn_grade = dn_result.get('pn_grade', 'PN10')
-        internal_d = dn_result['internal_diameter_mm']
-        head_loss = config.convert_pressure_from_m(dn_result['full_calculation'])
+        head_loss = _conv(dn_result['full_calculation'])
 
         # Pump pressure = Dripper pressure + Head loss
         # Min: when drippers need minimum pressure (1.5 bar)
         # Max: when drippers need maximum pressure (4 bar)
-        min_pump_pressure = min_dripper_pressure + head_loss
-        max_pump_pressure = max_dripper_pressure + head_loss
+        rows.append(PumpPressureRow(
+            dn_result['pipe_designation'], dn_result.get('pn_grade', 'PN10'),
+            dn_result['internal_diameter_mm'], min_dripper_pressure + head_loss,
+            max_dripper_pressure + head_loss, dn_result['is_selected'],
+        ))
+    return rows
+
+
+def generate_pump_pressure_table(dn_comparison_results, sink=None, pump_rows=None):
+    """
+    Generate markdown table showing required pump pressures for different DN sizes
+    across the dripper operating range (1.5-4 bar)
+
+    Args:
+        dn_comparison_results: List of dictionaries with DN comparison data
+        sink: Optional text stream; if given, the lines are written to it
+            (one per line) instead of being returned
+        pump_rows: Optional pump_pressure_rows(dn_comparison_results) result,
+            if the caller has already calculated it (in the current pressure unit)
 
+    Returns:
+        List of strings containing the markdown table, or None when written to sink
+    """
+    lines = []
+    _punit = config.pressure_unit
+
+    lines.append("\n## Required Pump Pressure by Pipe Diameter")
+    lines.append("\nThis table shows the required pump pressure range for pressure-compensated drippers")
+    lines.append("operating at 1.5-4 bar across different pipe diameters.")
+    lines.extend(_comparison_note(dn_comparison_results))
+
+    # Build table header
+    lines.append(f"\n| Pipe DN | PN Grade | Internal D (mm) | Min Pump Pressure ({_punit}) | Max Pump Pressure ({_punit}) |")
+    lines.append("|---------|----------|-----------------|--------------------------|--------------------------|")
+
+    if pump_rows is None:
+        pump_rows = pump_pressure_rows(dn_comparison_results)
+
+    # Build table rows
+    for row in pump_rows:
         # Bold the selected pipe
-        if dn_result['is_selected']:
-            lines.append(f"| **{pipe_dn}** | **{pn_grade}** | **{internal_d:.1f}** | **{min_pump_pressure:.2f}** | **{max_pump_pressure:.2f}** |")
+        if row.is_selected:
+            lines.append(f"| **{row.pipe_designation}** | **{row.pn_grade}** | **{row.internal_diameter_mm:.1f}** | **{row.min_pump_pressure:.2f}** | **{row.max_pump_pressure:.2f}** |")
         else:
-            lines.append(f"| {pipe_dn} | {pn_grade} | {internal_d:.1f} | {min_pump_pressure:.2f} | {max_pump_pressure:.2f} |")
+            lines.append(f"| {row.pipe_designation} | {row.pn_grade} | {row.internal_diameter_mm:.1f} | {row.min_pump_pressure:.2f} | {row.max_pump_pressure:.2f} |")
 
     lines.append("\n**Notes:**")
     lines.append("- Pressure-compensated drippers maintain constant flow in the range 1.5-4 bar")
@@ -124,52 +228,39 @@ def generate_pump_pressure_table(dn_comparison_results):
     lines.append("- Head loss increases with smaller pipe diameters, requiring higher pump pressure")
     lines.append("- Select pipe diameter balancing pump costs (higher for smaller pipes) vs. material costs (higher for larger pipes)")
 
-    return lines
+    return _lines_or_sink(lines, sink)
 
 
-def generate_dn_comparison_table(dn_comparison_results):
+def generate_dn_comparison_table(dn_comparison_results, sink=None):
     """
     Generate markdown table comparing head losses across different DN sizes
 
     Args:
         dn_comparison_results: List of dictionaries with DN comparison data
+        sink: Optional text stream; if given, the lines are written to it
+            (one per line) instead of being returned
 
     Returns:
-        List of strings containing the markdown table
+        List of strings containing the markdown table, or None when written to sink
     """
     lines = []
-    # Get PN grade from first result (all should be the same)
-    pn_grade = dn_comparison_results[0].get('pn_grade', 'PN10') if dn_comparison_results else 'PN10'
+    # Bind the pressure conversion and unit once for all rows
+    _conv = config.convert_pressure_from_m
+    _punit = config.pressure_unit
 
     lines.append("\n## DN Size Comparison")
     lines.append("\nThis table compares head losses for different pipe diameters using three calculation methods:")
     lines.append("1. **Full Calculation**: Segment-by-segment with Darcy-Weisbach/Colebrook-White")
     lines.append("2. **Christiansen**: Approximation for uniformly spaced outlets")
     lines.append("3. **Simplified**: Constant flow assumption (all water exits at end)")
-    lines.append(f"\n**Note:** All comparisons use {pn_grade} grade pipes.")
-    lines.append("\nThe **selected pipe** is indicated in bold.")
+    lines.extend(_comparison_note(dn_comparison_results))
 
     # Build table header
-    lines.append(f"\n| Pipe DN | PN Grade | Internal D (mm) | Full Calculation ({config.pressure_unit}) | Christiansen ({config.pressure_unit}) | Simplified ({config.pressure_unit}) |")
+    lines.append(f"\n| Pipe DN | PN Grade | Internal D (mm) | Full Calculation ({_punit}) | Christiansen ({_punit}) | Simplified ({_punit}) |")
     lines.append("|---------|----------|-----------------|----------------------|----------------------|---------------------|")
 
     # Build table rows
-    for dn_result in dn_comparison_results:
-        pipe_dn = dn_result['pipe_designation']
-        pn_grade = dn_result.get('pn_grade', 'PN10')
-        internal_d = dn_result['internal_diameter_mm']
-        full_loss = config.convert_pressure_from_m(dn_result['full_calculation'])
-        christiansen_loss = config.convert_pressure_from_m(dn_result['christiansen']) if dn_result['christiansen'] else 'N/A'
-        simplified_loss = config.convert_pressure_from_m(dn_result['simplified'])
-
-        # Format Christiansen value
-        chris_str = f"{christiansen_loss:.4f}" if christiansen_loss != 'N/A' else 'N/A'
-
-        # Bold the selected pipe
-        if dn_result['is_selected']:
-            lines.append(f"| **{pipe_dn}** | **{pn_grade}** | **{internal_d:.1f}** | **{full_loss:.4f}** | **{chris_str}** | **{simplified_loss:.4f}** |")
-        else:
-            lines.append(f"| {pipe_dn} | {pn_grade} | {internal_d:.1f} | {full_loss:.4f} | {chris_str} | {simplified_loss:.4f} |")
+    lines.extend([_fmt_dn_row(dn_result, _conv) for dn_result in dn_comparison_results])
 
     lines.append("\n**Interpretation:**")
     lines.append("- Smaller DN sizes result in higher head losses due to increased friction")
@@ -177,10 +268,10 @@ def generate_dn_comparison_table(dn_comparison_results):
     lines.append("- The Christiansen approximation is typically within 5-10% of the full calculation")
     lines.append("- The simplified model overestimates losses, providing a conservative upper bound")
 
-    return lines
+    return _lines_or_sink(lines, sink)
 
 
-def generate_report(results, artery, dn_comparison=None):
+def generate_report(results, artery, dn_comparison=None, pump_rows=None):
     """
     Generate markdown report
 
@@ -188,214 +279,192 @@ def generate_report(results, artery, dn_comparison=None):
         results: Calculation results for the selected pipe
         artery: DrippingArtery object
         dn_comparison: Optional list of DN comparison results
+        pump_rows: Optional pump_pressure_rows(dn_comparison) result to reuse
+            for the pump pressure table
     """
 
     # Create reports directory if it doesn't exist
     reports_dir = "reports"
     os.makedirs(reports_dir, exist_ok=True)
 
-    # Generate filename with timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    # Read the clock once so the filename and the Generated line agree
+    now = datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
     filename = f"dripping_artery_report_{timestamp}.md"
     filepath = os.path.join(reports_dir, filename)
 
-    # Build report content
-    lines = []
-    lines.append("# Dripping Artery Hydraulic Calculation Report")
-    lines.append(f"\n**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    lines.append("\n**IMPORTANT - Water Properties Reference Pressure:**")
-    lines.append("All water properties (density, viscosity) are calculated at **atmospheric pressure**")
-    lines.append("(1 bar / 0.101325 MPa) using the IAPWS-95 standard formulation. This is appropriate")
-    lines.append("for irrigation systems because hydraulic calculations depend on pressure *differences*")
-    lines.append("(head losses), not absolute pressures, and water properties are nearly incompressible")
-    lines.append("in the 1-10 bar range typical of irrigation applications.")
-    lines.append(f"\n---\n")
+    # Stream the report straight into a buffered file
+    with open(filepath, 'w', encoding='utf-8', buffering=1 << 16) as f:
+        _write_report(f, results, artery, dn_comparison, now.strftime('%Y-%m-%d %H:%M:%S'), pump_rows)
+
+    return filepath
+
+
+def _write_report(out, results, artery, dn_comparison, generated, pump_rows=None):
+    """
+    Write the markdown report body to a text stream
+
+    Args:
+        out: Text stream with a write() method
+        results: Calculation results for the selected pipe
+        artery: DrippingArtery object
+        dn_comparison: Optional list of DN comparison results
+        generated: Generation date and time shown in the report header
+        pump_rows: Optional precalculated pump pressure rows
+    """
+    # Bind the pressure conversion and unit once for the zone and segment loops,
+    # and convert the totals used by the comparison and summary sections
+    _conv = config.convert_pressure_from_m
+    _punit = config.pressure_unit
+    total_loss = _conv(results['total_head_loss'])
+    simplified_loss = _conv(results['simplified_head_loss'])
+
+    w = out.write
+    w("# Dripping Artery Hydraulic Calculation Report\n")
+    w(f"\n**Generated:** {generated}\n")
+    w("\n**IMPORTANT - Water Properties Reference Pressure:**\n")
+    w("All water properties (density, viscosity) are calculated at **atmospheric pressure**\n")
+    w("(1 bar / 0.101325 MPa) using the IAPWS-95 standard formulation. This is appropriate\n")
+    w("for irrigation systems because hydraulic calculations depend on pressure *differences*\n")
+    w("(head losses), not absolute pressures, and water properties are nearly incompressible\n")
+    w("in the 1-10 bar range typical of irrigation applications.\n")
+    w(f"\n---\n\n")
 
     # Installation overview
-    lines.append("## Installation Overview")
-    lines.append(f"- **Pipe designation:** {artery.pipe_designation}-{artery.pn_grade}")
-    lines.append(f"- **PN Grade:** {artery.pn_grade} ({artery.pn_grade[2:]} bar working pressure)")
-    lines.append(f"- **Internal diameter:** {results['diameter']*1000:.1f} mm")
-    lines.append(f"- **Total length:** {results['total_length']:.2f} m")
-    lines.append(f"- **Initial flow:** {artery.total_flow} {config.flow_unit}")
-    lines.append(f"- **Number of zones:** {len(artery.zones)}")
+    w("## Installation Overview\n")
+    w(f"- **Pipe designation:** {artery.pipe_designation}-{artery.pn_grade}\n")
+    w(f"- **PN Grade:** {artery.pn_grade} ({artery.pn_grade[2:]} bar working pressure)\n")
+    w(f"- **Internal diameter:** {results['diameter']*1000:.1f} mm\n")
+    w(f"- **Total length:** {results['total_length']:.2f} m\n")
+    w(f"- **Initial flow:** {artery.total_flow} {config.flow_unit}\n")
+    w(f"- **Number of zones:** {len(artery.zones)}\n")
 
     # Pump Pressure Table (if DN comparison available)
     if dn_comparison:
-        lines.extend(generate_pump_pressure_table(dn_comparison))
+        generate_pump_pressure_table(dn_comparison, sink=out, pump_rows=pump_rows)
 
     # DN Comparison (if available)
     if dn_comparison:
-        lines.extend(generate_dn_comparison_table(dn_comparison))
+        generate_dn_comparison_table(dn_comparison, sink=out)
 
     # ASCII diagram
-    lines.append("\n## Installation Diagram")
-    lines.append(generate_ascii_diagram(artery))
+    w("\n## Installation Diagram\n")
+    generate_ascii_diagram(artery, sink=out)
 
     # Water properties
     source_label = "IAPWS" if WaterProperties.source == "iapws" else "NIST data (default)"
-    lines.append(f"\n## Water Properties ({source_label} at {WaterProperties.temperature:.1f} deg C)")
-    lines.append("\n**Reference Pressure:** 1 bar (0.101325 MPa, atmospheric pressure)")
-    lines.append("Properties calculated using IAPWS-95 standard at atmospheric pressure.")
-    lines.append("This reference is appropriate for irrigation systems as hydraulic calculations")
-    lines.append("use pressure differences (head losses), and water is nearly incompressible")
-    lines.append("in the 1-10 bar operating range.")
-    lines.append(f"\n- **Temperature:** {WaterProperties.temperature:.1f} deg C")
-    lines.append(f"- **Density (rho):** {WaterProperties.density:.2f} kg/m^3")
-    lines.append(f"- **Dynamic viscosity (mu):** {WaterProperties.dynamic_viscosity*1000:.3f} mPa·s")
-    lines.append(f"- **Kinematic viscosity (nu):** {WaterProperties.kinematic_viscosity*1e6:.3f} mm^2/s")
-    lines.append(f"- **Gravitational acceleration (g):** {WaterProperties.g} m/s^2")
-    lines.append(f"- **HDPE pipe roughness (epsilon):** {WaterProperties.hdpe_roughness*1000:.4f} mm")
+    w(f"\n## Water Properties ({source_label} at {WaterProperties.temperature:.1f} deg C)\n")
+    w("\n**Reference Pressure:** 1 bar (0.101325 MPa, atmospheric pressure)\n")
+    w("Properties calculated using IAPWS-95 standard at atmospheric pressure.\n")
+    w("This reference is appropriate for irrigation systems as hydraulic calculations\n")
+    w("use pressure differences (head losses), and water is nearly incompressible\n")
+    w("in the 1-10 bar operating range.\n")
+    w(f"\n- **Temperature:** {WaterProperties.temperature:.1f} deg C\n")
+    g, rho, mu, nu, eps = WaterProperties.snapshot()
+    w(f"- **Density (rho):** {rho:.2f} kg/m^3\n")
+    w(f"- **Dynamic viscosity (mu):** {mu*1000:.3f} mPa·s\n")
+    w(f"- **Kinematic viscosity (nu):** {nu*1e6:.3f} mm^2/s\n")
+    w(f"- **Gravitational acceleration (g):** {g} m/s^2\n")
+    w(f"- **HDPE pipe roughness (epsilon):** {eps*1000:.4f} mm\n")
 
     # Zone-by-zone results
-    lines.append("\n## Zone-by-Zone Analysis")
+    w("\n## Zone-by-Zone Analysis\n")
 
     for result in results['zones']:
+        # Bind the fields shared by both zone kinds once per zone
+        zone_number = result['zone_number']
+        length = result['length']
+        head_loss = _conv(result['head_loss'])
+        cum_loss = _conv(result['cumulative_head_loss'])
+        cum_len = result['cumulative_length']
+        is_valid = result['is_valid']
+
         if result['zone_type'] == 'transport':
-            lines.append(f"\n### Transport Zone {result['zone_number']}")
-            lines.append(f"- **Length:** {result['length']:.2f} m")
-            lines.append(f"- **Flow rate:** {result['flow_m3s']*3600000:.1f} l/h")
-            lines.append(f"- **Velocity:** {result['velocity']:.3f} m/s")
-            lines.append(f"- **Reynolds number:** {result['reynolds']:.0f}")
-            lines.append(f"- **Flow regime:** {result['flow_regime']}")
-            lines.append(f"- **Friction factor (f):** {result['friction_factor']:.6f}")
-            lines.append(f"- **Head loss:** {config.convert_pressure_from_m(result['head_loss']):.3f} {config.pressure_unit}")
-            lines.append(f"- **Cumulative head loss:** {config.convert_pressure_from_m(result['cumulative_head_loss']):.3f} {config.pressure_unit}")
-            lines.append(f"- **Cumulative length:** {result['cumulative_length']:.2f} m")
-            if not result['is_valid']:
-                lines.append(f"- ⚠️ **WARNING:** Flow regime not suitable for Darcy-Weisbach equation")
+            w(f"\n### Transport Zone {zone_number}\n")
+            w(f"- **Length:** {length:.2f} m\n")
+            w(f"- **Flow rate:** {result['flow_m3s']*3600000:.1f} l/h\n")
+            w(f"- **Velocity:** {result['velocity']:.3f} m/s\n")
+            w(f"- **Reynolds number:** {result['reynolds']:.0f}\n")
+            w(f"- **Flow regime:** {result['flow_regime']}\n")
+            w(f"- **Friction factor (f):** {result['friction_factor']:.6f}\n")
+            w(f"- **Head loss:** {head_loss:.3f} {_punit}\n")
+            w(f"- **Cumulative head loss:** {cum_loss:.3f} {_punit}\n")
+            w(f"- **Cumulative length:** {cum_len:.2f} m\n")
+            if not is_valid:
+                w(f"- ⚠️ **WARNING:** Flow regime not suitable for Darcy-Weisbach equation\n")
         else:
-            lines.append(f"\n### Irrigation Zone {result['zone_number']}")
-            lines.append(f"- **Length:** {result['length']:.2f} m")
-            lines.append(f"- **Number of drippers:** {result['num_drippers']}")
-            lines.append(f"- **Flow at start:** {result['flow_start_m3s']*3600000:.1f} l/h")
-            lines.append(f"- **Flow at end:** {result['flow_end_m3s']*3600000:.1f} l/h")
-            lines.append(f"- **Total zone flow:** {(result['flow_start_m3s']-result['flow_end_m3s'])*3600000:.1f} l/h")
-            lines.append(f"- **Flow per dripper:** {(result['flow_start_m3s']-result['flow_end_m3s'])/result['num_drippers']*3600000:.1f} l/h")
-            lines.append(f"- **Head loss:** {config.convert_pressure_from_m(result['head_loss']):.3f} {config.pressure_unit}")
-            lines.append(f"- **Cumulative head loss:** {config.convert_pressure_from_m(result['cumulative_head_loss']):.3f} {config.pressure_unit}")
-            lines.append(f"- **Cumulative length:** {result['cumulative_length']:.2f} m")
-            if not result['is_valid']:
-                lines.append(f"- ⚠️ **WARNING:** Some segments have unsuitable flow regime")
+            num_drippers = result['num_drippers']
+            flow_start = result['flow_start_m3s']
+            zone_flow = flow_start - result['flow_end_m3s']
+            w(f"\n### Irrigation Zone {zone_number}\n")
+            w(f"- **Length:** {length:.2f} m\n")
+            w(f"- **Number of drippers:** {num_drippers}\n")
+            w(f"- **Flow at start:** {flow_start*3600000:.1f} l/h\n")
+            w(f"- **Flow at end:** {result['flow_end_m3s']*3600000:.1f} l/h\n")
+            w(f"- **Total zone flow:** {zone_flow*3600000:.1f} l/h\n")
+            w(f"- **Flow per dripper:** {zone_flow/num_drippers*3600000:.1f} l/h\n")
+            w(f"- **Head loss:** {head_loss:.3f} {_punit}\n")
+            w(f"- **Cumulative head loss:** {cum_loss:.3f} {_punit}\n")
+            w(f"- **Cumulative length:** {cum_len:.2f} m\n")
+            if not is_valid:
+                w(f"- ⚠️ **WARNING:** Some segments have unsuitable flow regime\n")
 
             # Segment details
-            lines.append(f"\n#### Segment Details")
-            lines.append(f"\n| Segment | Flow (l/h) | Velocity (m/s) | Reynolds | Valid | Method | Friction Factor | Head Loss ({config.pressure_unit}) |")
-            lines.append("|---------|-----------|----------------|----------|-------|--------|-----------------|------------|")
-            for seg in result['segments']:
-                flow_lh = seg['flow_m3s'] * 3600000
-                head_loss_unit = config.convert_pressure_from_m(seg['head_loss'])
-                valid_flag = "✓" if seg['is_valid'] else "✗"
-                method = seg.get('friction_method', 'Colebrook-White')
-                lines.append(f"| {seg['segment']} | {flow_lh:.1f} | {seg['velocity']:.3f} | {seg['reynolds']:.0f} | {valid_flag} | {method} | {seg['friction_factor']:.6f} | {head_loss_unit:.4f} |")
-
-            lines.append(f"\n**Note:** Valid = ✓ (Turbulent, Re > 4000) or ✗ (Laminar/Transitional, Re < 4000).")
-            lines.append(f"Method indicates friction factor calculation: 'Laminar (f=64/Re)' for Re < 2000, 'Colebrook-White' otherwise.")
+            w(f"\n#### Segment Details\n")
+            w(f"\n| Segment | Flow (l/h) | Velocity (m/s) | Reynolds | Valid | Method | Friction Factor | Head Loss ({_punit}) |\n")
+            w("|---------|-----------|----------------|----------|-------|--------|-----------------|------------|\n")
+            w("".join([_fmt_seg(seg, _conv) for seg in result['segments']]))
+
+            w(f"\n**Note:** Valid = ✓ (Turbulent, Re > 4000) or ✗ (Laminar/Transitional, Re < 4000).\n")
+            w(f"Method indicates friction factor calculation: 'Laminar (f=64/Re)' for Re < 2000, 'Colebrook-White' otherwise.\n")
 
     # Calculation Method Comparison
-    lines.append("\n## Calculation Method Comparison")
-    lines.append("\nTwo methods have been used to calculate the total head loss in this irrigation artery:")
+    w("\n## Calculation Method Comparison\n")
+    w("\nTwo methods have been used to calculate the total head loss in this irrigation artery:\n")
 
-    total_loss = config.convert_pressure_from_m(results['total_head_loss'])
-    lines.append(f"\n### 1. Full Segment-by-Segment Calculation")
-    lines.append(f"This method calculates the friction loss for each pipe segment individually,")
-    lines.append(f"accounting for the decreasing flow as water exits through each dripper outlet.")
-    lines.append(f"- **Total head loss:** {total_loss:.4f} {config.pressure_unit}")
+    w(f"\n### 1. Full Segment-by-Segment Calculation\n")
+    w(f"This method calculates the friction loss for each pipe segment individually,\n")
+    w(f"accounting for the decreasing flow as water exits through each dripper outlet.\n")
+    w(f"- **Total head loss:** {total_loss:.4f} {_punit}\n")
 
     if results.get('christiansen'):
         chris = results['christiansen']
-        chris_loss = config.convert_pressure_from_m(chris['head_loss'])
-        lines.append(f"\n### 2. Christiansen Approximation")
-        lines.append(f"This simplified method uses the Christiansen reduction factor to estimate")
-        lines.append(f"friction losses in pipes with uniformly spaced outlets.")
-        lines.append(f"- **Christiansen coefficient (F):** {chris['christiansen_coefficient']:.4f}")
-        lines.append(f"- **Number of outlets:** {chris['num_outlets']}")
-        lines.append(f"- **Flow regime exponent (m):** {chris['m_exponent']:.1f} (Darcy-Weisbach turbulent)")
-        lines.append(f"- **Unit loss:** {chris['unit_loss_m_per_m']*1000:.4f} m/km")
-        lines.append(f"- **Total head loss:** {chris_loss:.4f} {config.pressure_unit}")
+        chris_loss = _conv(chris['head_loss'])
+        w(f"\n### 2. Christiansen Approximation\n")
+        w(f"This simplified method uses the Christiansen reduction factor to estimate\n")
+        w(f"friction losses in pipes with uniformly spaced outlets.\n")
+        w(f"- **Christiansen coefficient (F):** {chris['christiansen_coefficient']:.4f}\n")
+        w(f"- **Number of outlets:** {chris['num_outlets']}\n")
+        w(f"- **Flow regime exponent (m):** {chris['m_exponent']:.1f} (Darcy-Weisbach turbulent)\n")
+        w(f"- **Unit loss:** {chris['unit_loss_m_per_m']*1000:.4f} m/km\n")
+        w(f"- **Total head loss:** {chris_loss:.4f} {_punit}\n")
 
         # Comparison
         difference = abs(total_loss - chris_loss)
         pct_diff = (difference / total_loss * 100) if total_loss > 0 else 0
-        lines.append(f"\n### Comparison")
-        lines.append(f"- **Difference:** {difference:.4f} {config.pressure_unit} ({pct_diff:.2f}%)")
+        w(f"\n### Comparison\n")
+        w(f"- **Difference:** {difference:.4f} {_punit} ({pct_diff:.2f}%)\n")
         if pct_diff < 5:
-            lines.append(f"- The Christiansen approximation provides excellent agreement with the full calculation.")
+            w(f"- The Christiansen approximation provides excellent agreement with the full calculation.\n")
         elif pct_diff < 10:
-            lines.append(f"- The Christiansen approximation provides good agreement with the full calculation.")
+            w(f"- The Christiansen approximation provides good agreement with the full calculation.\n")
         else:
-            lines.append(f"- The Christiansen approximation shows significant deviation, likely due to varying flow regimes along the artery.")
+            w(f"- The Christiansen approximation shows significant deviation, likely due to varying flow regimes along the artery.\n")
 
     # Summary
-    lines.append("\n## Summary")
-    total_loss = config.convert_pressure_from_m(results['total_head_loss'])
-    simplified_loss = config.convert_pressure_from_m(results['simplified_head_loss'])
+    w("\n## Summary\n")
     difference_abs = abs(total_loss - simplified_loss)
     difference_pct = difference_abs / total_loss * 100 if total_loss > 0 else 0
 
-    lines.append(f"- **Total head loss (accurate model):** {total_loss:.3f} {config.pressure_unit}")
-    lines.append(f"- **Total head loss (simplified model):** {simplified_loss:.3f} {config.pressure_unit}")
-    lines.append(f"- **Difference:** {difference_abs:.3f} {config.pressure_unit} ({difference_pct:.1f}%)")
+    w(f"- **Total head loss (accurate model):** {total_loss:.3f} {_punit}\n")
+    w(f"- **Total head loss (simplified model):** {simplified_loss:.3f} {_punit}\n")
+    w(f"- **Difference:** {difference_abs:.3f} {_punit} ({difference_pct:.1f}%)\n")
 
-    lines.append("\n### Pressure Requirements")
-    lines.append(f"For pressure-compensated drippers operating at 1.5-4 bar:")
+    w("\n### Pressure Requirements\n")
+    w(f"For pressure-compensated drippers operating at 1.5-4 bar:\n")
     pump_pressure_min = 1.5 + total_loss
     pump_pressure_max = 4.0 + total_loss
-    lines.append(f"- **Minimum pump pressure:** {pump_pressure_min:.2f} {config.pressure_unit}")
-    lines.append(f"- **Maximum pump pressure:** {pump_pressure_max:.2f} {config.pressure_unit}")
-
-    # Equations used
-    lines.append("\n## Calculation Methods")
-
-    lines.append("\n### Darcy-Weisbach Equation")
-    lines.append("\nThe head loss due to friction in a pipe segment is calculated using:")
-    lines.append("\n$$h_f = f \\times \\frac{L}{D} \\times \\frac{v^2}{2g}$$")
-    lines.append("\nWhere:")
-    lines.append("- $h_f$ = Head loss due to friction (m)")
-    lines.append("- $f$ = Darcy friction factor (dimensionless)")
-    lines.append("- $L$ = Pipe length (m)")
-    lines.append("- $D$ = Pipe internal diameter (m)")
-    lines.append("- $v$ = Flow velocity (m/s)")
-    lines.append("- $g$ = Gravitational acceleration (9.81 m/s²)")
-
-    lines.append("\n### Friction Factor Calculation")
-    lines.append("\n**For Laminar Flow (Re < 2000):**")
-    lines.append("\n$$f = \\frac{64}{Re}$$")
-
-    lines.append("\n**For Transitional and Turbulent Flow (Re ≥ 2000):**")
-    lines.append("\nColebrook-White Equation:")
-    lines.append("\n$$\\frac{1}{\\sqrt{f}} = -2 \\log_{10}\\left(\\frac{\\epsilon}{3.7D} + \\frac{2.51}{Re\\sqrt{f}}\\right)$$")
-    lines.append("\nWhere:")
-    lines.append("- $\\epsilon$ = Absolute pipe roughness (m)")
-    lines.append("- $Re$ = Reynolds number (dimensionless)")
-    lines.append("\nSolved using Newton-Raphson method. Colebrook-White is used for transitional flow (Re < 4000) as it provides conservative (higher) friction factors.")
-
-    lines.append("\n### Reynolds Number")
-    lines.append("\nThe Reynolds number characterizes the flow regime:")
-    lines.append("\n$$Re = \\frac{vD}{\\nu}$$")
-    lines.append("\nWhere:")
-    lines.append("- $v$ = Flow velocity (m/s)")
-    lines.append("- $D$ = Pipe internal diameter (m)")
-    lines.append("- $\\nu$ = Kinematic viscosity (m²/s)")
-
-    lines.append("\n### Christiansen Approximation")
-    lines.append("\nFor irrigation laterals with uniformly spaced outlets, the total head loss can be approximated as:")
-    lines.append("\n$$h_f = F \\times L \\times J$$")
-    lines.append("\nWhere:")
-    lines.append("- $F$ = Christiansen reduction factor")
-    lines.append("- $L$ = Total pipe length (m)")
-    lines.append("- $J$ = Unit friction loss (calculated with full flow, m/m)")
-    lines.append("\n**Christiansen Coefficient:**")
-    lines.append("\n$$F = \\frac{1}{m+1} + \\frac{1}{2N} + \\frac{\\sqrt{m-1}}{6N^2}$$")
-    lines.append("\nWhere:")
-    lines.append("- $N$ = Number of outlets")
-    lines.append("- $m$ = Flow regime exponent ($m=2$ for Darcy-Weisbach turbulent, $m=1.75$ for Hazen-Williams)")
-
-    lines.append("\n---")
-    lines.append("\n*Report generated by Hydraulic Piping Calculation Tool*")
-
-    # Write to file
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(lines))
+    w(f"- **Minimum pump pressure:** {pump_pressure_min:.2f} {_punit}\n")
+    w(f"- **Maximum pump pressure:** {pump_pressure_max:.2f} {_punit}\n")
 
-    return filepath
+    w(_equations_section())
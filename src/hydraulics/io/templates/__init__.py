@@ -0,0 +1 @@
+"""Static markdown templates used by the report generator"""
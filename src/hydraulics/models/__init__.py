@@ -1,10 +1,11 @@
 """Data models for hydraulic systems"""
 
-from hydraulics.models.zones import Zone, TransportZone, IrrigationZone
+from hydraulics.models.zones import Zone, ZoneKind, TransportZone, IrrigationZone
 from hydraulics.models.artery import DrippingArtery
 
 __all__ = [
     'Zone',
+    'ZoneKind',
     'TransportZone',
     'IrrigationZone',
     'DrippingArtery',
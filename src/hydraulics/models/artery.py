@@ -1,12 +1,22 @@
 """Dripping artery calculation model"""
 
-from hydraulics.models.zones import IrrigationZone, TransportZone
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+from hydraulics.models.zones import ZoneKind
 from hydraulics.calculators.segment import calculate_section_loss, calculate_christiansen_head_loss
 from hydraulics.core.pipes import get_pipe_internal_diameter, get_adjacent_pipe_sizes
 from hydraulics.core.properties import WaterProperties
 from hydraulics.io.config import config
 
 
+def _init_dn_worker(properties):
+    """Process pool initializer: use the parent's water properties in the worker"""
+    (WaterProperties.g, WaterProperties.density, WaterProperties.dynamic_viscosity,
+     WaterProperties.kinematic_viscosity, WaterProperties.hdpe_roughness) = properties
+
+
 class DrippingArtery:
     """Main class for dripping artery calculation"""
 
@@ -25,7 +35,7 @@ class DrippingArtery:
         """Validate that sum of irrigation flows equals total flow"""
         total_irrigation_flow = sum(
             zone.target_flow for zone in self.zones
-            if isinstance(zone, IrrigationZone)
+            if zone.kind == ZoneKind.IRRIGATION
         )
 
         tolerance = 0.01  # 1% tolerance
@@ -35,119 +45,94 @@ class DrippingArtery:
                 f"does not match total flow ({self.total_flow} {config.flow_unit})"
             )
 
-    def _calculate_for_diameter(self, diameter):
+    def _zone_layout(self):
+        """
+        Diameter-independent lengths and flows of every zone
+
+        Computed once and shared by all the diameters of a DN comparison.
+
+        Returns:
+            List of (zone, geometry) pairs; geometry is the zone's prepare()
+            result, passed back to zone.compute() for every diameter
+        """
+        # Unit conversion factors, read once for all zones
+        flow_to_m3s = config.flow_to_m3s_factor
+        length_to_m = config.length_to_m_factor
+
+        layout = []
+        current_flow = self.total_flow * flow_to_m3s
+
+        for i, zone in enumerate(self.zones):
+            geometry, current_flow = zone.prepare(i + 1, current_flow, flow_to_m3s, length_to_m)
+            layout.append((zone, geometry))
+
+        return layout
+
+    def _calculate_for_diameter(self, diameter, layout=None, base=None):
         """
         Internal method to calculate head losses for a specific diameter
 
         Args:
             diameter: Pipe internal diameter in meters
+            layout: Optional result of _zone_layout (computed if omitted)
+            base: Optional exact result for another diameter. When given, the
+                irrigation zone losses are scaled from it (see Zone.scale)
+                instead of being solved segment by segment
 
         Returns:
             Dictionary with calculation results
         """
         roughness = WaterProperties.hdpe_roughness
+        if layout is None:
+            layout = self._zone_layout()
 
-        # Initialize
-        zone_results = []
+        # Initialize (one result per zone, filled in place)
+        zone_results = [None] * len(layout)
         cumulative_head_loss = 0.0
         cumulative_length = 0.0
-        current_flow = config.convert_flow_to_m3s(self.total_flow)
 
-        # Calculate for each zone
-        for i, zone in enumerate(self.zones):
-            zone_length_m = config.convert_length_to_m(zone.length)
-
-            if isinstance(zone, TransportZone):
-                # Transport zone - constant flow
-                result = calculate_section_loss(current_flow, diameter, zone_length_m, roughness)
-                result['zone_type'] = 'transport'
-                result['zone_number'] = i + 1
-                result['length'] = zone_length_m
-                result['flow_m3s'] = current_flow
-                result['cumulative_length'] = cumulative_length + zone_length_m
-                result['cumulative_head_loss'] = cumulative_head_loss + result['head_loss']
-
-                cumulative_head_loss = result['cumulative_head_loss']
-                cumulative_length = result['cumulative_length']
-
-            elif isinstance(zone, IrrigationZone):
-                # Irrigation zone - flow decreases along the zone
-                # We'll calculate losses segment by segment between drippers
-                zone_flow_total = config.convert_flow_to_m3s(zone.target_flow)
-                segment_length = zone_length_m / zone.num_drippers
-                flow_per_dripper = zone_flow_total / zone.num_drippers
-
-                zone_head_loss = 0.0
-                segment_results = []
-
-                for j in range(zone.num_drippers):
-                    # Flow at the start of this segment
-                    segment_flow = current_flow - j * flow_per_dripper
-
-                    # Calculate loss for this segment
-                    seg_result = calculate_section_loss(segment_flow, diameter, segment_length, roughness)
-                    zone_head_loss += seg_result['head_loss']
-
-                    segment_results.append({
-                        'segment': j + 1,
-                        'flow_m3s': segment_flow,
-                        'velocity': seg_result['velocity'],
-                        'reynolds': seg_result['reynolds'],
-                        'flow_regime': seg_result['flow_regime'],
-                        'friction_factor': seg_result['friction_factor'],
-                        'friction_method': seg_result['friction_method'],
-                        'head_loss': seg_result['head_loss'],
-                        'is_valid': seg_result['is_valid']
-                    })
-
-                # Store aggregated result for this zone
-                result = {
-                    'zone_type': 'irrigation',
-                    'zone_number': i + 1,
-                    'length': zone_length_m,
-                    'num_drippers': zone.num_drippers,
-                    'flow_start_m3s': current_flow,
-                    'flow_end_m3s': current_flow - zone_flow_total,
-                    'head_loss': zone_head_loss,
-                    'cumulative_length': cumulative_length + zone_length_m,
-                    'cumulative_head_loss': cumulative_head_loss + zone_head_loss,
-                    'segments': segment_results,
-                    'is_valid': all(seg_result['is_valid'] for seg_result in segment_results)
-                }
-
-                # Update current flow (flow decreases after irrigation zone)
-                current_flow -= zone_flow_total
-                cumulative_head_loss = result['cumulative_head_loss']
-                cumulative_length = result['cumulative_length']
-
-            zone_results.append(result)
+        # Calculate for each zone (dispatched on the zone class)
+        for i, (zone, geometry) in enumerate(layout):
+            if base is None:
+                result = zone.compute(geometry, diameter, roughness, cumulative_length, cumulative_head_loss)
+            else:
+                result = zone.scale(base['zones'][i], base['diameter'], geometry, diameter, roughness,
+                                    cumulative_length, cumulative_head_loss)
+            cumulative_head_loss = result['cumulative_head_loss']
+            cumulative_length = result['cumulative_length']
+
+            zone_results[i] = result
 
         # Calculate simplified model (all flow exits at the end)
         total_length = cumulative_length
-        initial_flow = config.convert_flow_to_m3s(self.total_flow)
+        # Inlet flow, converted exactly as _zone_layout converts the flow entering the first zone
+        initial_flow = self.total_flow * config.flow_to_m3s_factor
         simplified_result = calculate_section_loss(initial_flow, diameter, total_length, roughness)
 
         # Calculate total number of outlets (drippers)
         total_outlets = sum(
             zone.num_drippers for zone in self.zones
-            if isinstance(zone, IrrigationZone)
+            if zone.kind == ZoneKind.IRRIGATION
         )
 
         # Calculate Christiansen approximation
         christiansen_result = None
         if total_outlets > 0:
+            # The Christiansen unit loss is the simplified model's loss per meter
             christiansen_result = calculate_christiansen_head_loss(
-                initial_flow, diameter, total_length, roughness, total_outlets, m=2.0
-            )
+                initial_flow, diameter, total_length, roughness, total_outlets, m=2.0,
+                full_flow_result=simplified_result
+            )._asdict()
 
         return {
             'diameter': diameter,
             'roughness': roughness,
             'total_length': total_length,
             'total_head_loss': cumulative_head_loss,
-            'simplified_head_loss': simplified_result['head_loss'],
+            'simplified_head_loss': simplified_result.head_loss,
             'christiansen': christiansen_result,
-            'zones': zone_results
+            'zones': zone_results,
+            'approximate': base is not None
         }
 
     def calculate(self):
@@ -166,11 +151,23 @@ class DrippingArtery:
 
         return results
 
-    def calculate_with_dn_comparison(self):
+    def calculate_with_dn_comparison(self, max_workers=None, approximate=False):
         """
         Calculate head losses for multiple DN sizes for comparison
         Uses the SAME PN grade across all DN sizes for fair comparison
 
+        Args:
+            max_workers: Optional number of worker processes. When given, the
+                diameters are calculated in parallel in a process pool; this
+                only pays off for very large arteries, since starting the pool
+                costs far more than one diameter of a typical artery.
+                Default: calculate sequentially in this process.
+            approximate: If True, only the selected DN is solved segment by
+                segment; the irrigation zone losses of the other DN sizes are
+                scaled from it (typically within 1%, without per-segment
+                results; their 'full_result' has 'approximate' set).
+                Ignores max_workers.
+
         Returns:
             Dictionary with:
             - 'selected': Results for the user-selected DN and PN grade
@@ -182,15 +179,37 @@ class DrippingArtery:
         # Get adjacent pipe sizes (2 smaller, 1 larger)
         adjacent_sizes = get_adjacent_pipe_sizes(self.pipe_designation, num_smaller=2, num_larger=1)
 
-        # Collect all DN sizes to calculate
+        # Collect all DN sizes to calculate, with the SAME PN grade as selected by user
         all_dns = adjacent_sizes['smaller'] + [adjacent_sizes['selected']] + adjacent_sizes['larger']
+        diameters = [get_pipe_internal_diameter(dn, self.pn_grade) for dn in all_dns]
+
+        # Zone lengths and flows do not depend on the diameter, so they are
+        # computed once; DN sizes sharing an internal diameter share the result
+        layout = self._zone_layout()
+        unique_diameters = list(dict.fromkeys(diameters))
+
+        if approximate:
+            selected_diameter = diameters[all_dns.index(self.pipe_designation)]
+            base = self._calculate_for_diameter(selected_diameter, layout)
+            results = [base if diameter == selected_diameter else
+                       self._calculate_for_diameter(diameter, layout, base)
+                       for diameter in unique_diameters]
+        elif max_workers is None or len(unique_diameters) < 2:
+            results = [self._calculate_for_diameter(diameter, layout) for diameter in unique_diameters]
+        else:
+            # The diameters are independent. Workers are spawned rather than
+            # forked (forking after the Numba thread pool has started can
+            # deadlock) and get this process's water properties
+            with ProcessPoolExecutor(max_workers=max_workers,
+                                     mp_context=multiprocessing.get_context("spawn"),
+                                     initializer=_init_dn_worker,
+                                     initargs=(WaterProperties.snapshot(),)) as executor:
+                results = list(executor.map(self._calculate_for_diameter, unique_diameters, repeat(layout)))
+        results_by_diameter = dict(zip(unique_diameters, results))
 
-        # Calculate for each DN size with the SAME PN grade
         dn_results = []
-        for dn in all_dns:
-            # Use same PN grade as selected by user
-            diameter = get_pipe_internal_diameter(dn, self.pn_grade)
-            result = self._calculate_for_diameter(diameter)
+        for dn, diameter in zip(all_dns, diameters):
+            result = results_by_diameter[diameter]
 
             dn_results.append({
                 'pipe_designation': dn,
@@ -1,27 +1,177 @@
 """Zone classes for dripping artery systems"""
 
+from enum import IntEnum
+
+from hydraulics.calculators.segment import calculate_section_loss, calculate_irrigation_zone
+
+
+def _remaining_flow(flow_m3s, zone_flow):
+    """
+    Flow left after an irrigation zone, in m³/s
+
+    Flows converted to m³/s carry rounding error, so a zone that drains the
+    rest of the artery can leave a tiny nonzero (even negative) remainder;
+    that is snapped to exactly 0.0.
+    """
+    remaining = flow_m3s - zone_flow
+    if abs(remaining) <= 1e-12 * flow_m3s:
+        return 0.0
+    return remaining
+
+
+class ZoneKind(IntEnum):
+    """Integer zone tags, cheaper to compare than zone_type strings or isinstance"""
+
+    TRANSPORT = 0
+    IRRIGATION = 1
+
 
 class Zone:
     """Base class for pipe zones"""
 
+    # Fixed attribute sets keep zone objects small (no per-instance __dict__)
+    __slots__ = ("length", "zone_type", "flow")
+
     def __init__(self, length, zone_type):
         self.length = length  # in configured units
         self.zone_type = zone_type  # "transport" or "irrigation"
 
+    def prepare(self, zone_number, flow_m3s, flow_to_m3s, length_to_m):
+        """
+        Diameter-independent lengths and flows of this zone
+
+        Args:
+            zone_number: 1-based position of the zone in the artery
+            flow_m3s: Flow entering the zone in m³/s
+            flow_to_m3s: Factor converting configured flow units to m³/s
+            length_to_m: Factor converting configured length units to m
+
+        Returns:
+            tuple: (geometry, flow leaving the zone in m³/s); geometry is passed
+            back to compute() for every diameter
+        """
+        raise NotImplementedError
+
+    def compute(self, geometry, diameter, roughness, cumulative_length, cumulative_head_loss):
+        """
+        Calculate the head loss of this zone for one diameter
+
+        Args:
+            geometry: First element of prepare()'s result
+            diameter: Pipe internal diameter in m
+            roughness: Pipe absolute roughness in m
+            cumulative_length: Artery length upstream of the zone in m
+            cumulative_head_loss: Head loss upstream of the zone in m
+
+        Returns:
+            Dictionary with the zone results, including the updated
+            'cumulative_length' and 'cumulative_head_loss'
+        """
+        raise NotImplementedError
+
 
 class TransportZone(Zone):
     """Transport zone - no drippers"""
 
+    __slots__ = ()
+    kind = ZoneKind.TRANSPORT
+
     def __init__(self, length):
         super().__init__(length, "transport")
         self.flow = None  # Will be set during calculation
 
+    def prepare(self, zone_number, flow_m3s, flow_to_m3s, length_to_m):
+        # Constant flow along the zone
+        return (zone_number, self.length * length_to_m, flow_m3s), flow_m3s
+
+    def compute(self, geometry, diameter, roughness, cumulative_length, cumulative_head_loss):
+        zone_number, length_m, flow_m3s = geometry
+
+        result = calculate_section_loss(flow_m3s, diameter, length_m, roughness)._asdict()
+        result['zone_type'] = 'transport'
+        result['zone_number'] = zone_number
+        result['length'] = length_m
+        result['flow_m3s'] = flow_m3s
+        result['cumulative_length'] = cumulative_length + length_m
+        result['cumulative_head_loss'] = cumulative_head_loss + result['head_loss']
+        return result
+
+    def scale(self, base_result, base_diameter, geometry, diameter, roughness, cumulative_length,
+              cumulative_head_loss):
+        # A single section is as cheap to solve exactly as to scale
+        return self.compute(geometry, diameter, roughness, cumulative_length, cumulative_head_loss)
+
 
 class IrrigationZone(Zone):
     """Irrigation zone - with pressure-compensated drippers"""
 
+    __slots__ = ("num_drippers", "target_flow")
+    kind = ZoneKind.IRRIGATION
+
     def __init__(self, length, num_drippers, target_flow):
         super().__init__(length, "irrigation")
         self.num_drippers = num_drippers
         self.target_flow = target_flow  # Total flow for this zone in configured units
         self.flow = None  # Will be set during calculation
+
+    def prepare(self, zone_number, flow_m3s, flow_to_m3s, length_to_m):
+        length_m = self.length * length_to_m
+        zone_flow = self.target_flow * flow_to_m3s
+        segment_length = length_m / self.num_drippers
+        flow_per_dripper = zone_flow / self.num_drippers
+
+        # Flow decreases after irrigation zone
+        geometry = (zone_number, length_m, flow_m3s, zone_flow, segment_length, flow_per_dripper)
+        return geometry, _remaining_flow(flow_m3s, zone_flow)
+
+    def compute(self, geometry, diameter, roughness, cumulative_length, cumulative_head_loss):
+        zone_number, length_m, flow_m3s, zone_flow, segment_length, flow_per_dripper = geometry
+
+        # Flow decreases along the zone; all segments between drippers are
+        # solved in one compiled call
+        segments, zone_head_loss, is_valid = calculate_irrigation_zone(
+            flow_m3s, flow_per_dripper, self.num_drippers, diameter, segment_length, roughness
+        )
+
+        return {
+            'zone_type': 'irrigation',
+            'zone_number': zone_number,
+            'length': length_m,
+            'num_drippers': self.num_drippers,
+            'flow_start_m3s': flow_m3s,
+            'flow_end_m3s': _remaining_flow(flow_m3s, zone_flow),
+            'head_loss': zone_head_loss,
+            'cumulative_length': cumulative_length + length_m,
+            'cumulative_head_loss': cumulative_head_loss + zone_head_loss,
+            'segments': segments,
+            'is_valid': is_valid
+        }
+
+    def scale(self, base_result, base_diameter, geometry, diameter, roughness, cumulative_length,
+              cumulative_head_loss):
+        # The zone loss changes with the diameter like the loss of its first
+        # (highest flow, largest loss) segment, which is solved exactly at both
+        # diameters. The slowest segment is the last one, so the zone validity
+        # is still exact. Per-segment results are not estimated.
+        zone_number, length_m, flow_m3s, zone_flow, segment_length, flow_per_dripper = geometry
+
+        first_base = calculate_section_loss(flow_m3s, base_diameter, segment_length, roughness)
+        first_new = calculate_section_loss(flow_m3s, diameter, segment_length, roughness)
+        zone_head_loss = base_result['head_loss'] * (first_new.head_loss / first_base.head_loss)
+
+        last_flow = flow_m3s - (self.num_drippers - 1) * flow_per_dripper
+        is_valid = calculate_section_loss(last_flow, diameter, segment_length, roughness).is_valid
+
+        return {
+            'zone_type': 'irrigation',
+            'zone_number': zone_number,
+            'length': length_m,
+            'num_drippers': self.num_drippers,
+            'flow_start_m3s': flow_m3s,
+            'flow_end_m3s': _remaining_flow(flow_m3s, zone_flow),
+            'head_loss': zone_head_loss,
+            'cumulative_length': cumulative_length + length_m,
+            'cumulative_head_loss': cumulative_head_loss + zone_head_loss,
+            'segments': None,
+            'is_valid': is_valid
+        }
@@ -1,10 +1,16 @@
 """User interface modules"""
 
-from hydraulics.ui.cli import main
-from hydraulics.ui.wizards import run_dripping_artery_wizard, display_results
-
-__all__ = [
-    'main',
-    'run_dripping_artery_wizard',
-    'display_results',
-]
+from hydraulics._lazy import lazy_exports
+
+# Public names and their defining modules, imported on first access
+_EXPORTS = {
+    'main': 'hydraulics.ui.cli',
+    'run_dripping_artery_wizard': 'hydraulics.ui.wizards',
+    'display_results': 'hydraulics.ui.wizards',
+    'DrippingArteryConfig': 'hydraulics.ui.batch',
+    'run_batch': 'hydraulics.ui.batch',
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _EXPORTS)
@@ -0,0 +1,93 @@
+"""Non-interactive batch interface - calculate many dripping arteries without the wizard"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple, Optional, Tuple
+
+from hydraulics.core.properties import WaterProperties
+from hydraulics.io.config import config
+from hydraulics.models.artery import DrippingArtery
+from hydraulics.models.zones import Zone
+
+
+class DrippingArteryConfig(NamedTuple):
+    """
+    Scenario parameters collected by the dripping artery wizard
+
+    Flows and lengths are in the configured units (see hydraulics.io.config).
+    """
+
+    total_flow: float
+    pipe_designation: str
+    zones: Tuple[Zone, ...]
+    pn_grade: str = "PN10"
+    temperature: Optional[float] = None  # °C; None uses the default 20°C properties
+
+    def build_artery(self):
+        """Create the DrippingArtery described by this scenario"""
+        artery = DrippingArtery(self.total_flow, self.pipe_designation, self.pn_grade)
+        for zone in self.zones:
+            artery.add_zone(zone)
+        return artery
+
+
+def _apply_temperature(temperature):
+    """Load the water properties for a scenario temperature (None = defaults)"""
+    if temperature is None:
+        WaterProperties.reset_to_defaults()
+    else:
+        WaterProperties.set_temperature(temperature)
+
+
+def _run_case(case):
+    """Calculate one scenario with the DN comparison"""
+    _apply_temperature(case.temperature)
+    return case.build_artery().calculate_with_dn_comparison()
+
+
+def _init_batch_worker(units):
+    """Process pool initializer: use the caller's units in the worker"""
+    pressure_unit, flow_unit, length_unit = units
+    config.set_pressure_unit(pressure_unit)
+    config.set_flow_unit(flow_unit)
+    config.set_length_unit(length_unit)
+
+
+def run_batch(cases, max_workers=None):
+    """
+    Calculate a list of dripping artery scenarios
+
+    Each scenario is calculated with its DN comparison, exactly as the wizard
+    does, but without any console input or output.
+
+    Args:
+        cases: Iterable of DrippingArteryConfig
+        max_workers: Optional number of worker processes. Default: calculate
+            the scenarios sequentially in this process.
+
+    Returns:
+        List of calculate_with_dn_comparison() results ('selected' and
+        'dn_comparison'), in the order of cases
+
+    Raises:
+        ValueError: If a scenario is invalid (e.g. flow conservation error)
+    """
+    cases = list(cases)
+
+    if max_workers is None:
+        # Scenario temperatures change the global water properties; restore them afterwards
+        saved = (WaterProperties.temperature, WaterProperties.density, WaterProperties.dynamic_viscosity,
+                 WaterProperties.kinematic_viscosity, WaterProperties.source)
+        try:
+            return [_run_case(case) for case in cases]
+        finally:
+            (WaterProperties.temperature, WaterProperties.density, WaterProperties.dynamic_viscosity,
+             WaterProperties.kinematic_viscosity, WaterProperties.source) = saved
+
+    # Spawned (not forked) workers, since forking after the Numba thread pool
+    # has started can deadlock; each worker is set to this process's units
+    units = (config.pressure_unit, config.flow_unit, config.length_unit)
+    with ProcessPoolExecutor(max_workers=max_workers,
+                             mp_context=multiprocessing.get_context("spawn"),
+                             initializer=_init_batch_worker, initargs=(units,)) as executor:
+        return list(executor.map(_run_case, cases))
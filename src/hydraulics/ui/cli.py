@@ -1,7 +1,7 @@
 """CLI interface - main menu and configuration"""
 
 from hydraulics.io.config import config
-from hydraulics.ui.wizards import run_dripping_artery_wizard
+from hydraulics.ui.wizards import run_dripping_artery_wizard, _read_line
 from hydraulics.core.pipes import display_pipe_table
 from hydraulics.core.properties import display_water_properties
 
@@ -39,12 +39,12 @@ def configure_units():
     """Configuration submenu"""
     while True:
         display_config_menu()
-        choice = input("> ").strip()
+        choice = _read_line("> ").strip()
 
         if choice == "1":
             print("\nPressure units: bar, mwc (meters water column), atm")
             print("Enter unit:")
-            unit = input("> ").strip().lower()
+            unit = _read_line("> ").strip().lower()
             try:
                 config.set_pressure_unit(unit)
                 print(f"[OK] Pressure unit set to: {unit}")
@@ -54,7 +54,7 @@ def configure_units():
         elif choice == "2":
             print("\nFlow units: m3/s, l/s, l/h")
             print("Enter unit:")
-            unit = input("> ").strip().lower()
+            unit = _read_line("> ").strip().lower()
             try:
                 config.set_flow_unit(unit)
                 print(f"[OK] Flow unit set to: {unit}")
@@ -64,7 +64,7 @@ def configure_units():
         elif choice == "3":
             print("\nLength units: m, mm")
             print("Enter unit:")
-            unit = input("> ").strip().lower()
+            unit = _read_line("> ").strip().lower()
             try:
                 config.set_length_unit(unit)
                 print(f"[OK] Length unit set to: {unit}")
@@ -81,7 +81,7 @@ def main():
     """Main menu loop"""
     while True:
         display_main_menu()
-        choice = input("> ").strip()
+        choice = _read_line("> ").strip()
 
         if choice == "1":
             run_dripping_artery_wizard()
@@ -89,10 +89,10 @@ def main():
             configure_units()
         elif choice == "3":
             display_pipe_table()
-            input("\nPress Enter to continue...")
+            _read_line("\nPress Enter to continue...")
         elif choice == "4":
             display_water_properties()
-            input("\nPress Enter to continue...")
+            _read_line("\nPress Enter to continue...")
         elif choice == "5":
             print("\nGoodbye!")
             break
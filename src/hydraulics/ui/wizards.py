@@ -1,5 +1,9 @@
 """Interactive wizards for user input"""
 
+import re
+import sys
+from functools import lru_cache
+
 from hydraulics.models.zones import TransportZone, IrrigationZone
 from hydraulics.models.artery import DrippingArtery
 from hydraulics.core.pipes import (
@@ -13,6 +17,37 @@ from hydraulics.io.config import config
 from hydraulics.io.reports import generate_report
 
 
+# Plain decimal/scientific notation; anything else is rejected before float()
+_FLOAT_RE = re.compile(r"[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?")
+
+
+def _read_line(prompt=""):
+    """
+    Read one line of user input
+
+    A terminal keeps input() and its readline line editing and history;
+    piped or redirected input is read directly, without flushing the prompt
+    before every line. stdin is checked on each call, since it may be replaced.
+
+    Args:
+        prompt: Prompt to display to user
+
+    Returns:
+        The line without its trailing newline
+
+    Raises:
+        EOFError: If the input has ended
+    """
+    stdin = sys.stdin
+    if stdin is None or stdin.isatty():
+        return input(prompt)
+    sys.stdout.write(prompt)
+    line = stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\n")
+
+
 def get_float_input(prompt, min_value=None, max_value=None, allow_zero=True):
     """
     Get validated float input from user with retry logic
@@ -28,7 +63,12 @@ def get_float_input(prompt, min_value=None, max_value=None, allow_zero=True):
     """
     while True:
         try:
-            value = float(input(prompt))
+            text = _read_line(prompt).strip()
+            # Cheap syntax check first, so typos do not go through an exception
+            if _FLOAT_RE.fullmatch(text) is None:
+                print("  [!] Error: Please enter a valid number.")
+                continue
+            value = float(text)
 
             # Validate range
             if not allow_zero and value == 0:
@@ -47,7 +87,7 @@ def get_float_input(prompt, min_value=None, max_value=None, allow_zero=True):
 
         except ValueError:
             print("  [!] Error: Please enter a valid number.")
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, EOFError):
             print("\n\nOperation cancelled by user.")
             raise
 
@@ -66,7 +106,12 @@ def get_int_input(prompt, min_value=None, max_value=None):
     """
     while True:
         try:
-            value = int(input(prompt))
+            text = _read_line(prompt).strip()
+            # Cheap syntax check first, so typos do not go through an exception
+            if not (text.isdigit() or (text[:1] in "+-" and text[1:].isdigit())):
+                print("  [!] Error: Please enter a valid integer.")
+                continue
+            value = int(text)
 
             # Validate range
             if min_value is not None and value < min_value:
@@ -81,7 +126,7 @@ def get_int_input(prompt, min_value=None, max_value=None):
 
         except ValueError:
             print("  [!] Error: Please enter a valid integer.")
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, EOFError):
             print("\n\nOperation cancelled by user.")
             raise
 
@@ -126,7 +171,7 @@ def select_pn_grade_interactive(pipe_designation):
 
     # Get user selection
     while True:
-        choice_input = input(f"\nSelect PN grade (1-{len(pn_options)}) or press Enter for default [PN10]: ").strip()
+        choice_input = _read_line(f"\nSelect PN grade (1-{len(pn_options)}) or press Enter for default [PN10]: ").strip()
 
         # Default to PN10
         if choice_input == "":
@@ -149,11 +194,28 @@ def select_pn_grade_interactive(pipe_designation):
                 print(f"  [!] Error: Please enter a number between 1 and {len(pn_options)}.")
         except ValueError:
             print("  [!] Error: Please enter a valid number or press Enter for default.")
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, EOFError):
             print("\n\nOperation cancelled by user. Using default PN10.")
             return "PN10"
 
 
+@lru_cache(maxsize=64)
+def _dashes(n):
+    """A run of n pipe characters (widths are small, so redraws reuse them)"""
+    return "-" * n
+
+
+@lru_cache(maxsize=64)
+def _dripper_segment(num_drippers):
+    """Diagram segment of an irrigation zone: one evenly spaced "+" per dripper"""
+    segment_width = max(12, min(num_drippers * 2, 30))
+    dripper_spacing = max(1, segment_width // num_drippers)
+    segment = "+" + (_dashes(dripper_spacing - 1) + "+") * (num_drippers - 1)
+
+    # Padded with pipe up to the segment width
+    return segment + _dashes(segment_width - len(segment))
+
+
 def draw_artery_ascii(artery, show_flows=True):
     """
     Draw ASCII diagram of the artery configuration
@@ -172,10 +234,14 @@ def draw_artery_ascii(artery, show_flows=True):
     lines.append("\n  Artery Configuration:")
     lines.append("  " + "="*56)
 
-    # Build diagram
-    top_line = "  PUMP <-"
-    main_line = "         "
-    bottom_line = "         "
+    # Build diagram: each line is collected as a list of parts and joined once
+    top_parts = ["  PUMP <-"]
+    main_parts = ["         "]
+    bottom_parts = ["         "]
+
+    # Unit labels, looked up once for all zones
+    length_unit = config.length_unit
+    flow_unit = config.flow_unit
 
     cumulative_flow = artery.total_flow if show_flows else None
 
@@ -185,41 +251,35 @@ def draw_artery_ascii(artery, show_flows=True):
         if zone.zone_type == "transport":
             # Transport zone representation
             length_display = int(zone.length) if zone.length < 100 else 99
-            segment_width = max(8, min(length_display // 5, 20))
-            segment = "-" * segment_width
+            segment = _dashes(max(8, min(length_display // 5, 20)))
 
-            top_line += segment + "-"
-            main_line += f" T{zone_num}({zone.length}{config.length_unit}) "
+            main_parts.append(f" T{zone_num}({zone.length}{length_unit}) ")
             if cumulative_flow is not None:
-                bottom_line += f" {cumulative_flow:.0f}{config.flow_unit} ".center(len(segment) + 1)
+                bottom_label = f" {cumulative_flow:.0f}{flow_unit} "
             else:
-                bottom_line += " " * (len(segment) + 1)
+                bottom_label = ""
 
         else:  # irrigation zone
             # Irrigation zone representation
-            num_drippers = zone.num_drippers
-            segment_width = max(12, min(num_drippers * 2, 30))
-
-            # Create dripper visualization
-            dripper_spacing = max(1, segment_width // num_drippers)
-            segment = ""
-            for j in range(num_drippers):
-                if j == 0:
-                    segment += "+"
-                else:
-                    segment += "-" * (dripper_spacing - 1) + "+"
-            segment += "-" * (segment_width - len(segment))
-
-            top_line += segment + "-"
-            main_line += f" I{zone_num}({zone.num_drippers}d,{zone.length}{config.length_unit}) "
+            segment = _dripper_segment(zone.num_drippers)
+
+            main_parts.append(f" I{zone_num}({zone.num_drippers}d,{zone.length}{length_unit}) ")
 
             if cumulative_flow is not None:
                 flow_start = cumulative_flow
                 flow_end = cumulative_flow - zone.target_flow
-                bottom_line += f" {flow_start:.0f}->{flow_end:.0f}{config.flow_unit} ".center(len(segment) + 1)
+                bottom_label = f" {flow_start:.0f}->{flow_end:.0f}{flow_unit} "
                 cumulative_flow = flow_end
             else:
-                bottom_line += " " * (len(segment) + 1)
+                bottom_label = ""
+
+        # The flow label is centered under the segment and its joint
+        top_parts.append(segment + "-")
+        bottom_parts.append(bottom_label.center(len(segment) + 1))
+
+    top_line = "".join(top_parts)
+    main_line = "".join(main_parts)
+    bottom_line = "".join(bottom_parts)
 
     lines.append(top_line)
     lines.append(main_line)
@@ -241,23 +301,27 @@ def display_zone_list(artery):
     if not artery.zones:
         print("  (No zones defined yet)")
     else:
-        total_irrigation_flow = 0
+        length_unit = config.length_unit
+        flow_unit = config.flow_unit
+
         for i, zone in enumerate(artery.zones, 1):
             if zone.zone_type == "transport":
-                print(f"  {i}. Transport: {zone.length} {config.length_unit}")
+                print(f"  {i}. Transport: {zone.length} {length_unit}")
             else:
-                print(f"  {i}. Irrigation: {zone.length} {config.length_unit}, "
-                      f"{zone.num_drippers} drippers, {zone.target_flow} {config.flow_unit}")
-                total_irrigation_flow += zone.target_flow
+                print(f"  {i}. Irrigation: {zone.length} {length_unit}, "
+                      f"{zone.num_drippers} drippers, {zone.target_flow} {flow_unit}")
+
+        total_flow = artery.total_flow
+        total_irrigation_flow = sum(zone.target_flow for zone in artery.zones if zone.zone_type != "transport")
 
         print("  " + "-"*56)
-        print(f"  Total flow specified: {artery.total_flow} {config.flow_unit}")
-        print(f"  Sum of irrigation flows: {total_irrigation_flow} {config.flow_unit}")
+        print(f"  Total flow specified: {total_flow} {flow_unit}")
+        print(f"  Sum of irrigation flows: {total_irrigation_flow} {flow_unit}")
 
         # Flow balance check
-        flow_diff = abs(artery.total_flow - total_irrigation_flow)
-        if flow_diff > artery.total_flow * 0.01:  # More than 1% difference
-            print(f"  [!] WARNING: Flow imbalance of {flow_diff:.1f} {config.flow_unit}")
+        flow_diff = abs(total_flow - total_irrigation_flow)
+        if flow_diff > total_flow * 0.01:  # More than 1% difference
+            print(f"  [!] WARNING: Flow imbalance of {flow_diff:.1f} {flow_unit}")
 
 
 def review_and_edit_artery(artery):
@@ -289,7 +353,7 @@ def review_and_edit_artery(artery):
         print("  [R] Restart - Clear all zones and start over")
         print("  [Q] Quit - Exit without calculating")
 
-        choice = input("\n  Select option: ").strip().upper()
+        choice = _read_line("\n  Select option: ").strip().upper()
 
         if choice == 'C':
             if not artery.zones:
@@ -313,7 +377,7 @@ def review_and_edit_artery(artery):
             delete_zone_interactive(artery)
 
         elif choice == 'R':
-            confirm = input("  Are you sure you want to clear all zones? (yes/no): ").strip().lower()
+            confirm = _read_line("  Are you sure you want to clear all zones? (yes/no): ").strip().lower()
             if confirm in ['yes', 'y']:
                 artery.zones.clear()
                 print("  [OK] All zones cleared.")
@@ -325,31 +389,58 @@ def review_and_edit_artery(artery):
             print("  [!] Invalid option. Please try again.")
 
 
-def add_zone_interactive(artery):
-    """Interactively add a zone to the artery"""
-    print("\n  Add Zone")
-    print("  --------")
-    print("  Type: [T]ransport, [I]rrigation, or [C]ancel")
+@lru_cache(maxsize=8)
+def _zone_prompts(length_unit, flow_unit):
+    """Length and zone flow prompts for the configured units (built once per unit pair)"""
+    return (f"  Enter length (in {length_unit}): ",
+            f"  Enter target flow for this zone (in {flow_unit}): ")
 
-    zone_type = input("  > ").strip().lower()
 
-    # Handle abbreviations
+def _input_zone(artery, zone_type):
+    """
+    Prompt for the values of a zone and add it to the artery
+
+    Args:
+        artery: DrippingArtery object
+        zone_type: Zone type as typed by the user ('t'/'transport' or 'i'/'irrigation')
+
+    Returns:
+        True if a zone was added, False if zone_type is not a zone type
+    """
+    length_unit = config.length_unit
+    flow_unit = config.flow_unit
+    length_prompt, zone_flow_prompt = _zone_prompts(length_unit, flow_unit)
+
     if zone_type in ['t', 'transport']:
-        length = get_float_input(f"  Enter length (in {config.length_unit}): ", min_value=0.001, allow_zero=False)
+        length = get_float_input(length_prompt, min_value=0.001, allow_zero=False)
         artery.add_zone(TransportZone(length))
-        print(f"  [OK] Added transport zone: {length} {config.length_unit}")
+        print(f"  [OK] Added transport zone: {length} {length_unit}")
 
     elif zone_type in ['i', 'irrigation']:
-        length = get_float_input(f"  Enter length (in {config.length_unit}): ", min_value=0.001, allow_zero=False)
+        length = get_float_input(length_prompt, min_value=0.001, allow_zero=False)
         num_drippers = get_int_input("  Enter number of drippers: ", min_value=1)
-        target_flow = get_float_input(f"  Enter target flow for this zone (in {config.flow_unit}): ",
-                                      min_value=0.001, allow_zero=False)
+        target_flow = get_float_input(zone_flow_prompt, min_value=0.001, allow_zero=False)
         artery.add_zone(IrrigationZone(length, num_drippers, target_flow))
-        print(f"  [OK] Added irrigation zone: {length} {config.length_unit}, {num_drippers} drippers, {target_flow} {config.flow_unit}")
+        print(f"  [OK] Added irrigation zone: {length} {length_unit}, "
+              f"{num_drippers} drippers, {target_flow} {flow_unit}")
 
-    elif zone_type in ['c', 'cancel']:
-        print("  [OK] Cancelled.")
     else:
+        return False
+    return True
+
+
+def add_zone_interactive(artery):
+    """Interactively add a zone to the artery"""
+    print("\n  Add Zone")
+    print("  --------")
+    print("  Type: [T]ransport, [I]rrigation, or [C]ancel")
+
+    zone_type = _read_line("  > ").strip().lower()
+
+    # Handle abbreviations
+    if zone_type in ['c', 'cancel']:
+        print("  [OK] Cancelled.")
+    elif not _input_zone(artery, zone_type):
         print("  [!] Invalid zone type.")
 
 
@@ -395,7 +486,7 @@ def delete_zone_interactive(artery):
     else:
         print(f"  Deleting: Irrigation zone, {zone.length} {config.length_unit}, {zone.num_drippers} drippers")
 
-    confirm = input("  Confirm deletion? (yes/no): ").strip().lower()
+    confirm = _read_line("  Confirm deletion? (yes/no): ").strip().lower()
     if confirm in ['yes', 'y']:
         artery.zones.pop(zone_idx)
         print(f"  [OK] Zone {zone_num} deleted.")
@@ -415,7 +506,7 @@ def run_dripping_artery_wizard():
     print("Press Enter to use default, or enter temperature (0-100C).")
 
     while True:
-        temp_input = input("Water temperature (C) [20]: ").strip()
+        temp_input = _read_line("Water temperature (C) [20]: ").strip()
 
         if temp_input == "":
             # Use default 20°C
@@ -444,12 +535,15 @@ def run_dripping_artery_wizard():
         allow_zero=False
     )
 
-    # Get pipe designation with validation
+    # Get pipe designation with validation (catalog listed and indexed once)
+    available_pipes = list_available_pipes()
+    available_pipes_display = ", ".join(available_pipes)
+    known_pipes = frozenset(available_pipes)
     while True:
-        print(f"\nAvailable pipes: {', '.join(list_available_pipes())}")
-        pipe_designation = input("Enter pipe designation (e.g., N20): ").strip().upper()
+        print(f"\nAvailable pipes: {available_pipes_display}")
+        pipe_designation = _read_line("Enter pipe designation (e.g., N20): ").strip().upper()
 
-        if pipe_designation in list_available_pipes():
+        if pipe_designation in known_pipes:
             break
         else:
             print(f"[!] Invalid pipe designation: {pipe_designation}")
@@ -471,41 +565,12 @@ def run_dripping_artery_wizard():
 
     while True:
         print(f"\nZone {len(artery.zones) + 1}")
-        zone_type = input("Enter type (t/i/d): ").strip().lower()
+        zone_type = _read_line("Enter type (t/i/d): ").strip().lower()
 
         # Handle abbreviations and full names
         if zone_type in ['d', 'done']:
             break
-
-        elif zone_type in ['t', 'transport']:
-            length = get_float_input(
-                f"  Enter length (in {config.length_unit}): ",
-                min_value=0.001,
-                allow_zero=False
-            )
-            artery.add_zone(TransportZone(length))
-            print(f"  [OK] Added transport zone: {length} {config.length_unit}")
-
-        elif zone_type in ['i', 'irrigation']:
-            length = get_float_input(
-                f"  Enter length (in {config.length_unit}): ",
-                min_value=0.001,
-                allow_zero=False
-            )
-            num_drippers = get_int_input(
-                "  Enter number of drippers: ",
-                min_value=1
-            )
-            target_flow = get_float_input(
-                f"  Enter target flow for this zone (in {config.flow_unit}): ",
-                min_value=0.001,
-                allow_zero=False
-            )
-            artery.add_zone(IrrigationZone(length, num_drippers, target_flow))
-            print(f"  [OK] Added irrigation zone: {length} {config.length_unit}, "
-                  f"{num_drippers} drippers, {target_flow} {config.flow_unit}")
-
-        else:
+        elif not _input_zone(artery, zone_type):
             print("  [!] Invalid input. Please enter 't' (transport), 'i' (irrigation), or 'd' (done).")
 
     # Review and edit phase
@@ -543,77 +608,88 @@ def run_dripping_artery_wizard():
 
 def display_results(results, artery, dn_comparison=None):
     """Display calculation results"""
-    print("\n" + "="*60)
-    print("RESULTS")
-    print("="*60)
+    # Unit settings and conversion, looked up once for all zones and DN sizes
+    conv = config.convert_pressure_from_m
+    pressure_unit = config.pressure_unit
 
-    print(f"\nPipe: {artery.pipe_designation}-{artery.pn_grade}")
-    print(f"PN Grade: {artery.pn_grade} ({artery.pn_grade[2:]} bar working pressure)")
-    print(f"Internal diameter: {results['diameter']*1000:.1f} mm")
-    print(f"Total length: {results['total_length']:.2f} m")
-    print(f"Initial flow: {artery.total_flow} {config.flow_unit}")
+    # The results block is collected and written at once (no prompt waits on it)
+    lines = []
+    add = lines.append
+
+    add("\n" + "="*60)
+    add("RESULTS")
+    add("="*60)
+
+    add(f"\nPipe: {artery.pipe_designation}-{artery.pn_grade}")
+    add(f"PN Grade: {artery.pn_grade} ({artery.pn_grade[2:]} bar working pressure)")
+    add(f"Internal diameter: {results['diameter']*1000:.1f} mm")
+    add(f"Total length: {results['total_length']:.2f} m")
+    add(f"Initial flow: {artery.total_flow} {config.flow_unit}")
 
     # Display DN comparison if available
     if dn_comparison:
-        print("\n--- DN Size Comparison ---")
-        print(f"(All comparisons use {artery.pn_grade} grade)")
-        print(f"{'Pipe DN':<10} {'PN Grade':<10} {'Int D (mm)':<12} {'Full Calc':<15} {'Christiansen':<15} {'Simplified':<15}")
-        print("-" * 80)
+        add("\n--- DN Size Comparison ---")
+        add(f"(All comparisons use {artery.pn_grade} grade)")
+        add(f"{'Pipe DN':<10} {'PN Grade':<10} {'Int D (mm)':<12} {'Full Calc':<15} {'Christiansen':<15} {'Simplified':<15}")
+        add("-" * 80)
         for dn_result in dn_comparison:
             pipe_dn = dn_result['pipe_designation']
             pn_grade = dn_result.get('pn_grade', 'PN10')
             internal_d = dn_result['internal_diameter_mm']
-            full_loss = config.convert_pressure_from_m(dn_result['full_calculation'])
-            christiansen_loss = config.convert_pressure_from_m(dn_result['christiansen']) if dn_result['christiansen'] else None
-            simplified_loss = config.convert_pressure_from_m(dn_result['simplified'])
+            full_loss = conv(dn_result['full_calculation'])
+            christiansen_loss = conv(dn_result['christiansen']) if dn_result['christiansen'] else None
+            simplified_loss = conv(dn_result['simplified'])
 
             chris_str = f"{christiansen_loss:.4f}" if christiansen_loss else "N/A"
             marker = " *" if dn_result['is_selected'] else ""
 
-            print(f"{pipe_dn:<10}{marker} {pn_grade:<10} {internal_d:<12.1f} {full_loss:<15.4f} {chris_str:<15} {simplified_loss:<15.4f}")
-        print(f"\n* = Selected pipe (all values in {config.pressure_unit})")
+            add(f"{pipe_dn:<10}{marker} {pn_grade:<10} {internal_d:<12.1f} {full_loss:<15.4f} {chris_str:<15} {simplified_loss:<15.4f}")
+        add(f"\n* = Selected pipe (all values in {pressure_unit})")
 
-    print("\n--- Zone-by-Zone Results ---")
+    add("\n--- Zone-by-Zone Results ---")
     for result in results['zones']:
         if result['zone_type'] == 'transport':
-            print(f"\nTransport Zone {result['zone_number']}:")
-            print(f"  Length: {result['length']:.2f} m")
-            print(f"  Flow: {result['flow_m3s']*3600000:.1f} l/h ({result['velocity']:.3f} m/s)")
-            print(f"  Reynolds: {result['reynolds']:.0f} ({result['flow_regime']})")
-            print(f"  Friction factor: {result['friction_factor']:.6f}")
-            print(f"  Head loss: {config.convert_pressure_from_m(result['head_loss']):.3f} {config.pressure_unit}")
-            print(f"  Cumulative head loss: {config.convert_pressure_from_m(result['cumulative_head_loss']):.3f} {config.pressure_unit}")
+            add(f"\nTransport Zone {result['zone_number']}:")
+            add(f"  Length: {result['length']:.2f} m")
+            add(f"  Flow: {result['flow_m3s']*3600000:.1f} l/h ({result['velocity']:.3f} m/s)")
+            add(f"  Reynolds: {result['reynolds']:.0f} ({result['flow_regime']})")
+            add(f"  Friction factor: {result['friction_factor']:.6f}")
+            add(f"  Head loss: {conv(result['head_loss']):.3f} {pressure_unit}")
+            add(f"  Cumulative head loss: {conv(result['cumulative_head_loss']):.3f} {pressure_unit}")
             if not result['is_valid']:
-                print("  [!] WARNING: Flow regime not suitable for Darcy-Weisbach!")
+                add("  [!] WARNING: Flow regime not suitable for Darcy-Weisbach!")
         else:
-            print(f"\nIrrigation Zone {result['zone_number']}:")
-            print(f"  Length: {result['length']:.2f} m")
-            print(f"  Number of drippers: {result['num_drippers']}")
-            print(f"  Flow (start -> end): {result['flow_start_m3s']*3600000:.1f} -> {result['flow_end_m3s']*3600000:.1f} l/h")
-            print(f"  Head loss: {config.convert_pressure_from_m(result['head_loss']):.3f} {config.pressure_unit}")
-            print(f"  Cumulative head loss: {config.convert_pressure_from_m(result['cumulative_head_loss']):.3f} {config.pressure_unit}")
+            add(f"\nIrrigation Zone {result['zone_number']}:")
+            add(f"  Length: {result['length']:.2f} m")
+            add(f"  Number of drippers: {result['num_drippers']}")
+            add(f"  Flow (start -> end): {result['flow_start_m3s']*3600000:.1f} -> {result['flow_end_m3s']*3600000:.1f} l/h")
+            add(f"  Head loss: {conv(result['head_loss']):.3f} {pressure_unit}")
+            add(f"  Cumulative head loss: {conv(result['cumulative_head_loss']):.3f} {pressure_unit}")
             if not result['is_valid']:
-                print("  [!] WARNING: Some segments have unsuitable flow regime!")
+                add("  [!] WARNING: Some segments have unsuitable flow regime!")
 
-    print("\n--- Calculation Method Comparison ---")
-    total_loss = config.convert_pressure_from_m(results['total_head_loss'])
+    add("\n--- Calculation Method Comparison ---")
+    total_loss = conv(results['total_head_loss'])
 
-    print(f"\n1. Full Segment-by-Segment Calculation:")
-    print(f"   Total head loss: {total_loss:.4f} {config.pressure_unit}")
+    add(f"\n1. Full Segment-by-Segment Calculation:")
+    add(f"   Total head loss: {total_loss:.4f} {pressure_unit}")
 
     if results.get('christiansen'):
         chris = results['christiansen']
-        chris_loss = config.convert_pressure_from_m(chris['head_loss'])
-        print(f"\n2. Christiansen Approximation:")
-        print(f"   Christiansen coefficient (F): {chris['christiansen_coefficient']:.4f}")
-        print(f"   Number of outlets: {chris['num_outlets']}")
-        print(f"   Total head loss: {chris_loss:.4f} {config.pressure_unit}")
+        chris_loss = conv(chris['head_loss'])
+        add(f"\n2. Christiansen Approximation:")
+        add(f"   Christiansen coefficient (F): {chris['christiansen_coefficient']:.4f}")
+        add(f"   Number of outlets: {chris['num_outlets']}")
+        add(f"   Total head loss: {chris_loss:.4f} {pressure_unit}")
 
         difference = abs(total_loss - chris_loss)
         pct_diff = (difference / total_loss * 100) if total_loss > 0 else 0
-        print(f"\n   Difference: {difference:.4f} {config.pressure_unit} ({pct_diff:.2f}%)")
+        add(f"\n   Difference: {difference:.4f} {pressure_unit} ({pct_diff:.2f}%)")
+
+    simplified_loss = conv(results['simplified_head_loss'])
+    add(f"\n3. Simplified Model (constant flow):")
+    simplified_difference = abs(total_loss - simplified_loss)
+    add(f"   Total head loss: {simplified_loss:.3f} {pressure_unit}")
+    add(f"   Difference from full calculation: {simplified_difference:.3f} {pressure_unit} ({simplified_difference/total_loss*100:.1f}%)")
 
-    simplified_loss = config.convert_pressure_from_m(results['simplified_head_loss'])
-    print(f"\n3. Simplified Model (constant flow):")
-    print(f"   Total head loss: {simplified_loss:.3f} {config.pressure_unit}")
-    print(f"   Difference from full calculation: {abs(total_loss - simplified_loss):.3f} {config.pressure_unit} ({abs(total_loss - simplified_loss)/total_loss*100:.1f}%)")
+    sys.stdout.write("\n".join(lines) + "\n")
@@ -1,5 +1,10 @@
 """Unit conversion utilities"""
 
+# Conversion factors: value in unit * factor = value in the base unit
+_FLOW_FACTORS = {"m3/s": 1.0, "l/s": 1.0 / 1000.0, "l/h": 1.0 / 3600000.0}  # to m³/s
+_LENGTH_FACTORS = {"m": 1.0, "mm": 1.0 / 1000.0}  # to m
+_PRESSURE_FACTORS = {"mwc": 1.0, "bar": 0.0980665, "atm": 0.0967841}  # from mwc (1 mwc = 0.0980665 bar)
+
 
 def convert_flow_to_m3s(flow, from_unit):
     """
@@ -12,14 +17,10 @@ def convert_flow_to_m3s(flow, from_unit):
     Returns:
         Flow rate in m³/s
     """
-    if from_unit == "m3/s":
-        return flow
-    elif from_unit == "l/s":
-        return flow / 1000.0
-    elif from_unit == "l/h":
-        return flow / 3600000.0
-    else:
-        raise ValueError(f"Unknown flow unit: {from_unit}")
+    try:
+        return flow * _FLOW_FACTORS[from_unit]
+    except KeyError:
+        raise ValueError(f"Unknown flow unit: {from_unit}") from None
 
 
 def convert_length_to_m(length, from_unit):
@@ -33,12 +34,10 @@ def convert_length_to_m(length, from_unit):
     Returns:
         Length in meters
     """
-    if from_unit == "m":
-        return length
-    elif from_unit == "mm":
-        return length / 1000.0
-    else:
-        raise ValueError(f"Unknown length unit: {from_unit}")
+    try:
+        return length * _LENGTH_FACTORS[from_unit]
+    except KeyError:
+        raise ValueError(f"Unknown length unit: {from_unit}") from None
 
 
 def convert_pressure_from_m(pressure_m, to_unit):
@@ -52,11 +51,7 @@ def convert_pressure_from_m(pressure_m, to_unit):
     Returns:
         Pressure in target unit
     """
-    if to_unit == "mwc":
-        return pressure_m
-    elif to_unit == "bar":
-        return pressure_m * 0.0980665  # 1 mwc = 0.0980665 bar
-    elif to_unit == "atm":
-        return pressure_m * 0.0967841  # 1 mwc = 0.0967841 atm
-    else:
-        raise ValueError(f"Unknown pressure unit: {to_unit}")
+    try:
+        return pressure_m * _PRESSURE_FACTORS[to_unit]
+    except KeyError:
+        raise ValueError(f"Unknown pressure unit: {to_unit}") from None
@@ -6,9 +6,13 @@ This script tests the new pump pressure range table functionality
 that shows min/max pump pressures across different DN sizes.
 """
 
-from hydraulics.models import DrippingArtery, TransportZone, IrrigationZone
+import sys
+
 from hydraulics.io import config
-from hydraulics.io.reports import generate_report
+from hydraulics.io.reports import generate_report, pump_pressure_rows
+from tests._fixtures import STANDARD_TOTAL_FLOW, STANDARD_ZONES
+from tests._sweep_cache import dn_comparison as calculate_dn_comparison
+from tests._report_check import missing_markers
 
 def test_pump_pressure_table():
     """Test the pump pressure table feature"""
@@ -31,17 +35,9 @@ def test_pump_pressure_table():
     print("- Irrigation zone 2: 160 m, 125 drippers, 1000 l/h")
     print()
 
-    artery = DrippingArtery(total_flow=1500, pipe_designation="N20")
-
-    # Add zones
-    artery.add_zone(TransportZone(length=10))
-    artery.add_zone(IrrigationZone(length=80, num_drippers=12, target_flow=500))
-    artery.add_zone(TransportZone(length=50))
-    artery.add_zone(IrrigationZone(length=160, num_drippers=125, target_flow=1000))
-
-    # Calculate with DN comparison
+    # Calculate with DN comparison (memoized across the test scripts)
     print("Calculating with DN comparison...")
-    results_dict = artery.calculate_with_dn_comparison()
+    artery, results_dict = calculate_dn_comparison(STANDARD_TOTAL_FLOW, "N20", STANDARD_ZONES)
 
     selected_results = results_dict['selected']
     dn_comparison = results_dict['dn_comparison']
@@ -53,16 +49,16 @@ def test_pump_pressure_table():
     print(f"\n{'Pipe DN':<10} {'Internal D (mm)':<18} {'Min Pump (bar)':<18} {'Max Pump (bar)':<18}")
     print("-" * 64)
 
-    for dn_result in dn_comparison:
-        pipe_dn = dn_result['pipe_designation']
-        internal_d = dn_result['internal_diameter_mm']
-        head_loss = config.convert_pressure_from_m(dn_result['full_calculation'])
-
-        min_pump = 1.5 + head_loss
-        max_pump = 4.0 + head_loss
+    # Pump pressure range of every DN size, shared by the console table and the report
+    pump_rows = pump_pressure_rows(dn_comparison)
 
-        marker = "**" if dn_result['is_selected'] else "  "
-        print(f"{marker}{pipe_dn:<8}{marker} {internal_d:<18.1f} {min_pump:<18.2f} {max_pump:<18.2f}")
+    # Build the table rows and write them in one call
+    rows = []
+    for row in pump_rows:
+        marker = "**" if row.is_selected else "  "
+        rows.append(f"{marker}{row.pipe_designation:<8}{marker} {row.internal_diameter_mm:<18.1f} "
+                    f"{row.min_pump_pressure:<18.2f} {row.max_pump_pressure:<18.2f}")
+    sys.stdout.write("\n".join(rows) + "\n")
 
     print("\nNotes:")
     print("- ** indicates selected pipe")
@@ -73,24 +69,25 @@ def test_pump_pressure_table():
     # Generate full report
     print("\n" + "="*60)
     print("Generating full report with pump pressure table...")
-    report_path = generate_report(selected_results, artery, dn_comparison=dn_comparison)
+    report_path = generate_report(selected_results, artery, dn_comparison=dn_comparison, pump_rows=pump_rows)
     print(f"[OK] Report saved to: {report_path}")
     print("="*60)
 
-    # Verify the report contains the pump pressure table
-    with open(report_path, 'r', encoding='utf-8') as f:
-        report_content = f.read()
-        if "Required Pump Pressure by Pipe Diameter" in report_content:
-            print("\n[OK] Pump pressure table found in report!")
-        else:
-            print("\n[FAIL] Pump pressure table NOT found in report!")
-            return False
-
-        if "Min Pump Pressure" in report_content and "Max Pump Pressure" in report_content:
-            print("[OK] Table headers are correct!")
-        else:
-            print("[FAIL] Table headers are missing!")
-            return False
+    # Verify the report contains the pump pressure table (single streaming pass)
+    missing = missing_markers(report_path, {
+        "Required Pump Pressure by Pipe Diameter", "Min Pump Pressure", "Max Pump Pressure"
+    })
+    if "Required Pump Pressure by Pipe Diameter" not in missing:
+        print("\n[OK] Pump pressure table found in report!")
+    else:
+        print("\n[FAIL] Pump pressure table NOT found in report!")
+        return False
+
+    if "Min Pump Pressure" not in missing and "Max Pump Pressure" not in missing:
+        print("[OK] Table headers are correct!")
+    else:
+        print("[FAIL] Table headers are missing!")
+        return False
 
     return True
 
@@ -3,56 +3,49 @@
 Test script for pump pressure table with different unit systems
 """
 
-from hydraulics.models import DrippingArtery, TransportZone, IrrigationZone
+import sys
+
 from hydraulics.io import config
-from hydraulics.io.reports import generate_report
+from tests._fixtures import STANDARD_TOTAL_FLOW, STANDARD_ZONES
+from tests._sweep_cache import dn_comparison as calculate_dn_comparison
+
+# Dripper operating range (1.5-4 bar) in each pressure unit
+DRIPPER_REF = {
+    "bar": (1.5, 4.0),
+    "mwc": (1.5 / 0.0980665, 4.0 / 0.0980665),  # bar to mwc
+    "atm": (1.5 / 1.01325, 4.0 / 1.01325),  # bar to atm
+}
 
-def test_with_units(pressure_unit):
+
+def test_with_units(pressure_unit, dn_comparison):
     """Test pump pressure table with specific pressure unit"""
     print(f"\n{'='*60}")
     print(f"Testing with pressure unit: {pressure_unit}")
     print(f"{'='*60}")
 
-    # Configure units
-    config.set_flow_unit("l/h")
-    config.set_length_unit("m")
+    # Head losses are in meters; only their display unit changes
     config.set_pressure_unit(pressure_unit)
 
-    # Create test artery
-    artery = DrippingArtery(total_flow=1500, pipe_designation="N20")
-    artery.add_zone(TransportZone(length=10))
-    artery.add_zone(IrrigationZone(length=80, num_drippers=12, target_flow=500))
-    artery.add_zone(TransportZone(length=50))
-    artery.add_zone(IrrigationZone(length=160, num_drippers=125, target_flow=1000))
-
-    # Calculate with DN comparison
-    results_dict = artery.calculate_with_dn_comparison()
-    dn_comparison = results_dict['dn_comparison']
-
     # Display pump pressure table
     print(f"\n{'Pipe DN':<10} {'Min Pump':<15} {'Max Pump':<15}")
     print("-" * 40)
 
+    # Dripper pressures in the current unit, and the conversion bound once for all rows
+    min_dripper, max_dripper = DRIPPER_REF[pressure_unit]
+    _conv = config.convert_pressure_from_m
+
+    # Build the table rows and write them in one call
+    rows = []
     for dn_result in dn_comparison:
         pipe_dn = dn_result['pipe_designation']
-        head_loss = config.convert_pressure_from_m(dn_result['full_calculation'])
-
-        # Convert dripper pressures to current unit
-        if pressure_unit == "bar":
-            min_dripper = 1.5
-            max_dripper = 4.0
-        elif pressure_unit == "mwc":
-            min_dripper = 1.5 / 0.0980665  # bar to mwc
-            max_dripper = 4.0 / 0.0980665
-        elif pressure_unit == "atm":
-            min_dripper = 1.5 / 1.01325  # bar to atm
-            max_dripper = 4.0 / 1.01325
+        head_loss = _conv(dn_result['full_calculation'])
 
         min_pump = min_dripper + head_loss
         max_pump = max_dripper + head_loss
 
         marker = "**" if dn_result['is_selected'] else "  "
-        print(f"{marker}{pipe_dn:<8}{marker} {min_pump:<15.2f} {max_pump:<15.2f}")
+        rows.append(f"{marker}{pipe_dn:<8}{marker} {min_pump:<15.2f} {max_pump:<15.2f}")
+    sys.stdout.write("\n".join(rows) + "\n")
 
     print(f"\nUnit: {pressure_unit}")
     return True
@@ -60,9 +53,15 @@ def test_with_units(pressure_unit):
 
 if __name__ == "__main__":
     try:
+        # Configure units and calculate once; the sweep does not depend on the pressure unit
+        config.set_flow_unit("l/h")
+        config.set_length_unit("m")
+        _, results_dict = calculate_dn_comparison(STANDARD_TOTAL_FLOW, "N20", STANDARD_ZONES)
+        dn_comparison = results_dict['dn_comparison']
+
         # Test with all supported pressure units
         for unit in ["bar", "mwc", "atm"]:
-            test_with_units(unit)
+            test_with_units(unit, dn_comparison)
 
         print("\n" + "="*60)
         print("[OK] ALL UNIT TESTS PASSED")
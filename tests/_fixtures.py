@@ -0,0 +1,26 @@
+"""Shared test artery used by the tests and the pump pressure scripts"""
+
+from hydraulics.models import DrippingArtery, TransportZone, IrrigationZone
+
+# 1500 l/h: transport 10 m, irrigation 80 m (12 drippers, 500 l/h),
+# transport 50 m, irrigation 160 m (125 drippers, 1000 l/h)
+STANDARD_TOTAL_FLOW = 1500
+STANDARD_ZONES = ((10,), (80, 12, 500), (50,), (160, 125, 1000))
+
+
+def build_zone(spec):
+    """Zone from a (length,) transport or (length, num_drippers, target_flow) irrigation tuple"""
+    return TransportZone(*spec) if len(spec) == 1 else IrrigationZone(*spec)
+
+
+def standard_artery(pipe_designation="N20", pn_grade="PN10"):
+    """
+    The standard test artery on the given pipe
+
+    A new artery is built on every call, so callers may modify it; building
+    it is cheaper than copying a cached one.
+    """
+    artery = DrippingArtery(total_flow=STANDARD_TOTAL_FLOW, pipe_designation=pipe_designation, pn_grade=pn_grade)
+    for spec in STANDARD_ZONES:
+        artery.add_zone(build_zone(spec))
+    return artery
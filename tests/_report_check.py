@@ -0,0 +1,42 @@
+"""Report content checks shared by the tests and the report scripts"""
+
+import functools
+import re
+
+
+@functools.lru_cache(maxsize=16)
+def _marker_pattern(markers):
+    """Compile one regex matching any of a frozenset of markers"""
+    return re.compile("|".join(map(re.escape, sorted(markers, key=len, reverse=True))))
+
+
+def missing_markers(report_path, markers):
+    """
+    Scan a report line by line for marker strings
+
+    All markers are searched with one compiled regex, so each line is scanned
+    once however many markers there are; only lines with a hit are checked
+    marker by marker. Reading stops as soon as every marker has been seen.
+    Markers must not span lines.
+
+    Args:
+        report_path: Path of the report file
+        markers: Iterable of strings to look for
+
+    Returns:
+        Set of the markers that do not occur in the report
+    """
+    missing = set(markers)
+    if not missing:
+        return missing
+    pattern = _marker_pattern(frozenset(missing))
+    with open(report_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if pattern.search(line) is None:
+                continue
+            # Markers may overlap or contain each other, so confirm each one
+            found = [marker for marker in missing if marker in line]
+            missing.difference_update(found)
+            if not missing:
+                break
+    return missing
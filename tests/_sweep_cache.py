@@ -0,0 +1,39 @@
+"""Memoized DN comparison sweeps shared by the test scripts"""
+
+import functools
+
+from hydraulics.core.properties import WaterProperties
+from hydraulics.io.config import config
+from hydraulics.models import DrippingArtery
+from tests._fixtures import build_zone
+
+
+def dn_comparison(total_flow, pipe_designation, zones, pn_grade="PN10"):
+    """
+    Build an artery and calculate its DN comparison, once per configuration
+
+    Head losses are in meters, so the result does not depend on the pressure
+    unit; it is keyed on the flow and length units and the water viscosity.
+
+    Args:
+        total_flow: Total flow in the configured flow unit
+        pipe_designation: String like "N20", "N40"
+        zones: Sequence of (length,) transport and (length, num_drippers,
+            target_flow) irrigation zone tuples, in configured units
+        pn_grade: PN grade of all compared pipes
+
+    Returns:
+        Tuple (artery, calculate_with_dn_comparison() result); shared between
+        callers, so it must not be modified
+    """
+    return _dn_comparison(config.flow_unit, config.length_unit, WaterProperties.kinematic_viscosity,
+                          total_flow, pipe_designation, pn_grade, tuple(map(tuple, zones)))
+
+
+@functools.lru_cache(maxsize=16)
+def _dn_comparison(flow_unit, length_unit, kinematic_viscosity, total_flow, pipe_designation, pn_grade, zones):
+    """Calculate a DN comparison (memoized on the configuration)"""
+    artery = DrippingArtery(total_flow=total_flow, pipe_designation=pipe_designation, pn_grade=pn_grade)
+    for zone in zones:
+        artery.add_zone(build_zone(zone))
+    return artery, artery.calculate_with_dn_comparison()
@@ -13,10 +13,15 @@ This test demonstrates the new multi-DN comparison feature that calculates
 head losses for adjacent pipe sizes.
 """
 
-from hydraulics.models import DrippingArtery, TransportZone, IrrigationZone
+import sys
+
+import numpy as np
+
 from hydraulics.io import config
 from hydraulics.io.reports import generate_report
 from hydraulics.core.properties import display_water_properties
+from tests._fixtures import STANDARD_TOTAL_FLOW, STANDARD_ZONES
+from tests._sweep_cache import dn_comparison as calculate_dn_comparison
 
 
 def run_dn_comparison_test():
@@ -43,17 +48,9 @@ def run_dn_comparison_test():
     print("- Irrigation zone 2: 160 m, 125 drippers, 1000 l/h")
     print()
 
-    artery = DrippingArtery(total_flow=1500, pipe_designation="N40")
-
-    # Add zones
-    artery.add_zone(TransportZone(length=10))
-    artery.add_zone(IrrigationZone(length=80, num_drippers=12, target_flow=500))
-    artery.add_zone(TransportZone(length=50))
-    artery.add_zone(IrrigationZone(length=160, num_drippers=125, target_flow=1000))
-
-    # Calculate with DN comparison
+    # Calculate with DN comparison (memoized across the test scripts)
     print("Calculating with DN comparison...")
-    comparison_results = artery.calculate_with_dn_comparison()
+    artery, comparison_results = calculate_dn_comparison(STANDARD_TOTAL_FLOW, "N40", STANDARD_ZONES)
     results = comparison_results['selected']
     dn_comparison = comparison_results['dn_comparison']
 
@@ -71,31 +68,40 @@ def run_dn_comparison_test():
     print("\n--- DN Size Comparison ---")
     print(f"{'Pipe DN':<10} {'Int D (mm)':<12} {'Full Calc':<15} {'Christiansen':<15} {'Simplified':<15}")
     print("-" * 70)
-    for dn_result in dn_comparison:
+    # Bind the pressure conversion and unit once for the tables and summary
+    _conv = config.convert_pressure_from_m
+    _punit = config.pressure_unit
+
+    # Convert the loss columns of all DN sizes in one array pass (NaN = no Christiansen result)
+    losses = np.array([(dn_result['full_calculation'], dn_result['christiansen'] or np.nan, dn_result['simplified'])
+                       for dn_result in dn_comparison], dtype=np.float64)
+    losses *= _conv(1.0)
+
+    # Build the table rows and write them in one call
+    rows = []
+    for dn_result, (full_loss, christiansen_loss, simplified_loss) in zip(dn_comparison, losses):
         pipe_dn = dn_result['pipe_designation']
         internal_d = dn_result['internal_diameter_mm']
-        full_loss = config.convert_pressure_from_m(dn_result['full_calculation'])
-        christiansen_loss = config.convert_pressure_from_m(dn_result['christiansen']) if dn_result['christiansen'] else None
-        simplified_loss = config.convert_pressure_from_m(dn_result['simplified'])
 
-        chris_str = f"{christiansen_loss:.4f}" if christiansen_loss else "N/A"
+        chris_str = "N/A" if np.isnan(christiansen_loss) else f"{christiansen_loss:.4f}"
         marker = " *" if dn_result['is_selected'] else ""
 
-        print(f"{pipe_dn:<10}{marker} {internal_d:<12.1f} {full_loss:<15.4f} {chris_str:<15} {simplified_loss:<15.4f}")
+        rows.append(f"{pipe_dn:<10}{marker} {internal_d:<12.1f} {full_loss:<15.4f} {chris_str:<15} {simplified_loss:<15.4f}")
+    sys.stdout.write("\n".join(rows) + "\n")
 
-    print(f"\n* = Selected pipe (all values in {config.pressure_unit})")
+    print(f"\n* = Selected pipe (all values in {_punit})")
 
     # Display summary for selected pipe
-    total_loss = config.convert_pressure_from_m(results['total_head_loss'])
+    total_loss = _conv(results['total_head_loss'])
     print(f"\n--- Selected Pipe ({artery.pipe_designation}) Summary ---")
-    print(f"Total head loss (full calculation): {total_loss:.4f} {config.pressure_unit}")
+    print(f"Total head loss (full calculation): {total_loss:.4f} {_punit}")
 
     if results.get('christiansen'):
         chris = results['christiansen']
-        chris_loss = config.convert_pressure_from_m(chris['head_loss'])
+        chris_loss = _conv(chris['head_loss'])
         difference = abs(total_loss - chris_loss)
         pct_diff = (difference / total_loss * 100) if total_loss > 0 else 0
-        print(f"Christiansen approximation: {chris_loss:.4f} {config.pressure_unit} (diff: {pct_diff:.2f}%)")
+        print(f"Christiansen approximation: {chris_loss:.4f} {_punit} (diff: {pct_diff:.2f}%)")
 
     print("\n--- Dripper Pressure Check ---")
     print("Pressure-compensated drippers require 1.5-4 bar to function properly.")
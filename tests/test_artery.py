@@ -0,0 +1,120 @@
+"""Tests for the dripping artery model"""
+
+import pytest
+from hydraulics.core.properties import WaterProperties
+from hydraulics.models.zones import TransportZone, IrrigationZone, ZoneKind
+from tests._fixtures import standard_artery
+from tests._sweep_cache import dn_comparison
+
+
+def _artery(pipe_designation="N40"):
+    """Two transport and two irrigation zones (1500 l/h)"""
+    return standard_artery(pipe_designation)
+
+
+class TestDNComparison:
+    """Test the multi-diameter comparison"""
+
+    def test_selected_matches_calculate(self):
+        """The shared zone layout gives the same result as a direct calculation"""
+        artery = _artery()
+        direct = artery.calculate()
+        selected = artery.calculate_with_dn_comparison()['selected']
+
+        assert selected['total_head_loss'] == pytest.approx(direct['total_head_loss'], rel=1e-12)
+        for ours, theirs in zip(selected['zones'], direct['zones']):
+            assert ours['head_loss'] == pytest.approx(theirs['head_loss'], rel=1e-12)
+            assert ours['cumulative_length'] == theirs['cumulative_length']
+
+    def test_larger_diameter_loses_less(self):
+        """Head loss decreases monotonically with the internal diameter"""
+        dn_results = _artery().calculate_with_dn_comparison()['dn_comparison']
+        by_diameter = sorted(dn_results, key=lambda r: r['internal_diameter_mm'])
+        losses = [r['full_calculation'] for r in by_diameter]
+
+        assert losses == sorted(losses, reverse=True)
+
+    def test_process_pool_matches_sequential(self):
+        """Worker processes use the parent's water properties"""
+        artery = _artery()
+        WaterProperties.set_temperature(35.0, force=True)
+        try:
+            sequential = artery.calculate_with_dn_comparison()['dn_comparison']
+            parallel = artery.calculate_with_dn_comparison(max_workers=2)['dn_comparison']
+        finally:
+            WaterProperties.reset_to_defaults()
+
+        for ours, theirs in zip(parallel, sequential):
+            assert ours['pipe_designation'] == theirs['pipe_designation']
+            assert ours['full_calculation'] == pytest.approx(theirs['full_calculation'], rel=1e-12)
+            assert ours['simplified'] == pytest.approx(theirs['simplified'], rel=1e-12)
+
+
+class TestZones:
+    """Test the zone records"""
+
+    def test_fixed_attributes(self):
+        """Zones have a fixed attribute set (__slots__)"""
+        zone = IrrigationZone(length=80, num_drippers=12, target_flow=500)
+        zone.target_flow = 600
+        assert zone.target_flow == 600
+        with pytest.raises(AttributeError):
+            zone.spacing = 0.3
+        assert not hasattr(TransportZone(length=10), "__dict__")
+
+    def test_compute_dispatch(self):
+        """Each zone class computes its own result from its prepared geometry"""
+        transport = TransportZone(length=10)
+        irrigation = IrrigationZone(length=80, num_drippers=12, target_flow=500)
+        geometry, flow_out = transport.prepare(1, 1e-3, 1.0, 1.0)
+        assert flow_out == 1e-3
+        result = transport.compute(geometry, 0.035, 1.5e-6, 0.0, 0.0)
+        assert result['zone_type'] == 'transport'
+        assert result['cumulative_head_loss'] == result['head_loss']
+
+        geometry, flow_out = irrigation.prepare(2, 1e-3, 1e-6, 1.0)
+        assert flow_out == pytest.approx(5e-4)
+        result = irrigation.compute(geometry, 0.035, 1.5e-6, 10.0, 0.5)
+        assert result['zone_type'] == 'irrigation'
+        assert len(result['segments']) == 12
+        assert result['cumulative_length'] == 90.0
+        assert result['cumulative_head_loss'] == pytest.approx(0.5 + result['head_loss'])
+
+    def test_drained_artery_ends_at_zero_flow(self):
+        """Rounding in the unit conversion does not leave a tiny (or negative) tail flow"""
+        for result in (_artery().calculate(),
+                       _artery().calculate_with_dn_comparison(approximate=True)['dn_comparison'][0]['full_result']):
+            assert result['zones'][-1]['flow_end_m3s'] == 0.0
+
+    def test_kind_tags(self):
+        """Zone kinds are integer tags matching the zone_type strings"""
+        assert TransportZone(length=10).kind == ZoneKind.TRANSPORT == 0
+        assert IrrigationZone(length=80, num_drippers=12, target_flow=500).kind == ZoneKind.IRRIGATION == 1
+        assert ZoneKind.TRANSPORT.name.lower() == TransportZone(length=10).zone_type
+
+    def test_approximate_comparison(self):
+        """Scaled DN sizes stay close to the exact calculation"""
+        artery = _artery()
+        exact = artery.calculate_with_dn_comparison()
+        approx = artery.calculate_with_dn_comparison(approximate=True)
+
+        assert approx['selected']['total_head_loss'] == exact['selected']['total_head_loss']
+        assert not approx['selected']['approximate']
+        for ours, theirs in zip(approx['dn_comparison'], exact['dn_comparison']):
+            assert ours['pipe_designation'] == theirs['pipe_designation']
+            assert ours['full_result']['approximate'] is not ours['is_selected']
+            assert ours['full_calculation'] == pytest.approx(theirs['full_calculation'], rel=1e-2)
+            assert ours['simplified'] == theirs['simplified']
+            for zone, exact_zone in zip(ours['full_result']['zones'], theirs['full_result']['zones']):
+                assert zone['is_valid'] == exact_zone['is_valid']
+
+
+class TestSweepCache:
+    """Test the memoized DN comparison used by the test scripts"""
+
+    def test_reused_per_configuration(self):
+        zones = [(10,), (80, 12, 500)]
+        first = dn_comparison(500, "N40", zones)
+        assert dn_comparison(500, "N40", tuple(zones)) is first
+        assert dn_comparison(500, "N32", zones) is not first
+        assert first[1]['selected']['total_head_loss'] == first[0].calculate()['total_head_loss']
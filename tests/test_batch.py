@@ -0,0 +1,49 @@
+"""Tests for the non-interactive batch interface"""
+
+import pytest
+from hydraulics.core.properties import WaterProperties
+from hydraulics.models.zones import TransportZone, IrrigationZone
+from hydraulics.ui.batch import DrippingArteryConfig, run_batch
+
+
+def _case(pipe_designation, temperature=None):
+    """Transport zone followed by one irrigation zone (1500 l/h)"""
+    zones = (TransportZone(length=10), IrrigationZone(length=80, num_drippers=12, target_flow=1500))
+    return DrippingArteryConfig(1500, pipe_designation, zones, temperature=temperature)
+
+
+class TestRunBatch:
+    """Test run_batch against direct artery calculations"""
+
+    def test_matches_direct_calculation(self):
+        """Each result equals calculate_with_dn_comparison on the built artery"""
+        cases = [_case("N20"), _case("N40")]
+        results = run_batch(cases)
+
+        for case, result in zip(cases, results):
+            direct = case.build_artery().calculate_with_dn_comparison()
+            assert result['selected']['total_head_loss'] == direct['selected']['total_head_loss']
+
+    def test_temperature_restored(self):
+        """Scenario temperatures do not leak into the caller's water properties"""
+        WaterProperties.reset_to_defaults()
+        warm, default = run_batch([_case("N20", temperature=40.0), _case("N20")])
+
+        assert WaterProperties.temperature == 20.0
+        assert warm['selected']['total_head_loss'] < default['selected']['total_head_loss']
+
+    def test_invalid_case_raises(self):
+        """Flow conservation errors propagate as ValueError"""
+        zones = (IrrigationZone(length=80, num_drippers=12, target_flow=500),)
+        with pytest.raises(ValueError):
+            run_batch([DrippingArteryConfig(1500, "N20", zones)])
+
+    def test_process_pool_matches_sequential(self):
+        """Worker processes give the same results as the sequential run"""
+        cases = [_case("N20"), _case("N25", temperature=35.0)]
+        sequential = run_batch(cases)
+        parallel = run_batch(cases, max_workers=2)
+
+        for ours, theirs in zip(parallel, sequential):
+            assert ours['selected']['total_head_loss'] == pytest.approx(
+                theirs['selected']['total_head_loss'], rel=1e-12)
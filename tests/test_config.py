@@ -0,0 +1,80 @@
+"""Tests for unit configuration"""
+
+import pytest
+from hydraulics.io.config import Config
+from hydraulics.utils.conversions import (
+    convert_flow_to_m3s,
+    convert_length_to_m,
+    convert_pressure_from_m
+)
+
+
+class TestConfigConversions:
+    """Test the cached conversion factors against the conversion utilities"""
+
+    @pytest.mark.parametrize("unit", ["m3/s", "l/s", "l/h"])
+    def test_flow(self, unit):
+        config = Config()
+        config.set_flow_unit(unit)
+        assert config.convert_flow_to_m3s(1500.0) == pytest.approx(convert_flow_to_m3s(1500.0, unit), rel=1e-15)
+
+    @pytest.mark.parametrize("unit", ["m", "mm"])
+    def test_length(self, unit):
+        config = Config()
+        config.set_length_unit(unit)
+        assert config.convert_length_to_m(80.0) == pytest.approx(convert_length_to_m(80.0, unit), rel=1e-15)
+
+    @pytest.mark.parametrize("unit", ["bar", "mwc", "atm"])
+    def test_pressure(self, unit):
+        config = Config()
+        config.set_pressure_unit(unit)
+        assert config.convert_pressure_from_m(12.5) == pytest.approx(convert_pressure_from_m(12.5, unit), rel=1e-15)
+
+    def test_factor_properties(self):
+        """The exposed factors are the multipliers used by the conversions"""
+        config = Config()
+        config.set_flow_unit("l/s")
+        config.set_length_unit("mm")
+        assert 2.5 * config.flow_to_m3s_factor == config.convert_flow_to_m3s(2.5)
+        assert 80.0 * config.length_to_m_factor == config.convert_length_to_m(80.0)
+
+    def test_invalid_unit_keeps_previous_factor(self):
+        """A rejected unit leaves the configured unit and its factor unchanged"""
+        config = Config()
+        with pytest.raises(ValueError):
+            config.set_flow_unit("gpm")
+        assert config.flow_unit == "l/h"
+        assert config.convert_flow_to_m3s(3600000.0) == pytest.approx(1.0)
+
+    def test_unknown_attribute_rejected(self):
+        """Config has a fixed attribute set (__slots__)"""
+        config = Config()
+        with pytest.raises(AttributeError):
+            config.temperature_unit = "C"
+
+    def test_units_read_only(self):
+        """Units change only through the setters, which keep the factors in step"""
+        config = Config()
+        with pytest.raises(AttributeError):
+            config.flow_unit = "l/s"
+        assert config.flow_unit == "l/h"
+        assert config.convert_flow_to_m3s(3600000.0) == pytest.approx(1.0)
+
+
+class TestConversionUtilities:
+    """Test the table-driven conversion functions"""
+
+    def test_values(self):
+        assert convert_flow_to_m3s(3600.0, "l/h") == pytest.approx(1e-3, rel=1e-15)
+        assert convert_flow_to_m3s(2.0, "l/s") == pytest.approx(2e-3, rel=1e-15)
+        assert convert_length_to_m(250.0, "mm") == pytest.approx(0.25, rel=1e-15)
+        assert convert_pressure_from_m(10.0, "bar") == pytest.approx(0.980665, rel=1e-15)
+
+    @pytest.mark.parametrize("convert, unit", [
+        (convert_flow_to_m3s, "gpm"),
+        (convert_length_to_m, "ft"),
+        (convert_pressure_from_m, "psi"),
+    ])
+    def test_unknown_unit(self, convert, unit):
+        with pytest.raises(ValueError, match=unit):
+            convert(1.0, unit)
@@ -0,0 +1,110 @@
+"""Tests for the core hydraulic equations"""
+
+import math
+
+import pytest
+from hydraulics.core.equations import (
+    solve_colebrook_white,
+    solve_colebrook_serghides,
+    solve_colebrook_biberg,
+    friction_factor_lookup,
+    check_flow_regime,
+    flow_regime_code,
+    regime_name
+)
+
+
+def _reference_colebrook_white(reynolds, diameter, roughness, max_iterations=100, tolerance=1e-6):
+    """Straightforward Newton-Raphson Colebrook-White solver, used as the reference"""
+    relative_roughness = roughness / diameter
+    f_guess = 0.25 / (math.log10(relative_roughness / 3.7 + 5.74 / (reynolds ** 0.9)) ** 2)
+
+    for _ in range(max_iterations):
+        sqrt_f = math.sqrt(f_guess)
+        term_a = relative_roughness / 3.7
+        term_b = 2.51 / (reynolds * sqrt_f)
+        F = 1/sqrt_f + 2 * math.log10(term_a + term_b)
+        dF = -0.5 * (f_guess ** (-1.5)) - (2.51 / (reynolds * f_guess * sqrt_f * math.log(10) * (term_a + term_b)))
+        f_new = f_guess - F / dF
+        if abs(f_new - f_guess) < tolerance:
+            return f_new
+        f_guess = f_new
+
+    return f_guess
+
+
+class TestColebrookWhite:
+    """Test the optimized Newton-Raphson kernel against the reference solver"""
+
+    @pytest.mark.parametrize("reynolds", [2000, 2500, 3999, 4000, 1e4, 1e5, 1e6, 1e7])
+    @pytest.mark.parametrize("roughness", [0.0, 7e-6, 1.5e-4, 1e-3])
+    def test_matches_reference(self, reynolds, roughness):
+        """Hoisted constants and fastmath must not change the solution"""
+        diameter = 0.0204
+        expected = _reference_colebrook_white(reynolds, diameter, roughness)
+        assert solve_colebrook_white(reynolds, diameter, roughness) == pytest.approx(expected, rel=1e-9)
+
+
+class TestColebrookSerghides:
+    """Test the explicit Serghides solution against the iterative solver"""
+
+    @pytest.mark.parametrize("reynolds", [4000, 1e4, 1e5, 1e6, 1e8])
+    @pytest.mark.parametrize("relative_roughness", [0.0, 1e-6, 3.4e-4, 1e-2, 5e-2])
+    def test_matches_newton_raphson(self, reynolds, relative_roughness):
+        """Serghides should match Newton-Raphson across the turbulent range"""
+        diameter = 0.0204
+        roughness = relative_roughness * diameter
+
+        f_newton = solve_colebrook_white(reynolds, diameter, roughness, tolerance=1e-12)
+        f_serghides = solve_colebrook_serghides(reynolds, diameter, roughness)
+
+        assert f_serghides == pytest.approx(f_newton, rel=1e-4)
+
+
+class TestColebrookBiberg:
+    """Test the explicit Lambert W (Biberg + Fritsch) solution used for turbulent flow"""
+
+    @pytest.mark.parametrize("reynolds", [4000, 1e4, 1e5, 1e6, 1e8])
+    @pytest.mark.parametrize("relative_roughness", [0.0, 1e-6, 3.4e-4, 1e-2, 5e-2])
+    def test_matches_newton_raphson(self, reynolds, relative_roughness):
+        """Biberg should match a tightly converged Newton-Raphson solution"""
+        diameter = 0.0204
+        roughness = relative_roughness * diameter
+
+        f_newton = solve_colebrook_white(reynolds, diameter, roughness, tolerance=1e-15)
+        f_biberg = solve_colebrook_biberg(reynolds, diameter, roughness)
+
+        assert f_biberg == pytest.approx(f_newton, rel=1e-10)
+
+
+class TestFrictionFactorLookup:
+    """Test the precomputed friction factor table"""
+
+    @pytest.mark.parametrize("reynolds", [2500, 4000, 1.234e4, 8.7e4, 5e5])
+    @pytest.mark.parametrize("relative_roughness", [1e-6, 3.4e-4, 2.7e-3, 1e-2])
+    def test_matches_serghides(self, reynolds, relative_roughness):
+        """Interpolated values should be within 0.1% of the explicit solution"""
+        f_exact = solve_colebrook_serghides(reynolds, 1.0, relative_roughness)
+        assert friction_factor_lookup(reynolds, relative_roughness) == pytest.approx(f_exact, rel=1e-3)
+
+    def test_clamps_outside_grid(self):
+        """Smooth pipes and out-of-range Reynolds numbers use the table edges"""
+        assert friction_factor_lookup(1e5, 0.0) == pytest.approx(friction_factor_lookup(1e5, 1e-6))
+        assert friction_factor_lookup(1e9, 1e-4) == pytest.approx(friction_factor_lookup(1e7, 1e-4))
+
+
+class TestFlowRegime:
+    """Test flow regime classification"""
+
+    @pytest.mark.parametrize("reynolds, name, is_valid", [
+        (500, "Laminar", False),
+        (1999.9, "Laminar", False),
+        (2000, "Transitional", False),
+        (3999.9, "Transitional", False),
+        (4000, "Turbulent", True),
+        (1e6, "Turbulent", True),
+    ])
+    def test_codes_and_names(self, reynolds, name, is_valid):
+        """Regime codes map to the same names as check_flow_regime"""
+        assert regime_name(flow_regime_code(reynolds)) == name
+        assert check_flow_regime(reynolds) == (name, is_valid)
@@ -0,0 +1,42 @@
+"""Tests for the package namespaces"""
+
+import subprocess
+import sys
+
+import pytest
+
+import hydraulics
+import hydraulics.core
+import hydraulics.ui
+
+
+def _loaded_modules(statement):
+    """Run an import statement in a fresh interpreter and list the loaded modules"""
+    code = f"import sys; {statement}; print(' '.join(sys.modules))"
+    output = subprocess.run([sys.executable, "-c", code],
+                            capture_output=True, text=True, check=True).stdout
+    return set(output.split())
+
+
+class TestLazyExports:
+    """Test the PEP 562 re-exports of the package __init__ modules"""
+
+    def test_config_import_skips_kernels(self):
+        """Importing the unit configuration does not load the calculation chain"""
+        modules = _loaded_modules("from hydraulics.io.config import config")
+
+        assert "hydraulics.io.config" in modules
+        assert "hydraulics.core.equations" not in modules
+        assert "hydraulics.ui.wizards" not in modules
+
+    @pytest.mark.parametrize("package", [hydraulics, hydraulics.core, hydraulics.ui])
+    def test_all_names_resolve(self, package):
+        """Every name in __all__ is importable and listed by dir()"""
+        for name in package.__all__:
+            assert getattr(package, name) is not None
+            assert name in dir(package)
+
+    def test_unknown_name_raises(self):
+        """Unknown attributes still raise AttributeError"""
+        with pytest.raises(AttributeError):
+            hydraulics.ui.run_wizard
@@ -1,5 +1,6 @@
 """Performance benchmark tests for IAPWS caching"""
 
+import gc
 import time
 import pytest
 from hydraulics.core.water_api import WaterAPIClient
@@ -32,12 +33,18 @@ class TestIAPWSPerformance:
         _ = WaterAPIClient.fetch_properties(20.0)
 
         # Subsequent calls (cache hits) - should be very fast
+        # Keep the collector out of the timed loop (as timeit does): a full
+        # collection landing here would dominate the max time
         times = []
-        for _ in range(100):
-            start = time.perf_counter()
-            _ = WaterAPIClient.fetch_properties(20.0)
-            end = time.perf_counter()
-            times.append((end - start) * 1000)  # Convert to ms
+        gc.disable()
+        try:
+            for _ in range(100):
+                start = time.perf_counter()
+                _ = WaterAPIClient.fetch_properties(20.0)
+                end = time.perf_counter()
+                times.append((end - start) * 1000)  # Convert to ms
+        finally:
+            gc.enable()
 
         # Average time should be < 1ms for cached values
         avg_time_ms = sum(times) / len(times)
@@ -124,8 +131,8 @@ class TestIAPWSPerformance:
         assert cache_info.misses == 0, "Misses should be 0 after clear"
 
 
-    def test_speedup_factor(self):
-        """Test actual speedup from caching"""
+    def test_uncached_call_performance(self):
+        """Test that uncached retrievals are sub-millisecond (table lookup, no IAPWS95 evaluation)"""
         # Clear cache
         WaterAPIClient.clear_cache()
 
@@ -134,12 +141,29 @@ class TestIAPWSPerformance:
         _ = WaterAPIClient.fetch_properties(20.0)
         uncached_time = time.perf_counter() - start
 
-        # Measure cached time (take average of 10 calls)
-        cached_times = []
-        for _ in range(10):
+        print(f"\n   Uncached time: {uncached_time*1000:.6f} ms")
+
+        # The cold call is a table interpolation, not an IAPWS95 evaluation
+        assert uncached_time < 1e-3, f"Uncached time should be <1ms, got {uncached_time*1000:.3f}ms"
+
+    def test_iapws95_speedup_factor(self):
+        """Test actual speedup from caching the opt-in IAPWS95 evaluation"""
+        WaterAPIClient.clear_cache()
+        WaterAPIClient.USE_IAPWS95 = True
+        try:
+            # Measure uncached time
             start = time.perf_counter()
             _ = WaterAPIClient.fetch_properties(20.0)
-            cached_times.append(time.perf_counter() - start)
+            uncached_time = time.perf_counter() - start
+
+            # Measure cached time (take average of 10 calls)
+            cached_times = []
+            for _ in range(10):
+                start = time.perf_counter()
+                _ = WaterAPIClient.fetch_properties(20.0)
+                cached_times.append(time.perf_counter() - start)
+        finally:
+            WaterAPIClient.USE_IAPWS95 = False
 
         cached_time = sum(cached_times) / len(cached_times)
 
@@ -153,6 +177,5 @@ class TestIAPWSPerformance:
         # Should have significant speedup (at least 100x)
         assert speedup >= 100, f"Speedup should be at least 100x, got {speedup:.0f}x"
 
-
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
@@ -1,11 +1,17 @@
 """Tests for PN grade support in HDPE pipes"""
 
+import numpy as np
 import pytest
 from hydraulics.core.pipes import (
     get_pipe_internal_diameter,
     list_available_pn_grades,
     get_default_pn_grade,
-    HDPE_PIPES
+    get_adjacent_pipe_sizes,
+    display_pipe_table,
+    HDPE_PIPES,
+    _PIPE_DATA_ARRAY,
+    _PN_GRADES,
+    _SORTED_DESIGNATIONS
 )
 from hydraulics.models.artery import DrippingArtery
 from hydraulics.models.zones import TransportZone, IrrigationZone
@@ -70,6 +76,26 @@ class TestPNGradeDatabase:
                 assert internal_d < 200, f"{dn}-{pn_grade} ID suspiciously large"
 
 
+    def test_pipe_array_matches_database(self):
+        """The pipe table array must mirror HDPE_PIPES (NaN where a grade is missing)"""
+        assert _PIPE_DATA_ARRAY["name"].tolist() == list(_SORTED_DESIGNATIONS)
+        for i, dn in enumerate(_SORTED_DESIGNATIONS):
+            assert _PIPE_DATA_ARRAY["nominal"][i] == HDPE_PIPES[dn]["nominal"]
+            for pn in _PN_GRADES:
+                grades = HDPE_PIPES[dn]["pn_grades"]
+                if pn in grades:
+                    assert _PIPE_DATA_ARRAY[pn.lower()][i] == grades[pn]["internal_diameter"]
+                else:
+                    assert np.isnan(_PIPE_DATA_ARRAY[pn.lower()][i])
+
+    def test_database_is_read_only(self):
+        """HDPE_PIPES cannot be modified at any nesting level"""
+        with pytest.raises(TypeError):
+            HDPE_PIPES["N20"] = {}
+        with pytest.raises(TypeError):
+            HDPE_PIPES["N20"]["pn_grades"]["PN10"]["internal_diameter"] = 1.0
+
+
 class TestPNGradeFunctions:
     """Test PN grade utility functions"""
 
@@ -91,6 +117,12 @@ class TestPNGradeFunctions:
         assert "PN10" in grades_n16
         assert "PN16" in grades_n16
 
+    def test_list_available_pn_grades_is_immutable(self):
+        """The cached result is a sorted tuple shared between calls"""
+        grades = list_available_pn_grades("N20")
+        assert grades == ("PN10", "PN16", "PN6")
+        assert list_available_pn_grades("N20") is grades
+
     def test_list_available_pn_grades_invalid_dn(self):
         """Should raise ValueError for invalid DN"""
         with pytest.raises(ValueError, match="Unknown pipe designation"):
@@ -126,6 +158,28 @@ class TestPNGradeFunctions:
             get_pipe_internal_diameter("N16", "PN6")
 
 
+    def test_get_adjacent_pipe_sizes_at_boundaries(self):
+        """Adjacent sizes are truncated at the smallest and largest DN"""
+        assert get_adjacent_pipe_sizes("N25") == {
+            'smaller': ["N16", "N20"], 'selected': "N25", 'larger': ["N32"]
+        }
+        assert get_adjacent_pipe_sizes("N16")['smaller'] == []
+        assert get_adjacent_pipe_sizes("N160")['larger'] == []
+
+    def test_display_pipe_table(self, capsys):
+        """The table lists every pipe, with N/A where a grade is not made"""
+        display_pipe_table()
+        out = capsys.readouterr().out
+        assert out.startswith("\n=== HDPE PIPE SPECIFICATIONS (ALL PN GRADES) ===\n")
+        assert out.endswith("\n\n")
+        assert "N16          16         N/A          16.0         14.4" in out
+
+        display_pipe_table("PN6")
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[4].split() == ["N16", "16", "N/A"]
+        assert lines[5].split() == ["N20", "20", "21.0"]
+
+
 class TestDrippingArteryPNGrade:
     """Test DrippingArtery with PN grade support"""
 
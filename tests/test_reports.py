@@ -0,0 +1,115 @@
+"""Tests for the markdown report generator"""
+
+import io
+import os
+import re
+import shutil
+
+from hydraulics.io.reports import (
+    generate_ascii_diagram, generate_pump_pressure_table, generate_report, pump_pressure_rows,
+)
+from hydraulics.models.artery import DrippingArtery
+from hydraulics.models.zones import TransportZone, IrrigationZone
+from tests._report_check import missing_markers
+
+
+def _artery(num_drippers=4):
+    """Transport zone followed by one irrigation zone"""
+    artery = DrippingArtery(total_flow=1500, pipe_designation="N20")
+    artery.add_zone(TransportZone(length=10))
+    artery.add_zone(IrrigationZone(length=80, num_drippers=num_drippers, target_flow=1500))
+    return artery
+
+
+class TestAsciiDiagram:
+    """Test the installation diagram"""
+
+    def test_diagram_lines(self):
+        """Labels, dripper markers and the main line are aligned per zone"""
+        lines = generate_ascii_diagram(_artery()).split("\n")
+
+        assert lines[4] == "             T1         I2(4d)     "
+        assert lines[5] == "                     |  |  |  |    "
+        assert lines[6] == "PUMP <- ------------+--+--+--+----"
+        assert lines[7] == "                     d  d  d  d    "
+
+    def test_many_drippers(self):
+        """Wide zones use one 3-character segment per dripper"""
+        lines = generate_ascii_diagram(_artery(num_drippers=500)).split("\n")
+
+        assert lines[6] == "PUMP <- ------------" + "+--" * 500 + "--"
+        assert lines[7].count("d") == 500
+
+    def test_sink_receives_same_text(self):
+        """Writing to a sink produces the returned diagram plus a newline"""
+        artery = _artery()
+        sink = io.StringIO()
+
+        assert generate_ascii_diagram(artery, sink=sink) is None
+        assert sink.getvalue() == generate_ascii_diagram(artery) + "\n"
+
+
+class TestGenerateReport:
+    """Test the full markdown report"""
+
+    def test_filename_matches_generated_line(self, tmp_path, monkeypatch):
+        """The filename timestamp and the Generated header come from one clock read"""
+        monkeypatch.chdir(tmp_path)
+        artery = _artery()
+
+        filepath = generate_report(artery.calculate(), artery)
+
+        with open(filepath, encoding='utf-8') as f:
+            text = f.read()
+        generated = re.search(r"\*\*Generated:\*\* (\S+) (\S+)", text)
+        expected = generated.group(1).replace("-", "") + "_" + generated.group(2).replace(":", "")
+        assert os.path.basename(filepath) == f"dripping_artery_report_{expected}.md"
+        assert text.endswith("*Report generated by Hydraulic Piping Calculation Tool*")
+
+    def test_reports_dir_follows_working_directory(self, tmp_path, monkeypatch):
+        """The reports directory is created under the current working directory"""
+        artery = _artery()
+        results = artery.calculate()
+
+        for name in ("first", "second"):
+            (tmp_path / name).mkdir()
+            monkeypatch.chdir(tmp_path / name)
+            filepath = generate_report(results, artery)
+            assert os.path.isfile(filepath)
+            assert (tmp_path / name / "reports").is_dir()
+
+    def test_reports_dir_recreated_after_removal(self, tmp_path, monkeypatch):
+        """Deleting reports/ during a session does not break later reports"""
+        monkeypatch.chdir(tmp_path)
+        artery = _artery()
+        results = artery.calculate()
+
+        shutil.rmtree(os.path.dirname(generate_report(results, artery)))
+        assert os.path.isfile(generate_report(results, artery))
+
+
+class TestReportCheck:
+    """Test the streaming report marker scan used by the report scripts"""
+
+    def test_missing_markers(self, tmp_path):
+        report = tmp_path / "report.md"
+        report.write_text("# Title\n| Min Pump Pressure | Max Pump Pressure |\nend\n", encoding='utf-8')
+
+        assert missing_markers(report, {"Min Pump Pressure", "Max Pump Pressure"}) == set()
+        assert missing_markers(report, ["# Title", "Required Pump Pressure"]) == {"Required Pump Pressure"}
+        # Nested markers on one line are both found
+        assert missing_markers(report, {"Pump Pressure", "Max Pump Pressure"}) == set()
+        assert missing_markers(report, ()) == set()
+
+
+class TestPumpPressureTable:
+    """Test the pump pressure rows shared by the table and its callers"""
+
+    def test_precalculated_rows(self):
+        """Passing precalculated rows gives the same table"""
+        dn_comparison = _artery().calculate_with_dn_comparison()['dn_comparison']
+        rows = pump_pressure_rows(dn_comparison)
+
+        assert [row.pipe_designation for row in rows] == [d['pipe_designation'] for d in dn_comparison]
+        assert all(row.max_pump_pressure > row.min_pump_pressure for row in rows)
+        assert generate_pump_pressure_table(dn_comparison, pump_rows=rows) == generate_pump_pressure_table(dn_comparison)
@@ -0,0 +1,193 @@
+"""Tests for the segment calculation engine"""
+
+import numpy as np
+import pytest
+from hydraulics.calculators.segment import (
+    SegmentResult,
+    SegmentResults,
+    calculate_section_loss,
+    calculate_section_loss_batch,
+    calculate_section_loss_array,
+    calculate_irrigation_zone,
+    calculate_christiansen_head_loss,
+    clear_cache,
+    get_cache_info
+)
+from hydraulics.core.equations import regime_name
+from hydraulics.core.properties import WaterProperties
+
+
+class TestSectionLossBatch:
+    """Test the batch section loss API against the scalar calculator"""
+
+    def test_batch_matches_scalar(self):
+        """Batch results should match calculate_section_loss for every segment"""
+        # Laminar, transitional and turbulent flows in several pipe sizes
+        flows = np.array([1e-6, 5e-5, 1e-4, 4.17e-4, 2e-3])
+        diameters = np.array([0.0204, 0.0204, 0.0262, 0.0204, 0.0408])
+        lengths = np.array([10.0, 6.67, 1.28, 50.0, 100.0])
+
+        batch = calculate_section_loss_batch(flows, diameters, lengths)
+
+        for i in range(len(flows)):
+            scalar = calculate_section_loss(flows[i], diameters[i], lengths[i])
+            assert batch["velocity"][i] == pytest.approx(scalar["velocity"], rel=1e-12)
+            assert batch["reynolds"][i] == pytest.approx(scalar["reynolds"], rel=1e-12)
+            assert batch["friction_factor"][i] == pytest.approx(scalar["friction_factor"], rel=1e-9)
+            assert batch["head_loss"][i] == pytest.approx(scalar["head_loss"], rel=1e-9)
+            assert regime_name(batch["regime_code"][i]) == scalar["flow_regime"]
+            assert batch["is_valid"][i] == scalar["is_valid"]
+
+    def test_batch_broadcasts_inputs(self):
+        """A single diameter or length applies to every section"""
+        flows = np.array([1e-4, 4.17e-4, 2e-3])
+        broadcast = calculate_section_loss_batch(flows, [0.0204], 10.0)
+        explicit = calculate_section_loss_batch(flows, np.full(3, 0.0204), np.full(3, 10.0))
+        np.testing.assert_array_equal(broadcast["head_loss"], explicit["head_loss"])
+        np.testing.assert_array_equal(broadcast["is_valid"], explicit["is_valid"])
+
+    def test_batch_rejects_mismatched_shapes(self):
+        """Inputs that do not broadcast to one 1-D shape are rejected"""
+        with pytest.raises(ValueError):
+            calculate_section_loss_batch([1e-4, 2e-4, 3e-4], [0.0204, 0.0262], [10.0, 10.0, 10.0])
+        with pytest.raises(ValueError):
+            calculate_section_loss_batch([[1e-4, 2e-4]], [0.0204, 0.0262], [10.0, 10.0])
+
+    def test_batch_empty(self):
+        """An empty batch should return empty arrays"""
+        batch = calculate_section_loss_batch([], [], [])
+        assert batch["head_loss"].shape == (0,)
+
+
+class TestSegmentResults:
+    """Test the irrigation zone segment arrays and their lazy per-segment view"""
+
+    def test_segments_match_scalar(self):
+        """Each materialized segment matches calculate_section_loss"""
+        flows = 4.17e-4 - np.arange(40) * 1.04e-5
+        segments = SegmentResults(flows, calculate_section_loss_array(flows, 0.0204, 2.0))
+
+        assert len(segments) == 40
+        for j, seg in enumerate(segments):
+            scalar = calculate_section_loss(flows[j], 0.0204, 2.0)
+            assert seg['segment'] == j + 1
+            assert seg['head_loss'] == pytest.approx(scalar.head_loss, rel=1e-9)
+            assert seg['flow_regime'] == scalar.flow_regime
+            assert seg['friction_method'] == scalar.friction_method
+            assert seg['is_valid'] == scalar.is_valid
+
+    def test_indexing(self):
+        """Negative indices and slices behave like a list"""
+        flows = np.array([3e-4, 2e-4, 1e-4])
+        segments = SegmentResults(flows, calculate_section_loss_array(flows, 0.0204, 1.0))
+
+        assert segments[-1] == segments[2]
+        assert [seg['segment'] for seg in segments[1:]] == [2, 3]
+        with pytest.raises(IndexError):
+            segments[3]
+
+    def test_segment_fields(self):
+        """Segments are SegmentResult tuples readable by attribute or key"""
+        flows = np.array([3e-4, 2e-4])
+        seg = SegmentResults(flows, calculate_section_loss_array(flows, 0.0204, 1.0))[1]
+
+        assert isinstance(seg, SegmentResult)
+        assert seg.segment == seg['segment'] == 2
+        assert seg.head_loss == seg['head_loss']
+        with pytest.raises(KeyError):
+            seg['spacing']
+
+    def test_arrays(self):
+        """The structure-of-arrays view shares the backing arrays"""
+        flows = np.array([3e-4, 2e-4, 1e-4])
+        arrays = calculate_section_loss_array(flows, 0.0204, 1.0)
+        soa = SegmentResults(flows, arrays).arrays
+
+        assert soa["flow_m3s"] is flows
+        assert soa["head_loss"] is arrays["head_loss"]
+
+
+    def test_irrigation_zone_kernel(self):
+        """The fused zone kernel matches the array API and sums the zone loss"""
+        segments, zone_head_loss, is_valid = calculate_irrigation_zone(4.17e-4, 1.04e-5, 40, 0.0204, 2.0)
+        flows = 4.17e-4 - np.arange(40) * 1.04e-5
+        arrays = calculate_section_loss_array(flows, 0.0204, 2.0)
+
+        assert [seg['flow_m3s'] for seg in segments] == pytest.approx(flows, rel=1e-15)
+        assert [seg['head_loss'] for seg in segments] == pytest.approx(arrays["head_loss"], rel=1e-12)
+        assert zone_head_loss == pytest.approx(arrays["head_loss"].sum(), rel=1e-12)
+        assert is_valid == bool(arrays["is_valid"].all())
+
+    @pytest.mark.parametrize("flow_per_dripper, expected", [(1e-6, True), (4.17e-5, False)])
+    def test_irrigation_zone_validity(self, flow_per_dripper, expected):
+        """A zone is valid only if its slowest (last) segment is turbulent"""
+        segments, _, is_valid = calculate_irrigation_zone(4.17e-3, flow_per_dripper, 100, 0.0204, 1.0)
+
+        assert is_valid is expected
+        assert is_valid == all(seg['is_valid'] for seg in segments)
+
+
+class TestSectionLossResult:
+    """Test the section loss result record"""
+
+    def test_attribute_and_key_access(self):
+        """Fields are readable as attributes, by name and by index"""
+        result = calculate_section_loss(4.17e-4, 0.0204, 50.0)
+        assert result["head_loss"] == result.head_loss == result[-1]
+        assert result._asdict()["reynolds"] == result.reynolds
+
+    def test_unknown_key_raises(self):
+        """Unknown field names raise KeyError like the former dict result"""
+        result = calculate_section_loss(4.17e-4, 0.0204, 50.0)
+        with pytest.raises(KeyError):
+            result["pressure"]
+
+
+class TestSectionLossCache:
+    """Test memoization of calculate_section_loss"""
+
+    def setup_method(self):
+        clear_cache()
+
+    def teardown_method(self):
+        WaterProperties.reset_to_defaults()
+
+    def test_repeated_call_hits_cache(self):
+        """Identical (and near-identical) inputs are served from the cache"""
+        first = calculate_section_loss(4.17e-4, 0.0204, 50.0)
+        second = calculate_section_loss(4.17e-4 * (1 + 1e-14), 0.0204, 50.0)
+
+        info = get_cache_info()
+        assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+        assert second is first
+
+    def test_water_properties_change_misses_cache(self):
+        """A different kinematic viscosity must not reuse cached results"""
+        cold = calculate_section_loss(4.17e-4, 0.0204, 50.0)
+        WaterProperties.kinematic_viscosity = 1.5e-6
+        warm = calculate_section_loss(4.17e-4, 0.0204, 50.0)
+
+        assert get_cache_info().misses == 2
+        assert warm.reynolds < cold.reynolds
+
+
+class TestChristiansenResult:
+    """Test the Christiansen approximation result record"""
+
+    def test_fields_match_section_loss(self):
+        """Flow fields are taken from the full-flow section loss"""
+        section = calculate_section_loss(4.17e-4, 0.0204, 50.0)
+        result = calculate_christiansen_head_loss(4.17e-4, 0.0204, 50.0, num_outlets=25)
+
+        assert result.reynolds == section.reynolds
+        assert result["friction_method"] == section.friction_method
+        assert result.head_loss == pytest.approx(section.head_loss * result.christiansen_coefficient)
+
+    def test_reuses_full_flow_result(self):
+        """A precomputed full-flow section gives the same result"""
+        section = calculate_section_loss(4.17e-4, 0.0204, 50.0)
+        direct = calculate_christiansen_head_loss(4.17e-4, 0.0204, 50.0, num_outlets=25)
+        reused = calculate_christiansen_head_loss(4.17e-4, 0.0204, 50.0, num_outlets=25,
+                                                  full_flow_result=section)
+
+        assert reused == direct
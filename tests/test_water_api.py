@@ -1,6 +1,8 @@
 """Tests for water API integration"""
 
+import numpy as np
 import pytest
+from hydraulics.core import water_api
 from hydraulics.core.water_api import WaterAPIClient
 from hydraulics.core.properties import WaterProperties
 
@@ -61,6 +63,94 @@ class TestWaterAPIClient:
         assert props["kinematic_viscosity"] == 1.004e-6
         assert props["source"] == "default"
 
+    def test_fetch_properties_fast_matches_dict(self):
+        """The tuple fast path carries the same values as the dict API"""
+        props = WaterAPIClient.fetch_properties(25.0)
+        assert WaterAPIClient.fetch_properties_fast(25.0) == (
+            props["temperature"], props["density"], props["dynamic_viscosity"],
+            props["kinematic_viscosity"], props["source"]
+        )
+
+        with pytest.raises(ValueError, match="Temperature must be between 0 and 100"):
+            WaterAPIClient.fetch_properties_fast(float("nan"))
+
+    def test_cache_quantizes_temperature(self):
+        """Temperatures within 0.005°C share one cache entry"""
+        WaterAPIClient.clear_cache()
+        first = WaterAPIClient.fetch_properties_fast(20.0)
+        second = WaterAPIClient.fetch_properties_fast(20.001)
+
+        info = WaterAPIClient.get_cache_info()
+        assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+        assert second is first
+
+    def test_missing_iapws_falls_back_to_defaults(self, monkeypatch):
+        """Without the iapws package, the IAPWS95 path warns and uses defaults"""
+        monkeypatch.setattr(water_api, "_IAPWS95", None)
+        monkeypatch.setattr(water_api, "_IAPWS_IMPORT_TRIED", True)
+        monkeypatch.setattr(WaterAPIClient, "USE_IAPWS95", True)
+        WaterAPIClient.clear_cache()
+
+        with pytest.warns(UserWarning, match="IAPWS library not installed"):
+            props = WaterAPIClient.fetch_properties(30.0)
+        assert props == WaterAPIClient._get_default_properties()
+
+    def test_prewarm_cache_matches_uncached(self):
+        """Prewarmed entries match computed ones; out-of-range temperatures are skipped"""
+        WaterAPIClient.clear_cache()
+        assert WaterAPIClient.prewarm_cache(-10, 110, 10) == 11
+        prewarmed = WaterAPIClient.fetch_properties_fast(30.0)
+        assert WaterAPIClient.get_cache_info().hits == 1
+
+        WaterAPIClient.clear_cache()
+        computed = WaterAPIClient.fetch_properties_fast(30.0)
+        assert prewarmed[:2] == computed[:2]
+        assert prewarmed[2:4] == pytest.approx(computed[2:4], rel=1e-12)
+        assert prewarmed[4] == computed[4]
+
+    def test_fetch_properties_batch_matches_scalar(self):
+        """Batch properties should match the scalar path and IAPWS-95 to 0.01%"""
+        temperatures = np.array([0.0, 4.3, 20.0, 37.5, 98.9, 100.0])
+        density, dynamic_viscosity, kinematic_viscosity = (
+            WaterAPIClient.fetch_properties_batch(temperatures)
+        )
+
+        for i, temp in enumerate(temperatures):
+            props = WaterAPIClient.fetch_properties(temp)
+            assert density[i] == pytest.approx(props["density"], rel=1e-12)
+            assert dynamic_viscosity[i] == pytest.approx(props["dynamic_viscosity"], rel=1e-12)
+            assert kinematic_viscosity[i] == pytest.approx(props["kinematic_viscosity"], rel=1e-12)
+
+            iapws_density, iapws_viscosity = WaterAPIClient._compute_iapws95(temp)
+            assert density[i] == pytest.approx(iapws_density, rel=1e-4)
+            assert dynamic_viscosity[i] == pytest.approx(iapws_viscosity, rel=1e-4)
+
+    @pytest.mark.parametrize("temp, pressure_mpa", [
+        (0.0, 0.101325), (20.0, 0.101325), (20.0, 1.0), (60.0, 10.0), (99.5, 0.2), (100.0, 50.0)
+    ])
+    def test_fetch_properties_at_pressure_matches_iapws95(self, temp, pressure_mpa):
+        """The compiled IF97 kernel should agree with IAPWS-95 to 0.01%"""
+        from iapws import IAPWS95
+
+        density, dynamic_viscosity, kinematic_viscosity = (
+            WaterAPIClient.fetch_properties_at_pressure(temp, pressure_mpa)
+        )
+        water = IAPWS95(T=temp + 273.15, P=pressure_mpa)
+
+        assert density == pytest.approx(water.rho, rel=1e-4)
+        assert dynamic_viscosity == pytest.approx(water.mu, rel=1e-4)
+        assert kinematic_viscosity == pytest.approx(dynamic_viscosity / density)
+
+    def test_fetch_properties_at_pressure_rejects_vapour(self):
+        """Below the saturation pressure (1.014 bar at 100°C) water is not liquid"""
+        with pytest.raises(ValueError, match="saturation pressure"):
+            WaterAPIClient.fetch_properties_at_pressure(100.0, 0.101325)
+
+    def test_fetch_properties_batch_invalid_temperature(self):
+        """Any out-of-range temperature in the batch raises ValueError"""
+        with pytest.raises(ValueError, match="Temperature must be between 0 and 100"):
+            WaterAPIClient.fetch_properties_batch([10.0, 120.0])
+
 
 class TestWaterProperties:
     """Test WaterProperties class"""
@@ -75,6 +165,30 @@ class TestWaterProperties:
         assert WaterProperties.kinematic_viscosity == 1.004e-6
         assert WaterProperties.source == "default"
 
+    def test_set_same_temperature_is_skipped(self):
+        """Re-setting the current temperature keeps the properties unless forced"""
+        WaterProperties.set_temperature(25.0)
+        try:
+            WaterProperties.density = 1000.0
+            WaterProperties.set_temperature(25.0)
+            assert WaterProperties.density == 1000.0
+
+            WaterProperties.set_temperature(25.0, force=True)
+            assert WaterProperties.density == WaterAPIClient.fetch_properties(25.0)["density"]
+        finally:
+            WaterProperties.reset_to_defaults()
+
+    def test_snapshot(self):
+        """The snapshot tuple mirrors the current class attributes"""
+        WaterProperties.set_temperature(35.0)
+        try:
+            assert WaterProperties.snapshot() == (
+                WaterProperties.g, WaterProperties.density, WaterProperties.dynamic_viscosity,
+                WaterProperties.kinematic_viscosity, WaterProperties.hdpe_roughness
+            )
+        finally:
+            WaterProperties.reset_to_defaults()
+
     def test_set_temperature(self):
         """Test setting temperature updates properties"""
         WaterProperties.set_temperature(15.0)
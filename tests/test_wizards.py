@@ -0,0 +1,134 @@
+"""Tests for the interactive wizard input helpers"""
+
+import io
+import sys
+
+import pytest
+from hydraulics.core.properties import WaterProperties
+from hydraulics.models import DrippingArtery, IrrigationZone
+from hydraulics.ui.wizards import (
+    add_zone_interactive,
+    get_float_input,
+    get_int_input,
+    run_dripping_artery_wizard
+)
+
+
+def _stdin(monkeypatch, text):
+    """Feed the wizard scripted input lines"""
+    monkeypatch.setattr(sys, "stdin", io.StringIO(text))
+
+
+class TestScriptedInput:
+    """Test the wizard prompts with piped (non-TTY) input"""
+
+    def test_retries_until_valid(self, monkeypatch, capsys):
+        """Invalid and out-of-range entries are rejected before a valid one"""
+        _stdin(monkeypatch, "abc\n-1\n0\n2.5\n")
+        assert get_float_input("Flow: ", min_value=0, allow_zero=False) == 2.5
+
+        out = capsys.readouterr().out
+        assert out.count("Flow: ") == 4
+        assert "valid number" in out and "at least 0" in out and "cannot be zero" in out
+
+    @pytest.mark.parametrize("bad", ["nan", "inf", "1,5", "--2", "."])
+    def test_float_rejects_non_decimal(self, monkeypatch, capsys, bad):
+        """Only plain decimal or scientific notation is accepted"""
+        _stdin(monkeypatch, f"{bad}\n 1.5e-1 \n")
+        assert get_float_input("Length: ") == 0.15
+        assert "valid number" in capsys.readouterr().out
+
+    def test_int_signs_and_padding(self, monkeypatch, capsys):
+        """Signed and padded integers are accepted; decimals are not"""
+        _stdin(monkeypatch, "2.0\n+\n -3 \n")
+        assert get_int_input("Zone: ") == -3
+        assert capsys.readouterr().out.count("valid integer") == 2
+
+    def test_int_without_trailing_newline(self, monkeypatch):
+        """The last line of piped input may lack a newline"""
+        _stdin(monkeypatch, "7")
+        assert get_int_input("Drippers: ", min_value=1) == 7
+
+    def test_end_of_input_raises(self, monkeypatch, capsys):
+        """Running out of input cancels like Ctrl+C instead of looping"""
+        _stdin(monkeypatch, "x\n")
+        with pytest.raises(EOFError):
+            get_int_input("Drippers: ")
+        assert "cancelled" in capsys.readouterr().out
+
+
+class _TTYInput(io.StringIO):
+    """Scripted input that reports itself as a terminal"""
+
+    def isatty(self):
+        return True
+
+
+class TestTerminalInput:
+    """Test that a terminal keeps input() and its line editing"""
+
+    def test_tty_uses_input(self, monkeypatch):
+        monkeypatch.setattr(sys, "stdin", _TTYInput(""))
+        prompts = []
+        monkeypatch.setattr("builtins.input", lambda prompt="": prompts.append(prompt) or "12")
+        assert get_int_input("Drippers: ") == 12
+        assert prompts == ["Drippers: "]
+
+    def test_replaced_stdin_checked_per_call(self, monkeypatch):
+        """Switching stdin from a terminal to a pipe is picked up"""
+        monkeypatch.setattr(sys, "stdin", _TTYInput(""))
+        monkeypatch.setattr("builtins.input", lambda prompt="": "1")
+        assert get_int_input("Zone: ") == 1
+        _stdin(monkeypatch, "2\n")
+        assert get_int_input("Zone: ") == 2
+
+
+class TestAddZone:
+    """Test adding zones from the review menu"""
+
+    def test_add_irrigation_zone(self, monkeypatch):
+        _stdin(monkeypatch, "irrigation\n80\n12\n500\n")
+        artery = DrippingArtery(500, "N40")
+        add_zone_interactive(artery)
+
+        zone, = artery.zones
+        assert isinstance(zone, IrrigationZone)
+        assert (zone.length, zone.num_drippers, zone.target_flow) == (80.0, 12, 500.0)
+
+    def test_invalid_type(self, monkeypatch, capsys):
+        _stdin(monkeypatch, "x\n")
+        artery = DrippingArtery(500, "N40")
+        add_zone_interactive(artery)
+
+        assert not artery.zones
+        assert "Invalid zone type" in capsys.readouterr().out
+
+
+class TestScriptedWizard:
+    """Test a whole dripping artery session driven by piped answers"""
+
+    def test_full_session(self, monkeypatch, tmp_path, capsys):
+        """An invalid pipe is re-prompted, then the artery is calculated and reported"""
+        monkeypatch.chdir(tmp_path)
+        _stdin(monkeypatch, "\n".join([
+            "",                       # default water temperature
+            "1500",                   # total flow
+            "X99", "N40",             # invalid, then valid pipe designation
+            "",                       # default PN grade
+            "t", "10",
+            "i", "80", "12", "500",
+            "t", "50",
+            "i", "160", "125", "1000",
+            "d",
+            "c",                      # calculate
+        ]) + "\n")
+        try:
+            run_dripping_artery_wizard()
+        finally:
+            WaterProperties.reset_to_defaults()
+
+        out = capsys.readouterr().out
+        assert out.count("Available pipes:") == 2
+        assert "Invalid pipe designation: X99" in out
+        assert "Irrigation Zone 4:" in out
+        assert len(list((tmp_path / "reports").glob("*.md"))) == 1